@@ -0,0 +1,114 @@
+# api.py
+# Read-only signal explorer API over strategy_signals / strategy_features / signal_evaluation_results.
+# Run from the repo root:
+#   uvicorn Code.api:app --port 8005
+# and point the dashboard at it with SIGNAL_API_URL=http://localhost:8005
+
+import os
+import sys
+import json
+from typing import List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from fastapi import FastAPI, HTTPException, Query
+import pandas as pd
+
+from Code import signal_explorer
+from Code.utils.intradayevaluationqueries import list_eval_tags
+
+app = FastAPI(title="Signal Explorer API")
+
+
+def _page(df: pd.DataFrame, next_cursor: Optional[str]) -> dict:
+    # to_json handles NaN/NaT and numpy scalars; "split" keeps the payload columnar
+    split = json.loads(df.to_json(orient="split", index=False, date_format="iso"))
+    return {
+        "fields": split["columns"],
+        "rows": split["data"],
+        "count": len(df),
+        "next_cursor": next_cursor,
+    }
+
+
+def _csv(value: Optional[str]) -> Optional[List[str]]:
+    if not value:
+        return None
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+@app.get("/api/signals")
+def signals(
+    trade_date: str,
+    fields: Optional[str] = Query(None, description="Comma-separated; see /api/signals/fields"),
+    strategy: Optional[List[str]] = Query(None),
+    signal_type: Optional[str] = None,
+    min_abs_score: Optional[float] = None,
+    symbol_prefix: Optional[str] = None,
+    symbol_contains: Optional[str] = None,
+    eval_tag: Optional[str] = None,
+    label_outcome: Optional[str] = None,
+    sort: str = "signal_score",
+    order: str = "desc",
+    limit: int = Query(100, ge=1, le=signal_explorer.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    try:
+        df, next_cursor = signal_explorer.explore_signals(
+            trade_date,
+            fields=_csv(fields),
+            strategies=strategy,
+            signal_type=signal_type,
+            min_abs_score=min_abs_score,
+            symbol_prefix=symbol_prefix,
+            symbol_contains=symbol_contains,
+            eval_tag=eval_tag,
+            label_outcome=label_outcome,
+            sort=sort,
+            descending=order == "desc",
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _page(df, next_cursor)
+
+
+@app.get("/api/signals/fields")
+def signal_fields():
+    return {
+        "fields": list(signal_explorer.SIGNAL_FIELDS),
+        "default_fields": signal_explorer.DEFAULT_SIGNAL_FIELDS,
+        "sorts": list(signal_explorer.SIGNAL_SORTS),
+    }
+
+
+@app.get("/api/signals/strategies")
+def signal_strategies(trade_date: str):
+    return {"trade_date": trade_date, "strategies": signal_explorer.list_signal_strategies(trade_date)}
+
+
+@app.get("/api/features")
+def features(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    feature: Optional[List[str]] = Query(None),
+    limit: int = Query(signal_explorer.MAX_PAGE_SIZE, ge=1, le=signal_explorer.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    try:
+        df, next_cursor = signal_explorer.explore_features(
+            symbol, start_date, end_date, feature_names=feature, limit=limit, cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _page(df, next_cursor)
+
+
+@app.get("/api/eval-tags")
+def eval_tags():
+    return {"eval_tags": list_eval_tags("intraday")}
@@ -30,28 +30,41 @@ from Code.queries import (
     get_comparisons, get_intraday_for_symbol,
     get_intraday_by_date, get_gainers_losers, get_intraday_market_rows,
     get_intraday_top_value_traded, get_intraday_top_price_movers,
-    get_intraday_summary_kpis, get_signal_summary_by_day_strategy,
+    get_intraday_summary_kpis, get_intraday_snapshot, get_signal_summary_by_day_strategy,
     get_signals_by_date_strategy, get_feature_trends, get_strategy_runs,
     get_latest_prior_trading_date, get_smart_symbols,
     get_signals_for_date, get_strategy_features, get_latest_trade_date_from_bhavcopy,
     get_strategy_signals_for_date, get_signals_with_price_context,
-    get_price_context_for_symbol, get_eval_tags_list, get_signals_with_eval_json,
-    get_eval_tags_diff, get_etf_list, get_etf_price_history, get_etf_by_date
+    get_price_context_for_symbol, get_eval_tags_list, get_signals_with_eval_frame,
+    get_eval_tags_diff, get_etf_list, get_etf_price_history, get_etf_by_date,
+    explore_signals_page, get_signal_strategies
 )
-from Code.components import plot_candles, line_series, simple_bar, bar_with_labels, pie_split
+from Code.components import plot_candles, line_series, multi_line, simple_bar, bar_with_labels, pie_split
+from Code.utils.db import clear_cache, cache_stats
 
 # --- Streamlit setup ---
 pd.options.display.float_format = "{:.2f}".format
 st.set_page_config(layout="wide", page_title="Market Visualizations")
 st.title("Market Visualizations")
 
-tabs = st.tabs([
+# --- Data cache control (results are cached in Code/utils/db.py) ---
+with st.sidebar:
+    if st.button("Refresh data", key="refresh_data_cache", help="Drop cached query results and reload from MySQL"):
+        clear_cache()
+        st.rerun()
+    _stats = cache_stats()
+    st.caption(f"Cache: {_stats['entries']} queries, {_stats['bytes'] / 1e6:.1f} MB, {_stats['hits']} hits / {_stats['misses']} misses")
+
+# st.tabs executes every tab body on each rerun; a view selector lets only
+# the active view run its queries, charts and table styling.
+VIEW_NAMES = [
     "Market Overview",
     "Intraday Panel",
     "ETF Tracker",
     "Prediction & Model Health",
-    "Trade-of-the-day"
-])
+    "Trade-of-the-day",
+]
+active_view = st.radio("View", VIEW_NAMES, horizontal=True, key="active_view", label_visibility="collapsed")
 
 # ================================================================
 # Helper: Colorize intraday table
@@ -89,9 +102,9 @@ def colorize_intraday_table(df: pd.DataFrame, decimals: int = 2):
 
 
 # ================================================================
-# TAB 0 — MARKET OVERVIEW
+# VIEW — MARKET OVERVIEW
 # ================================================================
-with tabs[0]:
+def render_market_overview():
     st.header("Market Overview — NIFTY")
     ndays = st.slider("Days to display", min_value=30, max_value=720, value=180)
     nifty_df = get_nifty_recent(days=ndays)
@@ -114,9 +127,9 @@ with tabs[0]:
 
 
 # ================================================================
-# TAB 1 — INTRADAY PANEL (preserved original logic)
+# VIEW — INTRADAY PANEL (preserved original logic)
 # ================================================================
-with tabs[1]:
+def render_intraday_panel():
     st.header("Intraday Panel")
 
     radio_mode = st.radio("Mode", ["By Symbol", "By Date"], horizontal=True)
@@ -145,8 +158,9 @@ with tabs[1]:
         sel_date = st.date_input("Trade Date", value=date.today() - timedelta(days=1), key="intraday_date_input")
         trade_date_str = sel_date.strftime("%Y-%m-%d")
 
-        # use existing helper that fetches all rows for that date
-        df = get_intraday_by_date(trade_date_str)
+        # one scan of the day; KPIs / movers / top value are derived from it
+        snapshot = get_intraday_snapshot(trade_date_str, top_n=10)
+        df = snapshot["rows"]
 
         if df is None or df.empty:
             st.info(f"No data found in intraday_bhavcopy for {trade_date_str}.")
@@ -157,7 +171,7 @@ with tabs[1]:
 
             st.subheader("Top 10 by Value Traded")
             if "net_trdval" in df.columns:
-                top = df.nlargest(10, "net_trdval")[["symbol", "open", "close", "net_trdval"]]
+                top = snapshot["top_value"][["symbol", "open", "close", "net_trdval"]]
                 st.plotly_chart(
                     bar_with_labels(
                         top,
@@ -172,9 +186,7 @@ with tabs[1]:
 
             st.subheader("Top 10 Price Movers (%)")
             if "open" in df.columns and "close" in df.columns:
-                df_temp = df.copy()
-                df_temp["pct_change"] = ((df_temp["close"] - df_temp["open"]) / df_temp["open"].replace(0, pd.NA)) * 100
-                movers = df_temp.nlargest(10, "pct_change")[["symbol", "pct_change"]]
+                movers = snapshot["gainers"][["symbol", "pct_change"]]
                 st.plotly_chart(
                     bar_with_labels(
                         movers,
@@ -188,7 +200,7 @@ with tabs[1]:
                 )
 
         # --- KPIs (use selected trade_date if in By Date) ---
-        kpi_data = get_intraday_summary_kpis(trade_date=trade_date_str)
+        kpi_data = snapshot["kpis"]
         col1, col2, col3, col4, col5 = st.columns(5)
         try:
             col1.metric("Symbols Traded", kpi_data["symbols_traded"])
@@ -204,11 +216,7 @@ with tabs[1]:
 
         # --- Market snapshot ---
         st.subheader("Market Snapshot")
-        # If the By Date branch already fetched all rows (df), reuse it; otherwise call query
-        if radio_mode == "By Date":
-            intraday_df = df  # df was set above
-        else:
-            intraday_df = get_intraday_market_rows(trade_date=trade_date_str)
+        intraday_df = df.head(200)
 
         if intraday_df is not None and not intraday_df.empty:
             st.dataframe(
@@ -223,7 +231,7 @@ with tabs[1]:
 
         # --- Top 10 by traded value ---
         st.subheader("Top 10 Stocks by Traded Value (with 30-Day Average)")
-        top_value_df = get_intraday_top_value_traded(trade_date=trade_date_str)
+        top_value_df = snapshot["top_value"]
         if top_value_df is not None and not top_value_df.empty:
             st.dataframe(
                 colorize_intraday_table(top_value_df),
@@ -237,7 +245,7 @@ with tabs[1]:
 
         # --- Top gainers and losers ---
         st.subheader("Top 10 Price Movers")
-        gainers_df, losers_df = get_intraday_top_price_movers(trade_date=trade_date_str)
+        gainers_df, losers_df = snapshot["gainers"], snapshot["losers"]
         col1, col2 = st.columns(2)
 
         with col1:
@@ -317,18 +325,14 @@ with tabs[1]:
         # Pass None when (none) selected so backend can omit tag filter instead of matching empty string
         use_tag = None if (not eval_tag or eval_tag == "(none)") else eval_tag
 
-        # Fetch compact dataset (server returns {"meta":..., "rows":[...]} )
-        data = {}
+        # Fetch compact dataset as a DataFrame (no rows -> dicts -> DataFrame round trip)
+        meta, df_rows = {}, pd.DataFrame()
         try:
-            data = get_signals_with_eval_json(intr_tod_date.strftime("%Y-%m-%d"), use_tag, limit=page_size, offset=0, filters=filters) or {}
+            meta, df_rows = get_signals_with_eval_frame(intr_tod_date.strftime("%Y-%m-%d"), use_tag, limit=page_size, offset=0, filters=filters)
         except Exception as e:
             st.error("Error fetching signals+evaluation data.")
             st.exception(e)
-            data = {}
-
-        meta = data.get("meta", {})
-        rows = data.get("rows", []) or []
-        df_rows = pd.DataFrame(rows)
+            meta, df_rows = {}, pd.DataFrame()
 
 
         # --- Minimal column-name compatibility shim (no SQL changes) ---
@@ -382,12 +386,7 @@ with tabs[1]:
             # Normalize ambiguous flag to symbol-friendly mark
             if "ambiguous_flag" in df_rows.columns:
                 # create Ambiguous column for display
-                def _ambig(x):
-                    try:
-                        return "⚠" if int(x) == 1 else ""
-                    except Exception:
-                        return "⚠" if x else ""
-                df_rows["Ambiguous"] = df_rows["ambiguous_flag"].apply(_ambig)
+                df_rows["Ambiguous"] = (pd.to_numeric(df_rows["ambiguous_flag"], errors="coerce") == 1).map({True: "⚠", False: ""})
                 # place Ambiguous after label_outcome if possible
                 if "label_outcome" in minimal_cols:
                     minimal_cols = [c for c in minimal_cols if c != "ambiguous_flag"]
@@ -484,9 +483,16 @@ with tabs[1]:
 
 
 # ================================================================
-# TAB 3 — PREDICTION & MODEL HEALTH
+# VIEW — ETF TRACKER
+# ================================================================
+def render_etf_tracker():
+    st.header("ETF Tracker")
+
+
+# ================================================================
+# VIEW — PREDICTION & MODEL HEALTH
 # ================================================================
-with tabs[3]:
+def render_model_health():
     st.header("Predictions & Model Health")
     models = get_model_daily_summary()
     model_names = models['model_name'].unique().tolist() if not models.empty else []
@@ -509,9 +515,15 @@ with tabs[3]:
 
 
 # ================================================================
-# TAB 4 — TRADE-OF-THE-DAY (FULL)
+# VIEW — TRADE-OF-THE-DAY (FULL)
 # ================================================================
-with tabs[4]:
+TOD_PAGE_SIZE = 100
+TOD_SIGNAL_FIELDS = [
+    "signal_id", "symbol", "strategy", "signal_type", "signal_score", "entry_model",
+    "entry_price", "stop_price", "target_price", "expected_hold_days", "bh_open", "bh_close",
+]
+
+def render_trade_of_the_day():
     st.header("Trade-of-the-day — Signals & Details")
 
     # get default date (DB-first)
@@ -532,17 +544,17 @@ with tabs[4]:
                 st.rerun()
         chosen_date_iso = ui_date.isoformat()
 
-        # load signals (with price context)
-        df_signals = get_signals_with_price_context(chosen_date_iso)
+        # filters run server-side (signal explorer); only the current page is loaded
+        strategies = get_signal_strategies(chosen_date_iso)
+        df_signals = None
 
         st.subheader(f"Signals for {chosen_date_iso}")
-        if df_signals is None or df_signals.empty:
+        if not strategies:
             st.info(f"No signals available for {chosen_date_iso}. Showing latest available data.")
         else:
             # Quick filters row
             c1, c2, c3, c4 = st.columns([3, 2, 2, 3])
             with c1:
-                strategies = sorted(df_signals["strategy"].dropna().unique().tolist())
                 sel_strats = st.multiselect("Strategy", options=strategies, default=strategies)
             with c2:
                 sel_side = st.selectbox("Side", options=["ALL", "LONG", "SHORT"], index=0)
@@ -551,22 +563,39 @@ with tabs[4]:
             with c4:
                 search_symbol = st.text_input("Search symbol", value="")
 
-            # apply filters
-            df_display = df_signals.copy()
-            if sel_strats:
-                df_display = df_display[df_display["strategy"].isin(sel_strats)]
-            if sel_side != "ALL":
-                df_display = df_display[df_display["signal_type"] == sel_side]
-            df_display = df_display[df_display["signal_score"].abs() >= float(min_score)]
-            if search_symbol:
-                df_display = df_display[df_display["symbol"].str.contains(search_symbol, case=False, na=False)]
-
-            visible_cols = ["symbol", "strategy", "signal_type", "signal_score", "entry_model", "entry_price", "stop_price", "target_price", "expected_hold_days", "prev_close", "open"]
-            visible_cols = [c for c in visible_cols if c in df_display.columns]
+            # keyset cursors for the pages seen so far; reset whenever the filters change
+            filter_key = (chosen_date_iso, tuple(sel_strats), sel_side, float(min_score), search_symbol)
+            if st.session_state.get("tod_filter_key") != filter_key:
+                st.session_state["tod_filter_key"] = filter_key
+                st.session_state["tod_cursors"] = [None]
+            cursors = st.session_state["tod_cursors"]
+
+            df_display, next_cursor = explore_signals_page(
+                chosen_date_iso,
+                fields=TOD_SIGNAL_FIELDS,
+                strategies=sel_strats if sel_strats and len(sel_strats) < len(strategies) else None,
+                signal_type=None if sel_side == "ALL" else sel_side,
+                min_abs_score=float(min_score) or None,
+                symbol_contains=search_symbol or None,
+                limit=TOD_PAGE_SIZE,
+                cursor=cursors[-1],
+            )
+            df_signals = df_display
+
+            visible_cols = [c for c in TOD_SIGNAL_FIELDS if c != "signal_id" and c in df_display.columns]
             st.dataframe(df_display[visible_cols].reset_index(drop=True), width='stretch')
 
-            st.download_button("Export signals subset (CSV)", df_display.to_csv(index=False).encode("utf-8"),
-                               file_name=f"signals_{chosen_date_iso}.csv", mime="text/csv")
+            p1, p2, p3 = st.columns([1, 1, 4])
+            p3.caption(f"Page {len(cursors)} · {len(df_display)} signals")
+            if p1.button("◀ Prev", key="tod_prev", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+            if p2.button("Next ▶", key="tod_next", disabled=next_cursor is None):
+                cursors.append(next_cursor)
+                st.rerun()
+
+            st.download_button("Export signals page (CSV)", df_display.to_csv(index=False).encode("utf-8"),
+                               file_name=f"signals_{chosen_date_iso}_p{len(cursors)}.csv", mime="text/csv")
 
             # Symbol detail panel (expand)
             chosen_symbol = st.selectbox("Select symbol to inspect", options=[""] + df_display["symbol"].dropna().unique().tolist(), key="tod_symbol_inspect")
@@ -646,11 +675,7 @@ with tabs[4]:
                 else:
                     x_index = pd.to_datetime(feat_ts.index)
 
-                import plotly.graph_objs as go
-                fig = go.Figure()
-                for col in feat_ts.columns:
-                    fig.add_trace(go.Scatter(x=x_index, y=feat_ts[col], mode='lines', name=col))
-                fig.update_layout(title=f"{chosen_symbol} — features", height=450, xaxis_title="date")
+                fig = multi_line(x_index, feat_ts, title=f"{chosen_symbol} — features", height=450, xaxis_title="date")
                 st.plotly_chart(fig, width="stretch")
                 st.dataframe(feat_ts.tail(50).round(4))
         else:
@@ -678,4 +703,17 @@ with tabs[4]:
                     #st.json(summary)
                     #st.button("Re-run preview (dry-run)", key=f"preview_{row.get('run_name')}_{row.get('started_at')}")
 
+
+# ================================================================
+# Render only the selected view
+# ================================================================
+VIEWS = {
+    "Market Overview": render_market_overview,
+    "Intraday Panel": render_intraday_panel,
+    "ETF Tracker": render_etf_tracker,
+    "Prediction & Model Health": render_model_health,
+    "Trade-of-the-day": render_trade_of_the_day,
+}
+VIEWS[active_view]()
+
 # End of file
@@ -1,14 +1,128 @@
 # components.py
+import math
 import plotly.graph_objs as go
+import numpy as np
 import pandas as pd
+from Code.config import CHART_VIEWPORT_PX, CHART_PX_PER_CANDLE, CHART_PX_PER_POINT
 
 
+# ---------- downsampling ----------
+# Candidate OHLC bar sizes, finest first: (pandas freq, label, approximate length)
+RESAMPLE_LADDER = [
+    ("5min", "5m", pd.Timedelta(minutes=5)),
+    ("15min", "15m", pd.Timedelta(minutes=15)),
+    ("30min", "30m", pd.Timedelta(minutes=30)),
+    ("1h", "1h", pd.Timedelta(hours=1)),
+    ("1D", "daily", pd.Timedelta(days=1)),
+    ("W-FRI", "weekly", pd.Timedelta(weeks=1)),
+    ("MS", "monthly", pd.Timedelta(days=28)),
+]
+
+# Summed when bars are merged; any other extra column keeps its last value
+_ADDITIVE_COLS = {"volume", "net_trdqty", "net_trdval"}
+
+
+def max_candles(viewport_px: int = None) -> int:
+    return max(20, (viewport_px or CHART_VIEWPORT_PX) // CHART_PX_PER_CANDLE)
+
+def max_points(viewport_px: int = None) -> int:
+    return max(50, (viewport_px or CHART_VIEWPORT_PX) // CHART_PX_PER_POINT)
+
+
+def resample_ohlc(df, date_col='Date', open_col='Open', high_col='High', low_col='Low', close_col='Close',
+                  max_bars: int = None):
+    """
+    Aggregate OHLC rows into the finest bar size from RESAMPLE_LADDER (5m, 15m, ... daily,
+    weekly, monthly) that yields at most max_bars bars. Each bar is labelled with its first
+    timestamp. Returns (DataFrame, label) — label is None when df already fits.
+    """
+    max_bars = max_bars or max_candles()
+    if df is None or len(df) <= max_bars:
+        return df, None
+
+    data = df.copy()
+    data[date_col] = pd.to_datetime(data[date_col])
+    data = data.sort_values(date_col)
+    data["_bar_at"] = data[date_col]
+
+    agg = {open_col: "first", high_col: "max", low_col: "min", close_col: "last", "_bar_at": "first"}
+    for c in data.columns:
+        if c not in agg and c != date_col:
+            agg[c] = "sum" if c.lower() in _ADDITIVE_COLS else "last"
+
+    spacing = data[date_col].diff().median()
+    for freq, label, length in RESAMPLE_LADDER:
+        if pd.notna(spacing) and length <= spacing:
+            continue
+        grouped = data.groupby(pd.Grouper(key=date_col, freq=freq))
+        if int((grouped.size() > 0).sum()) > max_bars:
+            continue
+        out = grouped.agg(agg).dropna(subset=[open_col])
+        out = out.rename(columns={"_bar_at": date_col}).reset_index(drop=True)
+        return out[list(df.columns)], label
+
+    # longer than max_bars months: equal-count buckets
+    size = math.ceil(len(data) / max_bars)
+    agg[date_col] = agg.pop("_bar_at")
+    data = data.drop(columns=["_bar_at"])
+    out = data.groupby(np.arange(len(data)) // size).agg(agg).reset_index(drop=True)
+    return out[list(df.columns)], f"{size}-bar"
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the
+    visual shape of (x, y). x must be numeric and ascending; y must not contain NaN.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    idx = np.empty(threshold, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    bucket = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        if end >= next_end:
+            avg_x, avg_y = x[-1], y[-1]
+        else:
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def downsample_line(x, y, max_pts: int = None):
+    """(x, y) reduced with LTTB to at most max_pts points (NaN points dropped first)."""
+    max_pts = max_pts or max_points()
+    x = pd.Series(pd.to_datetime(x) if not pd.api.types.is_numeric_dtype(x) else x).reset_index(drop=True)
+    y = pd.Series(y).reset_index(drop=True).astype(float)
+    keep = y.notna()
+    x, y = x[keep], y[keep]
+    if len(y) <= max_pts:
+        return x, y
+    x_num = x.astype("int64") if pd.api.types.is_datetime64_any_dtype(x) else x
+    idx = lttb_indices(x_num.to_numpy(dtype=float), y.to_numpy(), max_pts)
+    return x.iloc[idx], y.iloc[idx]
+
+
+# ---------- charts ----------
 def plot_candles(df, date_col='Date', open_col='Open', high_col='High', low_col='Low', close_col='Close',
-                 title="OHLC", overlays: list = None, height: int = 550):
+                 title="OHLC", overlays: list = None, height: int = 550, max_bars: int = None):
     """
     overlays: list of dicts: {"label": "entry", "price": 123.45, "color": "green", "dash": "dash", "width":2}
     The function draws horizontal lines for each overlay at the given price.
+    max_bars: resample to at most this many candles (default: from the chart viewport width).
     """
+    df, bar_label = resample_ohlc(df, date_col, open_col, high_col, low_col, close_col, max_bars=max_bars)
+    if bar_label:
+        title = f"{title} ({bar_label} bars)"
     fig = go.Figure(data=[go.Candlestick(
         x=df[date_col],
         open=df[open_col],
@@ -48,13 +162,23 @@ def plot_candles(df, date_col='Date', open_col='Open', high_col='High', low_col=
                       shapes=shapes, annotations=annotations)
     return fig
 
-def line_series(df, x_col, y_col, title=None):
+def line_series(df, x_col, y_col, title=None, max_pts: int = None):
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=df[x_col], y=df[y_col], mode='lines', name=y_col))
+    x, y = downsample_line(df[x_col], df[y_col], max_pts)
+    fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name=y_col))
     if title:
         fig.update_layout(title=title)
     return fig
 
+def multi_line(x, df, title=None, height: int = 450, xaxis_title=None, max_pts: int = None):
+    """One line per column of df against x; each trace is LTTB-decimated on its own."""
+    fig = go.Figure()
+    for col in df.columns:
+        xs, ys = downsample_line(x, df[col], max_pts)
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', name=col))
+    fig.update_layout(title=title or "", height=height, xaxis_title=xaxis_title)
+    return fig
+
 def simple_bar(df, x_col, y_col, title=None):
     fig = go.Figure()
     fig.add_trace(go.Bar(x=df[x_col], y=df[y_col], name=y_col))
@@ -43,3 +43,47 @@ DBS: Dict[str, dict] = {
 #     "database": "etf",
 #     "pool_size": 3,
 # }
+
+# --- Query result cache (utils/db.py read_sql) ---
+# Seconds a result stays fresh. Non-empty results of queries whose date predicates are
+# all bounded above by a closed session (before the newest loaded trade date of every
+# table the query reads) use the historical TTL since that data no longer changes.
+CACHE_DEFAULT_TTL = int(os.getenv("DASH_CACHE_TTL", 300))
+CACHE_HISTORICAL_TTL = int(os.getenv("DASH_CACHE_HISTORICAL_TTL", 24 * 3600))
+# Newest loaded trade date per DB key and table (read at most once per CACHE_DEFAULT_TTL).
+# Only queries reading listed tables alone can get the historical TTL; derived tables
+# filled later (signal_evaluation_results, symbol_liquidity_daily, strategy_runs, ...)
+# are left out on purpose.
+CACHE_LATEST_DATE_SQL: Dict[str, Dict[str, str]] = {
+    "intraday": {
+        "intraday_bhavcopy": "SELECT MAX(trade_date) FROM intraday_bhavcopy",
+        "strategy_features": "SELECT MAX(trade_date) FROM strategy_features",
+    },
+    "nifty": {
+        "nifty_prices": "SELECT MAX(`Date`) FROM nifty_prices",
+    },
+    "etf": {
+        "etf_daily_transaction": "SELECT MAX(etf_trade_date) FROM etf_daily_transaction",
+    },
+}
+# Upper bound on cached DataFrame memory (least recently used evicted first)
+CACHE_MAX_BYTES = int(os.getenv("DASH_CACHE_MAX_MB", 256)) * 1024 * 1024
+CACHE_MAX_ENTRIES = int(os.getenv("DASH_CACHE_MAX_ENTRIES", 512))
+
+# --- Signal explorer API (Code/api.py) ---
+# When set (e.g. "http://localhost:8005"), the Trade-of-the-day view pages signals
+# through the API; otherwise it runs the same explorer queries in-process.
+SIGNAL_API_URL = os.getenv("SIGNAL_API_URL", "").rstrip("/")
+SIGNAL_API_TIMEOUT = float(os.getenv("SIGNAL_API_TIMEOUT", 10))
+
+# --- Feature store (utils/feature_store.py) ---
+# Per-date Parquet matrices pivoted from strategy_features (requires pyarrow)
+FEATURE_STORE_DIR = os.getenv("DASH_FEATURE_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".feature_store"))
+
+# --- Chart downsampling (components.py) ---
+# Charts are sized for a viewport this wide; candles are resampled to roughly one
+# per CHART_PX_PER_CANDLE pixels and line series decimated (LTTB) to one point per
+# CHART_PX_PER_POINT pixels, so long ranges don't ship every row to the browser.
+CHART_VIEWPORT_PX = int(os.getenv("DASH_CHART_VIEWPORT_PX", 1400))
+CHART_PX_PER_CANDLE = int(os.getenv("DASH_CHART_PX_PER_CANDLE", 4))
+CHART_PX_PER_POINT = int(os.getenv("DASH_CHART_PX_PER_POINT", 1))
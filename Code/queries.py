@@ -7,7 +7,14 @@ import os
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT_DIR)
 
+import json
+import urllib.parse
+import urllib.request
 from Code.utils.db import read_sql
+from Code.config import SIGNAL_API_URL, SIGNAL_API_TIMEOUT
+from Code import signal_explorer
+from Code.utils import feature_store
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta, date
 from Code.utils.intradayevaluationqueries import (
@@ -25,7 +32,8 @@ def get_nifty_recent(days: int = 180):
     ORDER BY `Date` DESC
     LIMIT :limit
     """
-    df = read_sql("nifty", q, params={"limit": days})
+    # latest bars change intraday: keep this one short-lived
+    df = read_sql("nifty", q, params={"limit": days}, ttl=60)
     if not df.empty:
         df["Date"] = pd.to_datetime(df["Date"])
         df = df.sort_values("Date")
@@ -136,7 +144,7 @@ def get_latest_trade_date_from_bhavcopy():
     SELECT MAX(trade_date) AS latest_date
     FROM intraday_bhavcopy
     """
-    df = read_sql("intraday", q)
+    df = read_sql("intraday", q, ttl=60)
     if df.empty or df.iloc[0]["latest_date"] is None:
         return None
     return pd.to_datetime(df.iloc[0]["latest_date"]).date()
@@ -161,7 +169,7 @@ def get_gainers_losers(on_date: str = None, top_n: int = 10):
         df = read_sql("intraday", q, params=params)
     else:
         q = "SELECT trade_date, symbol, pct_change FROM gainer_loser ORDER BY trade_date DESC LIMIT :n"
-        df = read_sql("intraday", q, params={"n": top_n})
+        df = read_sql("intraday", q, params={"n": top_n}, ttl=60)
     if not df.empty and "trade_date" in df.columns:
         df["trade_date"] = pd.to_datetime(df["trade_date"])
     return df
@@ -183,127 +191,225 @@ def get_intraday_by_date(trade_date: str):
 
 
 
-def get_intraday_market_rows(trade_date: str = None) -> pd.DataFrame:
+def _normalize_trade_date(trade_date=None) -> str:
+    """Accept None (today), a date or an ISO string; return 'YYYY-MM-DD'."""
+    if trade_date is None:
+        return datetime.now().date().isoformat()
+    if isinstance(trade_date, (date, datetime)):
+        return trade_date.strftime("%Y-%m-%d")
+    try:
+        return datetime.fromisoformat(str(trade_date)).date().isoformat()
+    except Exception:
+        return datetime.strptime(str(trade_date), "%Y-%m-%d").date().isoformat()
+
+
+# symbol_liquidity_daily columns by lookback (sessions); maintained by
+# TradeSetup's liquidity rollup job as each bhavcopy day is loaded
+LIQUIDITY_ROLLUP_COLUMNS = {20: "avg_trdval_20d", 30: "avg_trdval_30d"}
+
+MARKET_ROW_COLUMNS = [
+    "trade_date", "symbol", "open", "high", "low", "close",
+    "net_trdval", "net_trdqty", "pct_change", "direction",
+]
+
+
+def _liquidity_sessions(trade_date: str) -> list:
+    """The last 30 bhavcopy sessions up to trade_date, newest first."""
+    sessions = read_sql("intraday", """
+    SELECT DISTINCT trade_date
+    FROM intraday_bhavcopy
+    WHERE trade_date <= :trade_date
+    ORDER BY trade_date DESC
+    LIMIT :n
+    """, params={"trade_date": trade_date, "n": max(LIQUIDITY_ROLLUP_COLUMNS)})
+    return sessions["trade_date"].tolist()
+
+
+def _rollup_is_current(trade_date: str, days: list) -> bool:
     """
-    Return intraday rows for trade_date ordered by net_trdval desc.
-    Columns returned include: trade_date, symbol, open, high, low, close, net_trdval, net_trdqty, pct_change, direction
+    The rollup's rows for trade_date account for every bhavcopy row in its
+    30-session window (SUM(sessions_30d) == COUNT(*)); False when missing or
+    built before rows were added / removed.
     """
-    if trade_date is None:
-        trade_date = datetime.now().date().isoformat()
+    q = """
+    SELECT
+        (SELECT SUM(sessions_30d)
+           FROM symbol_liquidity_daily
+          WHERE trade_date = :trade_date) AS rollup_rows,
+        (SELECT COUNT(*)
+           FROM intraday_bhavcopy
+          WHERE trade_date >= :long_start
+            AND trade_date <= :trade_date) AS source_rows
+    """
+    row = read_sql("intraday", q, params={"trade_date": trade_date, "long_start": days[-1]}).iloc[0]
+    return pd.notna(row["rollup_rows"]) and int(row["rollup_rows"]) == int(row["source_rows"])
 
+
+def _liquidity_from_bhavcopy(trade_date: str, days: list) -> pd.DataFrame:
+    """
+    symbol, avg_trdval_20d, avg_trdval_30d as of trade_date, computed like the
+    symbol_liquidity_daily rollup (last 20 / 30 sessions, inclusive).
+    """
     q = """
     SELECT
-        trade_date,
         symbol,
-        open,
-        high,
-        low,
-        close,
-        net_trdval,
-        net_trdqty,
-        ROUND((close - open) / NULLIF(open,0) * 100, 2) AS pct_change,
-        CASE
-            WHEN close > open THEN 'gain'
-            WHEN close < open THEN 'loss'
-            ELSE 'flat'
-        END AS direction
+        AVG(CASE WHEN trade_date >= :short_start THEN net_trdval END) AS avg_trdval_20d,
+        AVG(net_trdval) AS avg_trdval_30d
     FROM intraday_bhavcopy
-    WHERE trade_date = :trade_date
-    ORDER BY net_trdval DESC
+    WHERE trade_date >= :long_start
+      AND trade_date <= :trade_date
+    GROUP BY symbol
     """
-    df = read_sql("intraday", q, params={"trade_date": trade_date})
-    # ensure consistent dtypes (match other functions' style)
-    if not df.empty:
-        if "trade_date" in df.columns:
-            df["trade_date"] = pd.to_datetime(df["trade_date"])
-    return df
+    return read_sql("intraday", q, params={
+        "trade_date": trade_date,
+        "short_start": days[min(len(days), min(LIQUIDITY_ROLLUP_COLUMNS)) - 1],
+        "long_start": days[-1],
+    })
 
 
-def get_intraday_top_value_traded(trade_date: str = None, lookback_days: int = 30, limit: int = 10) -> pd.DataFrame:
+def _load_intraday_day(trade_date: str) -> pd.DataFrame:
     """
-    Top N symbols by traded value for trade_date, plus avg_30d_net_trdval over lookback_days (inclusive).
-    Returns DataFrame with columns: symbol, open, close, net_trdval, pct_change, avg_30d_net_trdval
+    One scan of intraday_bhavcopy for trade_date (plus the rolling liquidity row,
+    computed from bhavcopy when the rollup is missing or stale for the date).
+    Cached by read_sql per date; every Intraday Panel view derives from this frame.
     """
-    if trade_date is None:
-        td = datetime.now().date()
-    else:
-        # accept date string or date object
-        try:
-            td = datetime.fromisoformat(trade_date).date()
-        except Exception:
-            td = datetime.strptime(str(trade_date), "%Y-%m-%d").date()
-    trade_date_str = td.isoformat()
-    start_date_str = (td - timedelta(days=lookback_days - 1)).isoformat()
-
-    q = f"""
-    WITH top_symbols AS (
-        SELECT symbol
-        FROM intraday_bhavcopy
-        WHERE trade_date = :trade_date
-        ORDER BY net_trdval DESC
-        LIMIT :limit
-    )
+    q = """
     SELECT
-        t.symbol,
+        i.trade_date,
+        i.symbol,
         i.open,
+        i.high,
+        i.low,
         i.close,
         i.net_trdval,
-        ROUND((i.close - i.open) / NULLIF(i.open,0) * 100, 2) AS pct_change,
-        ROUND((
-            SELECT AVG(net_trdval)
-            FROM intraday_bhavcopy
-            WHERE symbol = t.symbol
-              AND trade_date BETWEEN :start_date AND :trade_date
-        ), 2) AS avg_30d_net_trdval
-    FROM top_symbols t
-    JOIN intraday_bhavcopy i
-      ON i.symbol = t.symbol
-     AND i.trade_date = :trade_date
+        i.net_trdqty,
+        l.avg_trdval_20d,
+        l.avg_trdval_30d
+    FROM intraday_bhavcopy i
+    LEFT JOIN symbol_liquidity_daily l
+      ON l.trade_date = i.trade_date
+     AND l.symbol = i.symbol
+    WHERE i.trade_date = :trade_date
     ORDER BY i.net_trdval DESC
     """
-    df = read_sql("intraday", q, params={"trade_date": trade_date_str, "start_date": start_date_str, "limit": limit})
+    df = read_sql("intraday", q, params={"trade_date": trade_date})
+    if df.empty:
+        return df.reindex(columns=MARKET_ROW_COLUMNS + ["raw_pct_change", "avg_trdval_20d", "avg_trdval_30d"])
+    days = _liquidity_sessions(trade_date)
+    if not _rollup_is_current(trade_date, days):
+        # rollup not built for this date, or built before a re-import: same averages straight from bhavcopy
+        liquidity = _liquidity_from_bhavcopy(trade_date, days)
+        df = df.drop(columns=["avg_trdval_20d", "avg_trdval_30d"]).merge(liquidity, on="symbol", how="left")
+
+    df["trade_date"] = pd.to_datetime(df["trade_date"])
+    open_ = pd.to_numeric(df["open"], errors="coerce")
+    close = pd.to_numeric(df["close"], errors="coerce")
+    # same as ROUND((close - open) / NULLIF(open,0) * 100, 2); unrounded kept for the KPI average
+    df["raw_pct_change"] = (close - open_) / open_.where(open_ != 0) * 100
+    df["pct_change"] = df["raw_pct_change"].round(2)
+    df["direction"] = np.select([close > open_, close < open_], ["gain", "loss"], default="flat")
     return df
 
 
-def get_intraday_top_price_movers(
-    trade_date: str = None, limit: int = 10
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+def get_intraday_snapshot(trade_date: str = None, top_n: int = 10) -> dict:
+    """
+    Everything the Intraday Panel shows for one date, from a single scan:
+      rows       -> market rows (MARKET_ROW_COLUMNS), ordered by net_trdval desc
+      kpis       -> symbols_traded, total_traded_value, gainers, losers, flat, avg_pct_change
+      gainers    -> top_n by pct_change desc  (symbol, open, close, pct_change, net_trdval)
+      losers     -> top_n by pct_change asc
+      top_value  -> top_n by net_trdval with avg_30d_net_trdval
+    """
+    day = _load_intraday_day(_normalize_trade_date(trade_date))
+
+    mover_cols = ["symbol", "open", "close", "pct_change", "net_trdval"]
+    value_cols = ["symbol", "open", "close", "net_trdval", "pct_change", "avg_30d_net_trdval"]
+    if day.empty:
+        return {
+            "rows": day[MARKET_ROW_COLUMNS],
+            "kpis": {"symbols_traded": 0, "total_traded_value": 0.0, "gainers": 0, "losers": 0, "flat": 0, "avg_pct_change": 0.0},
+            "gainers": pd.DataFrame(columns=mover_cols),
+            "losers": pd.DataFrame(columns=mover_cols),
+            "top_value": pd.DataFrame(columns=value_cols),
+        }
+
+    open_ = pd.to_numeric(day["open"], errors="coerce")
+    close = pd.to_numeric(day["close"], errors="coerce")
+    kpis = {
+        "symbols_traded": int(len(day)),
+        "total_traded_value": round(float(pd.to_numeric(day["net_trdval"], errors="coerce").sum()), 2),
+        "gainers": int((close > open_).sum()),
+        "losers": int((close < open_).sum()),
+        "flat": int((close == open_).sum()),
+        "avg_pct_change": round(float(day["raw_pct_change"].mean()), 2) if day["raw_pct_change"].notna().any() else 0.0,
+    }
+
+    priced = day.dropna(subset=["pct_change"])
+    gainers = priced.nlargest(top_n, "pct_change")[mover_cols].reset_index(drop=True)
+    losers = priced.nsmallest(top_n, "pct_change")[mover_cols].reset_index(drop=True)
+
+    top_value = get_intraday_top_value_traded(day=day, limit=top_n)
+
+    return {
+        "rows": day[MARKET_ROW_COLUMNS],
+        "kpis": kpis,
+        "gainers": gainers,
+        "losers": losers,
+        "top_value": top_value,
+    }
+
+
+def get_intraday_market_rows(trade_date: str = None) -> pd.DataFrame:
     """
-    Returns tuple (gainers_df, losers_df) for the given trade_date.
-    Each DataFrame columns: symbol, open, close, pct_change, net_trdval
+    Return intraday rows for trade_date ordered by net_trdval desc.
+    Columns returned include: trade_date, symbol, open, high, low, close, net_trdval, net_trdqty, pct_change, direction
     """
-    if trade_date is None:
-        trade_date = datetime.now().date().isoformat()
+    return get_intraday_snapshot(trade_date)["rows"]
 
-    q_gainers = """
-    SELECT
-        symbol,
-        open,
-        close,
-        ROUND((close - open) / NULLIF(open,0) * 100, 2) AS pct_change,
-        net_trdval
-    FROM intraday_bhavcopy
-    WHERE trade_date = :trade_date
-    ORDER BY pct_change DESC
-    LIMIT :limit
+
+def get_intraday_top_value_traded(trade_date: str = None, lookback_days: int = 30, limit: int = 10, day: pd.DataFrame = None) -> pd.DataFrame:
     """
-    q_losers = """
-    SELECT
-        symbol,
-        open,
-        close,
-        ROUND((close - open) / NULLIF(open,0) * 100, 2) AS pct_change,
-        net_trdval
+    Top N symbols by traded value for trade_date, plus avg_30d_net_trdval over lookback_days (inclusive).
+    Returns DataFrame with columns: symbol, open, close, net_trdval, pct_change, avg_30d_net_trdval
+    day: an already loaded _load_intraday_day frame (skips the read).
+    """
+    value_cols = ["symbol", "open", "close", "net_trdval", "pct_change", "avg_30d_net_trdval"]
+    if day is None:
+        day = _load_intraday_day(_normalize_trade_date(trade_date))
+    if day.empty:
+        return pd.DataFrame(columns=value_cols)
+
+    df = day.head(limit)[["symbol", "open", "close", "net_trdval", "pct_change"]].reset_index(drop=True)
+    # calendar-day window, as before the rollup: one grouped read for the top symbols only
+    td = pd.Timestamp(day["trade_date"].iloc[0]).date()
+    symbols = df["symbol"].tolist()
+    params = {f"s{i}": s for i, s in enumerate(symbols)}
+    params.update({
+        "start_date": (td - timedelta(days=lookback_days - 1)).isoformat(),
+        "trade_date": td.isoformat(),
+    })
+    q = f"""
+    SELECT symbol, AVG(net_trdval) AS avg_30d_net_trdval
     FROM intraday_bhavcopy
-    WHERE trade_date = :trade_date
-    ORDER BY pct_change ASC
-    LIMIT :limit
+    WHERE symbol IN ({", ".join(f":s{i}" for i in range(len(symbols)))})
+      AND trade_date BETWEEN :start_date AND :trade_date
+    GROUP BY symbol
     """
+    avg = read_sql("intraday", q, params=params)
+    df = df.merge(avg, on="symbol", how="left")
+    df["avg_30d_net_trdval"] = pd.to_numeric(df["avg_30d_net_trdval"], errors="coerce").round(2)
+    return df[value_cols]
 
-    gainers = read_sql("intraday", q_gainers, params={"trade_date": trade_date, "limit": limit})
-    losers = read_sql("intraday", q_losers, params={"trade_date": trade_date, "limit": limit})
 
-    return gainers, losers
+def get_intraday_top_price_movers(
+    trade_date: str = None, limit: int = 10
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Returns tuple (gainers_df, losers_df) for the given trade_date.
+    Each DataFrame columns: symbol, open, close, pct_change, net_trdval
+    """
+    snapshot = get_intraday_snapshot(trade_date, top_n=limit)
+    return snapshot["gainers"], snapshot["losers"]
 
 
 def get_intraday_summary_kpis(trade_date: str = None) -> dict:
@@ -312,34 +418,7 @@ def get_intraday_summary_kpis(trade_date: str = None) -> dict:
     Output dict keys:
       symbols_traded, total_traded_value, gainers, losers, flat, avg_pct_change
     """
-    if trade_date is None:
-        trade_date = datetime.now().date().isoformat()
-
-    q = """
-    SELECT
-        COUNT(*) AS symbols_traded,
-        ROUND(SUM(net_trdval), 2) AS total_traded_value,
-        SUM(CASE WHEN close > open THEN 1 ELSE 0 END) AS gainers,
-        SUM(CASE WHEN close < open THEN 1 ELSE 0 END) AS losers,
-        SUM(CASE WHEN close = open THEN 1 ELSE 0 END) AS flat,
-        ROUND(AVG((close - open) / NULLIF(open,0) * 100), 2) AS avg_pct_change
-    FROM intraday_bhavcopy
-    WHERE trade_date = :trade_date
-    """
-    df = read_sql("intraday", q, params={"trade_date": trade_date})
-    if df.empty:
-        return {"symbols_traded": 0, "total_traded_value": 0.0, "gainers": 0, "losers": 0, "flat": 0, "avg_pct_change": 0.0}
-
-    row = df.iloc[0].to_dict()
-    # coerce types to native
-    return {
-        "symbols_traded": int(row.get("symbols_traded") or 0),
-        "total_traded_value": float(row.get("total_traded_value") or 0.0),
-        "gainers": int(row.get("gainers") or 0),
-        "losers": int(row.get("losers") or 0),
-        "flat": int(row.get("flat") or 0),
-        "avg_pct_change": float(row.get("avg_pct_change") or 0.0),
-    }
+    return get_intraday_snapshot(trade_date)["kpis"]
 
 # --- New: Strategy / Signals / Features / Runs (db_key = 'intraday') ---
 def get_price_context_for_symbol(symbol: str, trade_date: str, lookback_days: int = 5) -> pd.DataFrame:
@@ -494,6 +573,10 @@ def get_feature_trends(symbol: str, feature_names: list, start_date: str = None,
     if not feature_names:
         return pd.DataFrame()
 
+    if feature_store.PARQUET_AVAILABLE and start_date and end_date:
+        # slices of the per-date wide matrices instead of pivoting the EAV rows
+        return feature_store.symbol_history(symbol, start_date, end_date, features=list(feature_names))
+
     # build IN clause safely by generating params
     placeholders = ", ".join([f":f{i}" for i in range(len(feature_names))])
     params = {"symbol": symbol}
@@ -674,14 +757,21 @@ def get_smart_symbols(selected_date: str, lookback_days: int = 5, top_k: int = 1
     Returns DataFrame: symbol, feature_count, recent_signals_count, score
     """
     # 1) count features on selected_date
-    q_features = """
-    SELECT symbol, COUNT(*) AS feature_count
-    FROM strategy_features
-    WHERE trade_date = :d
-      AND value IS NOT NULL
-    GROUP BY symbol
-    """
-    df_feat = read_sql("intraday", q_features, params={"d": selected_date})
+    if feature_store.PARQUET_AVAILABLE and feature_store.has_partition(selected_date):
+        # non-null cells per row of the materialized matrix; unmaterialized dates
+        # count in SQL rather than pulling and pivoting every EAV row
+        matrix = feature_store.feature_matrix(selected_date)
+        df_feat = pd.DataFrame({"symbol": matrix.index, "feature_count": matrix.notna().sum(axis=1).to_numpy()})
+        df_feat = df_feat[df_feat["feature_count"] > 0]
+    else:
+        q_features = """
+        SELECT symbol, COUNT(*) AS feature_count
+        FROM strategy_features
+        WHERE trade_date = :d
+          AND value IS NOT NULL
+        GROUP BY symbol
+        """
+        df_feat = read_sql("intraday", q_features, params={"d": selected_date})
     if df_feat is None:
         df_feat = pd.DataFrame(columns=["symbol", "feature_count"])
 
@@ -748,6 +838,9 @@ def get_strategy_features(symbol: str, start_date: str, end_date: str, features:
     Assumes columns: trade_date, symbol, feature_name, feature_value as Value
     Returns pivoted DataFrame with index=trade_date and columns=feature names.
     """
+    if feature_store.PARQUET_AVAILABLE:
+        return feature_store.symbol_history(symbol, start_date, end_date, features=features or None)
+
     q = """
     SELECT trade_date, symbol, feature_name, value AS feature_value
     FROM strategy_features
@@ -789,14 +882,55 @@ def get_eval_tags_list():
     """Return list of eval tags for dropdown (db_key = 'intraday')"""
     return list_eval_tags("intraday")
 
-def get_signals_with_eval_json(trade_date: str, eval_tag: str, limit: int = 200, offset: int = 0, filters: dict = None):
-    """Return dict {'meta':..., 'rows':[...]} for UI"""
-    return get_signals_with_eval("intraday", trade_date, eval_tag, limit=limit, offset=offset, filters=filters)
+def get_signals_with_eval_json(trade_date: str, eval_tag: str, limit: int = 200, offset: int = 0, filters: dict = None, after: dict = None):
+    """Return dict {'meta':..., 'rows':[...]} for UI; pass meta['next_cursor'] as `after` for the next page"""
+    return get_signals_with_eval("intraday", trade_date, eval_tag, limit=limit, offset=offset, filters=filters, after=after)
+
+def get_signals_with_eval_frame(trade_date: str, eval_tag: str, limit: int = 200, offset: int = 0, filters: dict = None, after: dict = None):
+    """Return (meta, DataFrame) for UI tables; stays columnar (no per-row dicts)"""
+    data = get_signals_with_eval("intraday", trade_date, eval_tag, limit=limit, offset=offset, filters=filters, as_frame=True, after=after)
+    return data["meta"], data["rows"]
 
 def get_eval_tags_diff(trade_date: str, base_tag: str, compare_tag: str):
     """Return dict diff summary"""
     return diff_tags_summary("intraday", trade_date, base_tag, compare_tag)
 
+
+# Signal explorer: one filtered page at a time, via Code/api.py when SIGNAL_API_URL is set
+def _signal_api_get(path: str, params: dict) -> dict:
+    params = {k: v for k, v in params.items() if v not in (None, "", [])}
+    url = f"{SIGNAL_API_URL}{path}?{urllib.parse.urlencode(params, doseq=True)}"
+    with urllib.request.urlopen(url, timeout=SIGNAL_API_TIMEOUT) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+def explore_signals_page(trade_date: str, fields: list = None, strategies: list = None, signal_type: str = None,
+                         min_abs_score: float = None, symbol_contains: str = None, eval_tag: str = None,
+                         label_outcome: str = None, sort: str = "signal_score", descending: bool = True,
+                         limit: int = 100, cursor: str = None):
+    """Return (DataFrame page, next_cursor). Filters/sort/projection run in MySQL."""
+    if not SIGNAL_API_URL:
+        return signal_explorer.explore_signals(
+            trade_date, fields=fields, strategies=strategies, signal_type=signal_type,
+            min_abs_score=min_abs_score, symbol_contains=symbol_contains, eval_tag=eval_tag,
+            label_outcome=label_outcome, sort=sort, descending=descending, limit=limit, cursor=cursor,
+        )
+    data = _signal_api_get("/api/signals", {
+        "trade_date": trade_date, "fields": ",".join(fields) if fields else None, "strategy": strategies,
+        "signal_type": signal_type, "min_abs_score": min_abs_score, "symbol_contains": symbol_contains,
+        "eval_tag": eval_tag, "label_outcome": label_outcome, "sort": sort,
+        "order": "desc" if descending else "asc", "limit": limit, "cursor": cursor,
+    })
+    df = pd.DataFrame(data["rows"], columns=data["fields"])
+    if "trade_date" in df.columns:
+        df["trade_date"] = pd.to_datetime(df["trade_date"])
+    return df, data["next_cursor"]
+
+def get_signal_strategies(trade_date: str):
+    """Distinct strategies with signals on trade_date"""
+    if not SIGNAL_API_URL:
+        return signal_explorer.list_signal_strategies(trade_date)
+    return _signal_api_get("/api/signals/strategies", {"trade_date": trade_date})["strategies"]
+
 # ---------- ETF (db_key = 'etf') ----------
 def get_etf_list():
     q = "SELECT etf_id, etf_symbol, etf_name, etf_fundhouse_name FROM etf ORDER BY etf_symbol"
@@ -0,0 +1,253 @@
+# signal_explorer.py
+# Server-side filtered, keyset-paginated reads over strategy_signals / signal_evaluation_results /
+# strategy_features (db_key = 'intraday'). Served by Code/api.py and called by the dashboard.
+
+import base64
+import json
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from Code.utils.db import read_sql
+
+MAX_PAGE_SIZE = 500
+
+# Public field name -> SQL expression. Projection is limited to these; the joins are
+# only added when a requested field (or filter) needs them.
+SIGNAL_FIELDS: Dict[str, str] = {
+    "signal_id": "s.id",
+    "symbol": "s.symbol",
+    "trade_date": "s.trade_date",
+    "strategy": "s.strategy",
+    "signal_type": "s.signal_type",
+    "signal_score": "s.signal_score",
+    "entry_model": "s.entry_model",
+    "entry_price": "s.entry_price",
+    "stop_price": "s.stop_price",
+    "target_price": "s.target_price",
+    "expected_hold_days": "s.expected_hold_days",
+    "signal_notes": "s.notes",
+    # price context (intraday_bhavcopy)
+    "bh_open": "b.open",
+    "bh_high": "b.high",
+    "bh_low": "b.low",
+    "bh_close": "b.close",
+    "net_trdval": "b.net_trdval",
+    # evaluation (signal_evaluation_results, needs eval_tag)
+    "eval_run_tag": "e.eval_run_tag",
+    "label_outcome": "e.label_outcome",
+    "ambiguous_flag": "e.ambiguous_flag",
+    "realized_return": "e.realized_return",
+    "exit_price": "e.exit_price",
+    "exit_reason": "e.exit_reason",
+    "eval_notes": "e.notes",
+}
+
+DEFAULT_SIGNAL_FIELDS = [
+    "signal_id", "symbol", "strategy", "signal_type", "signal_score",
+    "entry_model", "entry_price", "stop_price", "target_price", "expected_hold_days",
+]
+
+# Sort keys: plain columns, so (trade_date, column, id) index range scans serve
+# the pages; s.id breaks ties so the keyset is total. MySQL orders NULL scores
+# last in desc and first in asc order; the keyset handles them as their own segment.
+SIGNAL_SORTS: Dict[str, str] = {
+    "signal_score": "s.signal_score",
+    "symbol": "s.symbol",
+    "signal_id": "s.id",
+}
+NULLABLE_SORTS = {"signal_score"}
+
+# sort name recorded in explore_features cursors
+FEATURE_SORT = "features"
+
+
+# ---------- cursors ----------
+def encode_cursor(values: dict) -> str:
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_cursor(cursor: str, sort: str, descending: bool) -> dict:
+    """
+    Decode a cursor issued for the same sort and direction.
+    Anything else (garbage, wrong shape, other sort/order) raises ValueError.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, dict) or not {"s", "d", "v", "id"} <= set(values):
+        raise ValueError("Invalid cursor")
+    if values["s"] != sort or values["d"] != ("desc" if descending else "asc"):
+        raise ValueError("Cursor was issued for a different sort or order")
+    return values
+
+
+def _in_clause(column: str, values: List[str], prefix: str, params: dict) -> str:
+    # build IN clause safely by generating params
+    placeholders = ", ".join([f":{prefix}{i}" for i in range(len(values))])
+    for i, v in enumerate(values):
+        params[f"{prefix}{i}"] = v
+    return f"{column} IN ({placeholders})"
+
+def _page_size(limit: int) -> int:
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+# ---------- signals ----------
+def explore_signals(
+    trade_date: str,
+    fields: Optional[List[str]] = None,
+    strategies: Optional[List[str]] = None,
+    signal_type: Optional[str] = None,
+    min_abs_score: Optional[float] = None,
+    symbol_prefix: Optional[str] = None,
+    symbol_contains: Optional[str] = None,
+    eval_tag: Optional[str] = None,
+    label_outcome: Optional[str] = None,
+    sort: str = "signal_score",
+    descending: bool = True,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Tuple[pd.DataFrame, Optional[str]]:
+    """
+    One page of signals for trade_date, filtered and sorted in MySQL.
+    Returns (DataFrame with the requested fields, next_cursor or None).
+    label_outcome may be 'NOT_EVALUATED' (no label for eval_tag).
+    """
+    fields = list(fields or DEFAULT_SIGNAL_FIELDS)
+    unknown = [f for f in fields if f not in SIGNAL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {unknown}")
+    if sort not in SIGNAL_SORTS:
+        raise ValueError(f"sort must be one of {sorted(SIGNAL_SORTS)}")
+
+    limit = _page_size(limit)
+    sort_expr = SIGNAL_SORTS[sort]
+    params = {"trade_date": trade_date, "limit": limit + 1}
+    where = ["s.trade_date = :trade_date"]
+
+    if strategies:
+        where.append(_in_clause("s.strategy", strategies, "st", params))
+    if signal_type:
+        where.append("s.signal_type = :signal_type"); params["signal_type"] = signal_type
+    if min_abs_score:
+        where.append("(s.signal_score >= :min_abs OR s.signal_score <= -:min_abs)"); params["min_abs"] = float(min_abs_score)
+    if symbol_prefix:
+        where.append("s.symbol LIKE :symbol_prefix"); params["symbol_prefix"] = f"{symbol_prefix}%"
+    if symbol_contains:
+        where.append("s.symbol LIKE :symbol_contains"); params["symbol_contains"] = f"%{symbol_contains}%"
+
+    needs_eval = label_outcome is not None or any(SIGNAL_FIELDS[f].startswith("e.") for f in fields)
+    needs_bhav = any(SIGNAL_FIELDS[f].startswith("b.") for f in fields)
+    if needs_eval and not eval_tag:
+        raise ValueError("eval_tag is required for evaluation fields or label_outcome")
+    if label_outcome is not None:
+        if label_outcome.upper() == "NOT_EVALUATED":
+            where.append("e.label_outcome IS NULL")
+        else:
+            where.append("e.label_outcome = :label_outcome"); params["label_outcome"] = label_outcome
+
+    # keyset: (sort value, id) strictly after the cursor in the chosen direction
+    cmp = "<" if descending else ">"
+    if cursor:
+        after = decode_cursor(cursor, sort, descending)
+        params["after_id"] = after["id"]
+        if after["v"] is None and sort in NULLABLE_SORTS:
+            # inside the NULL segment (last when desc, first when asc)
+            nulls = f"({sort_expr} IS NULL AND s.id {cmp} :after_id)"
+            where.append(nulls if descending else f"({nulls} OR {sort_expr} IS NOT NULL)")
+        else:
+            params["after_value"] = after["v"]
+            keyset = f"{sort_expr} {cmp} :after_value OR ({sort_expr} = :after_value AND s.id {cmp} :after_id)"
+            if descending and sort in NULLABLE_SORTS:
+                keyset += f" OR {sort_expr} IS NULL"
+            where.append(f"({keyset})")
+
+    # the sort value and id are always selected for the cursor
+    select = [f"{SIGNAL_FIELDS[f]} AS {f}" for f in fields]
+    select += [f"{sort_expr} AS _sort_value", "s.id AS _sort_id"]
+
+    joins = []
+    if needs_bhav:
+        joins.append("LEFT JOIN intraday_bhavcopy b ON b.symbol = s.symbol AND b.trade_date = s.trade_date")
+    if needs_eval:
+        joins.append("LEFT JOIN signal_evaluation_results e ON e.signal_id = s.id AND e.eval_run_tag = :eval_tag")
+        params["eval_tag"] = eval_tag
+
+    direction = "DESC" if descending else "ASC"
+    q = f"""
+    SELECT {", ".join(select)}
+    FROM strategy_signals s
+    {" ".join(joins)}
+    WHERE {" AND ".join(where)}
+    ORDER BY {sort_expr} {direction}, s.id {direction}
+    LIMIT :limit
+    """
+    df = read_sql("intraday", q, params=params)
+
+    next_cursor = None
+    if len(df) > limit:
+        df = df.iloc[:limit]
+        last = df.iloc[-1]
+        value = last["_sort_value"]
+        value = None if pd.isna(value) else getattr(value, "item", lambda: value)()
+        next_cursor = encode_cursor({
+            "s": sort, "d": direction.lower(), "v": value, "id": int(last["_sort_id"]),
+        })
+
+    df = df.drop(columns=["_sort_value", "_sort_id"]).reset_index(drop=True)
+    if "trade_date" in df.columns:
+        df["trade_date"] = pd.to_datetime(df["trade_date"])
+    return df, next_cursor
+
+
+def list_signal_strategies(trade_date: str) -> List[str]:
+    """Distinct strategies with signals on trade_date (for filter widgets)."""
+    q = "SELECT DISTINCT strategy FROM strategy_signals WHERE trade_date = :td AND strategy IS NOT NULL ORDER BY strategy"
+    df = read_sql("intraday", q, params={"td": trade_date})
+    return df["strategy"].tolist() if not df.empty else []
+
+
+# ---------- features ----------
+def explore_features(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    feature_names: Optional[List[str]] = None,
+    limit: int = MAX_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> Tuple[pd.DataFrame, Optional[str]]:
+    """
+    Long-form strategy_features rows (trade_date, feature_name, value) for one symbol,
+    keyset-paged on (trade_date, feature_name).
+    """
+    limit = _page_size(limit)
+    params = {"symbol": symbol, "start_date": start_date, "end_date": end_date, "limit": limit + 1}
+    where = ["symbol = :symbol", "trade_date BETWEEN :start_date AND :end_date"]
+    if feature_names:
+        where.append(_in_clause("feature_name", feature_names, "f", params))
+    if cursor:
+        after = decode_cursor(cursor, FEATURE_SORT, descending=False)
+        where.append("(trade_date > :after_date OR (trade_date = :after_date AND feature_name > :after_name))")
+        params["after_date"] = after["v"]
+        params["after_name"] = after["id"]
+
+    q = f"""
+    SELECT trade_date, feature_name, value
+    FROM strategy_features
+    WHERE {" AND ".join(where)}
+    ORDER BY trade_date, feature_name
+    LIMIT :limit
+    """
+    df = read_sql("intraday", q, params=params)
+
+    next_cursor = None
+    if len(df) > limit:
+        df = df.iloc[:limit]
+        last = df.iloc[-1]
+        next_cursor = encode_cursor({
+            "s": FEATURE_SORT, "d": "asc",
+            "v": str(pd.to_datetime(last["trade_date"]).date()), "id": last["feature_name"],
+        })
+    return df.reset_index(drop=True), next_cursor
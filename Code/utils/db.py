@@ -6,13 +6,30 @@ Provides:
   - read_sql(db_key, query, params=None)  -> pandas.DataFrame
   - read_sql_fq(query, params=None)       -> pandas.DataFrame (executes on any engine)
   - execute(db_key, query, params=None)   -> execute statements (use with caution)
+  - clear_cache(db_key=None) / cache_stats()
+
+SELECT results are cached in-process, keyed by (db_key, SQL, params).
+Streamlit re-runs the whole script on every widget change; the cache keeps
+those re-runs from re-querying MySQL. Callers get a copy of the cached frame.
 """
 
+import re
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
+from datetime import date, datetime
 from sqlalchemy import create_engine, text
 import pandas as pd
-from typing import Dict
-from Code.config import DBS
+from typing import Dict, Optional
+from Code.config import (
+    DBS,
+    CACHE_DEFAULT_TTL,
+    CACHE_HISTORICAL_TTL,
+    CACHE_LATEST_DATE_SQL,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+)
 
 
 _engines: Dict[str, object] = {}
@@ -52,25 +69,184 @@ def get_engine(db_key: str):
         raise RuntimeError(f"Engine for '{db_key}' is not available. Check config.py.")
     return eng
 
-def read_sql(db_key: str, query: str, params: dict = None) -> pd.DataFrame:
+# ---------- query result cache ----------
+# key -> (expires_at, nbytes, DataFrame); OrderedDict keeps LRU order
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _freeze(value):
+    """Make a params value hashable for the cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _as_date(value) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+# (db_key, table) -> (expires_at, newest loaded trade date or None)
+_latest_dates: Dict[tuple, tuple] = {}
+
+
+def _latest_loaded_date(db_key: str, table: str) -> Optional[date]:
+    """Newest trade date loaded into db_key.table (None if unknown); re-read every CACHE_DEFAULT_TTL."""
+    query = CACHE_LATEST_DATE_SQL.get(db_key, {}).get(table)
+    if query is None:
+        return None
+    now = time.monotonic()
+    entry = _latest_dates.get((db_key, table))
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    with get_engine(db_key).connect() as conn:
+        latest = _as_date(conn.execute(text(query)).scalar())
+    _latest_dates[(db_key, table)] = (now + CACHE_DEFAULT_TTL, latest)
+    return latest
+
+
+# table read by the query, e.g. "FROM strategy_features s" / "JOIN `nifty_prices`"
+_TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?", re.IGNORECASE)
+
+# comparison written before a bound param, e.g. "trade_date <= :end_date"
+_BOUND_RE = re.compile(r"(<=|>=|<>|!=|<|>|=|\bBETWEEN|\bAND|\bIN\s*\(|,)\s*:(\w+)\b", re.IGNORECASE)
+
+
+def _default_ttl(db_key: str, query: str, params: dict, df: pd.DataFrame) -> int:
     """
-    Run a SELECT query against the engine identified by db_key.
-    Returns a pandas DataFrame.
+    Closed sessions are immutable, so the historical TTL applies only when:
+      - the result is not empty (data may not be imported yet),
+      - the SQL is not relative to CURDATE/NOW,
+      - every date predicate is bounded above (no open-ended ">= :start"), and
+      - every table the query reads has a CACHE_LATEST_DATE_SQL entry and every
+        upper bound is before the newest trade date loaded into each of them.
     """
+    if df.empty:
+        return CACHE_DEFAULT_TTL
+    q = query.upper()
+    if "CURDATE(" in q or "NOW(" in q:
+        return CACHE_DEFAULT_TTL
+
+    lower, upper = 0, []
+    for op, name in _BOUND_RE.findall(query):
+        d = _as_date(params.get(name))
+        if d is None:
+            continue
+        op = op.upper()
+        if op in (">", ">=", "BETWEEN"):
+            lower += 1
+        elif op in ("<>", "!="):
+            return CACHE_DEFAULT_TTL
+        else:
+            upper.append(d)
+    if not upper or lower > len(upper):
+        return CACHE_DEFAULT_TTL
+
+    tables = {t.lower() for t in _TABLE_RE.findall(query)}
+    if not tables:
+        return CACHE_DEFAULT_TTL
+    latest = [_latest_loaded_date(db_key, t) for t in sorted(tables)]
+    if None in latest or max(upper) >= min(latest + [date.today()]):
+        return CACHE_DEFAULT_TTL
+    return CACHE_HISTORICAL_TTL
+
+
+def _evict_locked():
+    global _cache_bytes
+    while _cache and (_cache_bytes > CACHE_MAX_BYTES or len(_cache) > CACHE_MAX_ENTRIES):
+        _, (_, nbytes, _) = _cache.popitem(last=False)
+        _cache_bytes -= nbytes
+
+
+def _cached_read(db_key: str, cache_key: tuple, query: str, params: dict, ttl: Optional[int]) -> pd.DataFrame:
+    global _cache_bytes, _cache_hits, _cache_misses
+
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(cache_key)
+        if entry is not None and entry[0] > now:
+            _cache.move_to_end(cache_key)
+            _cache_hits += 1
+            return entry[2].copy()
+        _cache_misses += 1
+
     eng = get_engine(db_key)
     with eng.connect() as conn:
         # Use text() to allow bound params
-        return pd.read_sql_query(text(query), conn, params=params or {})
+        df = pd.read_sql_query(text(query), conn, params=params)
+
+    ttl = _default_ttl(db_key, query, params, df) if ttl is None else ttl
+    if ttl <= 0:
+        return df
+
+    nbytes = int(df.memory_usage(index=True, deep=True).sum())
+    with _cache_lock:
+        old = _cache.pop(cache_key, None)
+        if old is not None:
+            _cache_bytes -= old[1]
+        _cache[cache_key] = (now + ttl, nbytes, df.copy())
+        _cache_bytes += nbytes
+        _evict_locked()
+    return df
+
+
+def clear_cache(db_key: str = None) -> int:
+    """Drop cached results (all, or only those read through db_key). Returns entries removed."""
+    global _cache_bytes
+    with _cache_lock:
+        if db_key is None:
+            removed = len(_cache)
+            _cache.clear()
+            _cache_bytes = 0
+            return removed
+        keys = [k for k in _cache if k[0] == db_key]
+        for k in keys:
+            _cache_bytes -= _cache.pop(k)[1]
+        return len(keys)
 
-def read_sql_fq(query: str, params: dict = None, prefer_db: str = "nifty") -> pd.DataFrame:
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return {
+            "entries": len(_cache),
+            "bytes": _cache_bytes,
+            "max_bytes": CACHE_MAX_BYTES,
+            "hits": _cache_hits,
+            "misses": _cache_misses,
+        }
+
+
+def read_sql(db_key: str, query: str, params: dict = None, ttl: int = None) -> pd.DataFrame:
+    """
+    Run a SELECT query against the engine identified by db_key.
+    Returns a pandas DataFrame.
+    ttl: seconds to cache the result (None = automatic, 0 = bypass the cache).
+    """
+    params = params or {}
+    return _cached_read(db_key, (db_key, query, _freeze(params)), query, params, ttl)
+
+def read_sql_fq(query: str, params: dict = None, prefer_db: str = "nifty", ttl: int = None) -> pd.DataFrame:
     """
     Run a SQL query that may contain fully-qualified table names (db.table).
     Uses the engine for prefer_db to make the connection. That engine's DB user must
     have privileges to read the referenced schemas if they are on the same server.
     """
-    eng = get_engine(prefer_db)
-    with eng.connect() as conn:
-        return pd.read_sql_query(text(query), conn, params=params or {})
+    params = params or {}
+    return _cached_read(prefer_db, (prefer_db, query, _freeze(params)), query, params, ttl)
 
 def execute(db_key: str, query: str, params: dict = None):
     """
@@ -79,4 +255,7 @@ def execute(db_key: str, query: str, params: dict = None):
     """
     eng = get_engine(db_key)
     with eng.begin() as conn:
-        return conn.execute(text(query), params or {})
+        result = conn.execute(text(query), params or {})
+    # cached reads on this DB may now be stale
+    clear_cache(db_key)
+    return result
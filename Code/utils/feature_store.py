@@ -0,0 +1,244 @@
+# feature_store.py
+"""
+Wide, per-date feature matrices materialized from strategy_features (EAV).
+
+Each trade date is pivoted once into a typed matrix (one row per symbol, one
+float64 column per feature) and written as a Parquet partition:
+
+    FEATURE_STORE_DIR/<YYYY-MM-DD>_<fingerprint>.parquet
+
+The fingerprint is the date's EAV row count plus a CRC32 sum over
+(symbol, feature_name, value), taken when the partition is built.
+
+Reads never build partitions or query fingerprints: dates with a partition
+are read from disk (memory-mapped, projected to the needed columns / symbol
+rows); dates without one (today, or not backfilled yet) fall back to the
+strategy_features rows.
+
+Partitions are refreshed explicitly. After (re)importing strategy_features,
+run the backfill over the affected dates; partitions whose fingerprint still
+matches are kept and changed dates are rebuilt:
+
+    python -m Code.utils.feature_store --from 2025-01-15 --to 2025-01-17
+
+Without pyarrow the store is disabled and callers fall back to pivoting.
+"""
+
+import argparse
+import os
+import threading
+from datetime import date
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from Code.config import FEATURE_STORE_DIR
+from Code.utils.db import read_sql
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+_build_lock = threading.Lock()
+
+
+def _iso(trade_date) -> str:
+    return pd.to_datetime(trade_date).date().isoformat()
+
+
+def _is_closed(trade_date: str) -> bool:
+    return date.fromisoformat(trade_date) < date.today()
+
+
+def date_fingerprints(start_date: str, end_date: str) -> pd.DataFrame:
+    """trade_date (ISO str) and content fingerprint for every date with features in [start, end]."""
+    q = """
+    SELECT
+        trade_date,
+        COUNT(*) AS eav_rows,
+        SUM(CRC32(CONCAT_WS('|', symbol, feature_name, value))) AS crc
+    FROM strategy_features
+    WHERE trade_date BETWEEN :start_date AND :end_date
+    GROUP BY trade_date
+    ORDER BY trade_date
+    """
+    # backfill only; always read fresh
+    df = read_sql("intraday", q, params={"start_date": start_date, "end_date": end_date}, ttl=0)
+    if df.empty:
+        return pd.DataFrame(columns=["trade_date", "fingerprint"])
+    df["trade_date"] = pd.to_datetime(df["trade_date"]).dt.date.astype(str)
+    df["fingerprint"] = [f"{int(n)}-{int(c or 0):x}" for n, c in zip(df["eav_rows"], df["crc"])]
+    return df[["trade_date", "fingerprint"]]
+
+
+def _pivot_rows(df: pd.DataFrame, index: str) -> pd.DataFrame:
+    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    wide = df.pivot_table(index=index, columns="feature_name", values="value", aggfunc="first", dropna=False)
+    wide = wide.astype("float64").sort_index()
+    wide.columns.name = None
+    return wide
+
+
+def _pivot_date(trade_date: str, ttl: Optional[int] = None) -> pd.DataFrame:
+    """EAV rows for one date -> wide matrix (symbol column + one float64 column per feature)."""
+    q = """
+    SELECT symbol, feature_name, value
+    FROM strategy_features
+    WHERE trade_date = :d
+    """
+    df = read_sql("intraday", q, params={"d": trade_date}, ttl=ttl)
+    if df.empty:
+        return pd.DataFrame(columns=["symbol"])
+    return _pivot_rows(df, "symbol").reset_index()
+
+
+def _partition_path(trade_date: str, fingerprint: str) -> str:
+    return os.path.join(FEATURE_STORE_DIR, f"{trade_date}_{fingerprint}.parquet")
+
+
+def _partitions(start_date: str, end_date: str) -> Dict[str, str]:
+    """trade_date -> partition path for every materialized date in [start, end] (directory listing only)."""
+    if not os.path.isdir(FEATURE_STORE_DIR):
+        return {}
+    found = {}
+    for entry in os.scandir(FEATURE_STORE_DIR):
+        if not entry.name.endswith(".parquet"):
+            continue
+        trade_date = entry.name[:10]
+        if start_date <= trade_date <= end_date:
+            found[trade_date] = entry.path
+    return found
+
+
+def has_partition(trade_date) -> bool:
+    """True when trade_date has a materialized partition (directory listing only)."""
+    trade_date = _iso(trade_date)
+    return trade_date in _partitions(trade_date, trade_date)
+
+
+def build_partition(trade_date: str, fingerprint: str, force: bool = False) -> Optional[str]:
+    """Materialize one closed date. Returns the partition path (None if not persisted)."""
+    if not PARQUET_AVAILABLE or not _is_closed(trade_date):
+        return None
+    path = _partition_path(trade_date, fingerprint)
+    with _build_lock:
+        if os.path.exists(path) and not force:
+            return path
+        os.makedirs(FEATURE_STORE_DIR, exist_ok=True)
+        # pivoted once into Parquet; no point caching the long rows too
+        wide = _pivot_date(trade_date, ttl=0)
+        tmp = f"{path}.tmp"
+        wide.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        # drop partitions built from an older version of this date's features
+        for name in os.listdir(FEATURE_STORE_DIR):
+            stale = os.path.join(FEATURE_STORE_DIR, name)
+            if name.startswith(f"{trade_date}_") and name.endswith(".parquet") and stale != path:
+                os.remove(stale)
+    return path
+
+
+def load_matrix(path: str, features: Optional[List[str]] = None,
+                symbols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Wide matrix from one partition (symbol column + feature columns), optionally
+    projected to `features` and filtered to `symbols`.
+    """
+    columns = None
+    if features is not None:
+        import pyarrow.parquet as pq
+        available = set(pq.read_schema(path, memory_map=True).names)
+        columns = ["symbol"] + [f for f in features if f in available]
+    filters = [("symbol", "in", list(symbols))] if symbols else None
+    wide = pd.read_parquet(path, columns=columns, filters=filters, memory_map=True)
+    if symbols:
+        wide = wide[wide["symbol"].isin(symbols)]
+    return wide.reset_index(drop=True)
+
+
+def feature_matrix(trade_date, features: Optional[List[str]] = None) -> pd.DataFrame:
+    """Wide matrix for trade_date indexed by symbol (empty if the date has no features)."""
+    trade_date = _iso(trade_date)
+    path = _partitions(trade_date, trade_date).get(trade_date)
+    if path is not None:
+        wide = load_matrix(path, features=features)
+    else:
+        wide = _pivot_date(trade_date)
+        if features is not None:
+            wide = wide[["symbol"] + [f for f in features if f in wide.columns]]
+    if wide.empty:
+        return pd.DataFrame()
+    return wide.set_index("symbol")
+
+
+def _history_from_rows(symbol: str, start_date: str, end_date: str, features: Optional[List[str]],
+                       skip_dates: List[str]) -> pd.DataFrame:
+    """The symbol's EAV rows in range, except skip_dates, pivoted to index=trade_date."""
+    params = {"symbol": symbol, "start_date": start_date, "end_date": end_date}
+    where = ["symbol = :symbol", "trade_date BETWEEN :start_date AND :end_date"]
+    if features:
+        where.append("feature_name IN ({})".format(", ".join(f":f{i}" for i in range(len(features)))))
+        params.update({f"f{i}": f for i, f in enumerate(features)})
+    if skip_dates:
+        where.append("trade_date NOT IN ({})".format(", ".join(f":d{i}" for i in range(len(skip_dates)))))
+        params.update({f"d{i}": d for i, d in enumerate(skip_dates)})
+    q = f"""
+    SELECT trade_date, feature_name, value
+    FROM strategy_features
+    WHERE {" AND ".join(where)}
+    """
+    df = read_sql("intraday", q, params=params)
+    if df.empty:
+        return pd.DataFrame()
+    df["trade_date"] = pd.to_datetime(df["trade_date"])
+    return _pivot_rows(df, "trade_date")
+
+
+def symbol_history(symbol: str, start_date, end_date, features: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Feature time series for one symbol: index=trade_date (datetime), columns=features.
+    Reads the symbol's row from each materialized date; other dates come from the EAV rows.
+    """
+    start_date, end_date = _iso(start_date), _iso(end_date)
+    partitions = _partitions(start_date, end_date)
+    frames = []
+    for trade_date, path in sorted(partitions.items()):
+        row = load_matrix(path, features=features, symbols=[symbol])
+        if not row.empty:
+            frames.append(row.drop(columns=["symbol"]).assign(trade_date=pd.Timestamp(trade_date)).set_index("trade_date"))
+    rest = _history_from_rows(symbol, start_date, end_date, features, sorted(partitions))
+    if not rest.empty:
+        frames.append(rest)
+    if not frames:
+        return pd.DataFrame()
+    out = pd.concat(frames).sort_index()
+    # features absent on every date in range are not columns at all
+    return out.dropna(axis=1, how="all")
+
+
+def backfill(start_date: str, end_date: str, force: bool = False) -> int:
+    """Materialize every closed date in range whose content changed. Returns partitions written or verified."""
+    dates = date_fingerprints(start_date, end_date)
+    # dates whose features were deleted
+    for trade_date, path in _partitions(start_date, end_date).items():
+        if trade_date not in set(dates["trade_date"]):
+            os.remove(path)
+    built = 0
+    for trade_date, fingerprint in zip(dates["trade_date"], dates["fingerprint"]):
+        if build_partition(trade_date, fingerprint, force=force):
+            built += 1
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Materialize strategy_features into per-date Parquet matrices")
+    parser.add_argument("--from", dest="start_date", required=True)
+    parser.add_argument("--to", dest="end_date", required=True)
+    parser.add_argument("--force", action="store_true", help="Rebuild partitions that already exist")
+    args = parser.parse_args()
+    if not PARQUET_AVAILABLE:
+        parser.error("pyarrow is required for the feature store (pip install pyarrow)")
+    n = backfill(args.start_date, args.end_date, force=args.force)
+    print(f"[feature_store] {n} partitions ready in {FEATURE_STORE_DIR}")
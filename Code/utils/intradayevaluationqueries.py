@@ -1,17 +1,13 @@
 from typing import List, Dict, Any, Optional
 from Code.utils.db import read_sql
 import pandas as pd
-import math
 
-def get_signals_with_eval(engine_key: str, trade_date: str, eval_tag: str,
-                          limit: Optional[int]=None, offset: Optional[int]=0,
-                          filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """
-    Returns joined rows and meta aggregates.
-    Uses the exact SQL provided in the spec.
-    """
-    base_sql = """
-    SELECT
+def _nan_to_none(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized NaN/NaT -> None (object dtype) so records are JSON/UI friendly."""
+    return df.astype(object).where(df.notna(), None)
+
+
+SIGNAL_EVAL_COLUMNS = """
       s.id AS signal_id,
       s.symbol,
       s.trade_date,
@@ -40,82 +36,128 @@ def get_signals_with_eval(engine_key: str, trade_date: str, eval_tag: str,
       e.ambiguous_flag,
       e.notes AS eval_notes,
       e.created_at AS eval_created_at
-    FROM strategy_signals s
-    LEFT JOIN signal_evaluation_results e
-      ON e.signal_id = s.id AND e.eval_run_tag = :eval_tag
-    WHERE s.trade_date = :trade_date
-    -- optional filters appended by caller: strategy / label / min_score / symbol LIKE
-    ORDER BY s.signal_score DESC
-    LIMIT :limit OFFSET :offset;
+"""
+
+# Keyset sort key: signal_score DESC (NULL scores last), then id DESC as tiebreaker
+_NULL_SCORE_SENTINEL = -1e18
+
+_META_COUNT_KEYS = ("total_rows", "wins", "losses", "neutral", "ambiguous")
+
+
+def _signal_eval_filters(filters: Optional[Dict[str, Any]], params: Dict[str, Any]) -> List[str]:
+    """WHERE predicates (and their params) for the UI filters on the signals+eval join."""
+    where = ["s.trade_date = :trade_date"]
+    if not filters:
+        return where
+    if filters.get("strategy"):
+        where.append("s.strategy = :f_strategy"); params["f_strategy"] = filters["strategy"]
+    if "label_outcome" in filters and filters["label_outcome"] is not None:
+        if filters["label_outcome"].upper() == "NOT_EVALUATED":
+            where.append("e.label_outcome IS NULL")
+        else:
+            where.append("e.label_outcome = :f_label"); params["f_label"] = filters["label_outcome"]
+    if "min_signal_score" in filters and filters["min_signal_score"] is not None:
+        where.append("s.signal_score >= :f_min_score"); params["f_min_score"] = filters["min_signal_score"]
+    if filters.get("symbol_search"):
+        where.append("s.symbol LIKE :f_symbol_search"); params["f_symbol_search"] = f"%{filters['symbol_search']}%"
+    return where
+
+
+def _signal_eval_query(where: List[str], keyset: bool) -> str:
+    """
+    One statement for a page of rows plus the aggregates of the whole filtered set:
+      base -> filtered join (scanned once), agg -> one aggregate row over base,
+      page -> keyset (or offset) slice of base. agg LEFT JOIN page keeps meta
+      available even when the page is empty.
+    """
+    page_where = "WHERE (_sort_score < :after_score OR (_sort_score = :after_score AND signal_id < :after_id))" if keyset else ""
+    page_offset = "" if keyset else "OFFSET :offset"
+    return f"""
+    WITH base AS (
+      SELECT
+      {SIGNAL_EVAL_COLUMNS},
+      COALESCE(s.signal_score, {_NULL_SCORE_SENTINEL}) AS _sort_score
+      FROM strategy_signals s
+      LEFT JOIN signal_evaluation_results e
+        ON e.signal_id = s.id AND e.eval_run_tag = :eval_tag
+      WHERE {" AND ".join(where)}
+    ),
+    agg AS (
+      SELECT
+        COUNT(*) AS _agg_total_rows,
+        SUM(CASE WHEN label_outcome = 'win' THEN 1 ELSE 0 END) AS _agg_wins,
+        SUM(CASE WHEN label_outcome = 'loss' THEN 1 ELSE 0 END) AS _agg_losses,
+        SUM(CASE WHEN label_outcome = 'neutral' THEN 1 ELSE 0 END) AS _agg_neutral,
+        SUM(CASE WHEN ambiguous_flag = 1 THEN 1 ELSE 0 END) AS _agg_ambiguous,
+        AVG(realized_return) AS _agg_avg_realized_return
+      FROM base
+    ),
+    page AS (
+      SELECT *
+      FROM base
+      {page_where}
+      ORDER BY _sort_score DESC, signal_id DESC
+      LIMIT :limit {page_offset}
+    )
+    SELECT agg.*, page.*
+    FROM agg
+    LEFT JOIN page ON TRUE
+    ORDER BY page._sort_score DESC, page.signal_id DESC;
+    """
+
+
+def get_signals_with_eval(engine_key: str, trade_date: str, eval_tag: str,
+                          limit: Optional[int]=None, offset: Optional[int]=0,
+                          filters: Optional[Dict[str, Any]] = None,
+                          as_frame: bool = False,
+                          after: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Returns joined rows and meta aggregates from a single query.
+    as_frame=True returns "rows" as the DataFrame itself (no per-row dicts).
+
+    Paging: pass meta["next_cursor"] back as `after` for the next page (keyset;
+    cost does not grow with depth). `offset` is still honoured when `after` is None.
     """
     if limit is None:
         limit = 1000
     if offset is None:
         offset = 0
-    params = {"eval_tag": eval_tag, "trade_date": trade_date, "limit": limit, "offset": offset}
-
-    extra_where = []
-    if filters:
-        if filters.get("strategy"):
-            extra_where.append("s.strategy = :f_strategy"); params["f_strategy"] = filters["strategy"]
-        if "label_outcome" in filters and filters["label_outcome"] is not None:
-            if filters["label_outcome"].upper() == "NOT_EVALUATED":
-                extra_where.append("e.label_outcome IS NULL")
-            else:
-                extra_where.append("e.label_outcome = :f_label"); params["f_label"] = filters["label_outcome"]
-        if "min_signal_score" in filters and filters["min_signal_score"] is not None:
-            extra_where.append("s.signal_score >= :f_min_score"); params["f_min_score"] = filters["min_signal_score"]
-        if filters.get("symbol_search"):
-            extra_where.append("s.symbol LIKE :f_symbol_search"); params["f_symbol_search"] = f"%{filters['symbol_search']}%"
-
-    if extra_where:
-        and_clause = " AND " + " AND ".join(extra_where)
-        sql = base_sql.replace("-- optional filters appended by caller: strategy / label / min_score / symbol LIKE", and_clause)
+    params = {"eval_tag": eval_tag, "trade_date": trade_date, "limit": limit}
+    where = _signal_eval_filters(filters, params)
+
+    keyset = after is not None
+    if keyset:
+        params["after_score"] = after["score"]
+        params["after_id"] = after["signal_id"]
     else:
-        sql = base_sql.replace("-- optional filters appended by caller: strategy / label / min_score / symbol LIKE", "")
+        params["offset"] = offset
 
-    df = read_sql(engine_key, sql, params=params)
+    df = read_sql(engine_key, _signal_eval_query(where, keyset), params=params)
 
-    def _to_native(val):
-        if isinstance(val, float) and math.isnan(val):
-            return None
-        return val
+    agg_cols = [c for c in df.columns if c.startswith("_agg_")]
+    agg = df.iloc[0] if not df.empty else pd.Series(dtype=object)
+    page = df[df["signal_id"].notna()] if not df.empty else df
+    page = page.drop(columns=agg_cols + ["_sort_score"], errors="ignore").reset_index(drop=True)
 
-    rows = []
-    for _, r in df.iterrows():
-        row = {col: _to_native(r[col]) for col in df.columns}
-        rows.append(row)
+    next_cursor = None
+    if len(page) == limit:
+        last = df.loc[df["signal_id"].notna()].iloc[-1]
+        next_cursor = {"score": float(last["_sort_score"]), "signal_id": int(last["signal_id"])}
 
-    # aggregates
-    agg_sql = """
-    SELECT
-      COUNT(*) AS total_rows,
-      SUM(CASE WHEN e.label_outcome = 'win' THEN 1 ELSE 0 END) AS wins,
-      SUM(CASE WHEN e.label_outcome = 'loss' THEN 1 ELSE 0 END) AS losses,
-      SUM(CASE WHEN e.label_outcome = 'neutral' THEN 1 ELSE 0 END) AS neutral,
-      SUM(CASE WHEN e.ambiguous_flag = 1 THEN 1 ELSE 0 END) AS ambiguous,
-      AVG(e.realized_return) AS avg_realized_return
-    FROM strategy_signals s
-    LEFT JOIN signal_evaluation_results e
-      ON e.signal_id = s.id AND e.eval_run_tag = :eval_tag
-    WHERE s.trade_date = :trade_date
-    """
-    if extra_where:
-        agg_sql = agg_sql + and_clause + ";"
-    else:
-        agg_sql = agg_sql + ";"
+    def _count(key):
+        val = agg.get(f"_agg_{key}")
+        return int(val) if val is not None and pd.notna(val) else 0
 
-    agg_df = read_sql(engine_key, agg_sql, params={k:v for k,v in params.items() if k in ("eval_tag","trade_date") or k.startswith("f_")})
+    avg_rr = agg.get("_agg_avg_realized_return")
     meta = {
         "trade_date": trade_date,
         "eval_run_tag": eval_tag,
-        "total_rows": int(agg_df.at[0, "total_rows"]) if not agg_df.empty and agg_df.at[0, "total_rows"] is not None else 0,
-        "wins": int(agg_df.at[0, "wins"]) if not agg_df.empty and agg_df.at[0, "wins"] is not None else 0,
-        "losses": int(agg_df.at[0, "losses"]) if not agg_df.empty and agg_df.at[0, "losses"] is not None else 0,
-        "neutral": int(agg_df.at[0, "neutral"]) if not agg_df.empty and agg_df.at[0, "neutral"] is not None else 0,
-        "ambiguous": int(agg_df.at[0, "ambiguous"]) if not agg_df.empty and agg_df.at[0, "ambiguous"] is not None else 0,
-        "avg_realized_return": None if agg_df.empty or agg_df.at[0, "avg_realized_return"] is None else float(agg_df.at[0, "avg_realized_return"])
+        **{key: _count(key) for key in _META_COUNT_KEYS},
+        "avg_realized_return": None if avg_rr is None or pd.isna(avg_rr) else float(avg_rr),
+        "next_cursor": next_cursor,
     }
+
+    rows = page if as_frame else _nan_to_none(page).to_dict("records")
     return {"meta": meta, "rows": rows}
 
 
@@ -142,22 +184,17 @@ def diff_tags_summary(engine_key: str, trade_date: str, base_tag: str, compare_t
     WHERE s.trade_date = :trade_date;
     """
     df = read_sql(engine_key, q, params={"base_tag": base_tag, "compare_tag": compare_tag, "trade_date": trade_date})
-    df = df.where(pd.notnull(df), None)
+
+    base, cmp = df["base_label"], df["cmp_label"]
+    # two missing labels count as unchanged (None == None)
+    changed = (base != cmp) & ~(base.isna() & cmp.isna())
+    diff = df.loc[changed, ["signal_id", "symbol", "base_label", "cmp_label"]]
+    diff = diff.rename(columns={"base_label": "base", "cmp_label": "cmp"})
+    diff["signal_id"] = diff["signal_id"].astype(int)
+    changes = _nan_to_none(diff).to_dict("records")
 
     total = int(len(df))
-    changes = []
-    changed_count = 0
-    for _, r in df.iterrows():
-        base = r["base_label"]
-        cmp = r["cmp_label"]
-        if base != cmp:
-            changed_count += 1
-            changes.append({
-                "signal_id": int(r["signal_id"]),
-                "symbol": r["symbol"],
-                "base": base,
-                "cmp": cmp
-            })
+    changed_count = len(changes)
     return {
         "trade_date": trade_date,
         "base_tag": base_tag,
@@ -0,0 +1,115 @@
+#IntradayTradeStockAnalyser/backend/api/diagnostics.py
+import logging
+
+from fastapi import APIRouter
+from fastapi.responses import (
+    JSONResponse,
+    PlainTextResponse
+)
+
+from backend.utils.debug_logger import (
+    get_log_levels,
+    set_log_level,
+)
+
+from backend.utils.stage_timer import (
+    StageMetrics
+)
+
+from backend.utils.database import (
+    get_pool_status
+)
+
+
+router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = (
+    "text/plain; version=0.0.4; charset=utf-8"
+)
+
+VALID_LOG_LEVELS = {
+    "DEBUG",
+    "INFO",
+    "WARNING",
+    "ERROR",
+    "CRITICAL",
+    "NOTSET",
+}
+
+
+@router.get("/api/v1/diagnostics/log-levels")
+async def get_logging_levels():
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "success",
+            "log_levels": get_log_levels()
+        }
+    )
+
+
+@router.put("/api/v1/diagnostics/log-levels")
+async def update_logging_level(
+    logger_name: str,
+    level: str
+):
+
+    level = level.upper()
+
+    if level not in VALID_LOG_LEVELS:
+
+        return JSONResponse(
+            status_code=400,
+            content={
+                "status": "error",
+                "message": f"Invalid log level: {level}"
+            }
+        )
+
+    set_log_level(
+        logger_name,
+        level
+    )
+
+    logger.info(
+        "Log level changed logger=%s level=%s",
+        logger_name,
+        level,
+    )
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "success",
+            "log_levels": get_log_levels()
+        }
+    )
+
+
+def render_pool_metrics() -> str:
+
+    lines = []
+
+    for key, value in get_pool_status().items():
+
+        metric = f"db_pool_{key}"
+
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics")
+async def get_metrics():
+
+    return PlainTextResponse(
+        content=(
+            StageMetrics.render_prometheus()
+            + render_pool_metrics()
+        ),
+        media_type=PROMETHEUS_CONTENT_TYPE
+    )
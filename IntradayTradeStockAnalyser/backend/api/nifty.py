@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import (
     APIRouter,
     Depends
@@ -19,6 +21,8 @@ from backend.utils.deps import (
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 
 @router.get("/api/v1/nifty/candles")
 async def get_nifty_candles(
@@ -28,12 +32,9 @@ async def get_nifty_candles(
 
     try:
 
-        print(
-            "\n===== FETCHING NIFTY CANDLES ====="
-        )
-
-        print(
-            f"Trade Date: {trade_date}"
+        logger.info(
+            "Fetching NIFTY candles trade_date=%s",
+            trade_date,
         )
 
         candles = (
@@ -44,12 +45,11 @@ async def get_nifty_candles(
             )
         )
 
-        print(
-            f"Total Candles: {len(candles)}"
+        logger.debug(
+            "Total NIFTY candles: %d",
+            len(candles),
         )
 
-        print("==================================\n")
-
         return JSONResponse(
             status_code=200,
             content={
@@ -60,14 +60,11 @@ async def get_nifty_candles(
 
     except Exception as error:
 
-        print(
-            "\n===== NIFTY API FAILED ====="
+        logger.exception(
+            "NIFTY API failed trade_date=%s",
+            trade_date,
         )
 
-        print(str(error))
-
-        print("================================\n")
-
         return JSONResponse(
             status_code=500,
             content={
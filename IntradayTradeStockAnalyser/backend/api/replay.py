@@ -1,4 +1,6 @@
 #IntradayTradeStockAnalyser/backend/api/replay.py
+import logging
+
 from fastapi import (
     APIRouter,
     Depends
@@ -20,6 +22,8 @@ from backend.utils.deps import (
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 
 @router.get("/api/v1/replay")
 async def get_replay_data(
@@ -30,16 +34,10 @@ async def get_replay_data(
 
     try:
 
-        print(
-            "\n===== FETCHING REPLAY DATA ====="
-        )
-
-        print(
-            f"Trade Date: {trade_date}"
-        )
-
-        print(
-            f"Stock: {stock}"
+        logger.info(
+            "Fetching replay data trade_date=%s stock=%s",
+            trade_date,
+            stock,
         )
 
         replay_data = (
@@ -51,12 +49,10 @@ async def get_replay_data(
             )
         )
 
-        print(
-            "Replay payload generated"
-        )
-
-        print(
-            "================================\n"
+        logger.info(
+            "Replay payload generated trade_date=%s stock=%s",
+            trade_date,
+            stock,
         )
 
         return JSONResponse(
@@ -69,14 +65,10 @@ async def get_replay_data(
 
     except Exception as error:
 
-        print(
-            "\n===== REPLAY API FAILED ====="
-        )
-
-        print(str(error))
-
-        print(
-            "================================\n"
+        logger.exception(
+            "Replay API failed trade_date=%s stock=%s",
+            trade_date,
+            stock,
         )
 
         return JSONResponse(
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
@@ -11,6 +13,8 @@ from  backend.utils.deps import get_db
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 
 @router.get("/api/v1/trades/dates")
 async def get_trade_dates(
@@ -19,21 +23,18 @@ async def get_trade_dates(
 
     try:
 
-        print(
-            "\n===== FETCHING TRADE DATES ====="
-        )
+        logger.info("Fetching trade dates")
 
         dates = (
             TradeService
             .get_trade_dates(db)
         )
 
-        print(
-            f"Total trade dates: {len(dates)}"
+        logger.debug(
+            "Total trade dates: %d",
+            len(dates),
         )
 
-        print("================================\n")
-
         return JSONResponse(
             status_code=200,
             content={
@@ -44,13 +45,7 @@ async def get_trade_dates(
 
     except Exception as error:
 
-        print(
-            "\n===== TRADE DATES API FAILED ====="
-        )
-
-        print(str(error))
-
-        print("==================================\n")
+        logger.exception("Trade dates API failed")
 
         return JSONResponse(
             status_code=500,
@@ -68,12 +63,9 @@ async def get_traded_stocks(
 
     try:
 
-        print(
-            "\n===== FETCHING TRADED STOCKS ====="
-        )
-
-        print(
-            f"Trade Date: {trade_date}"
+        logger.info(
+            "Fetching traded stocks trade_date=%s",
+            trade_date,
         )
 
         stocks = (
@@ -84,12 +76,11 @@ async def get_traded_stocks(
             )
         )
 
-        print(
-            f"Total Stocks: {len(stocks)}"
+        logger.debug(
+            "Total traded stocks: %d",
+            len(stocks),
         )
 
-        print("==================================\n")
-
         return JSONResponse(
             status_code=200,
             content={
@@ -100,14 +91,11 @@ async def get_traded_stocks(
 
     except Exception as error:
 
-        print(
-            "\n===== TRADED STOCK API FAILED ====="
+        logger.exception(
+            "Traded stocks API failed trade_date=%s",
+            trade_date,
         )
 
-        print(str(error))
-
-        print("===================================\n")
-
         return JSONResponse(
             status_code=500,
             content={
@@ -2,15 +2,20 @@
 from fastapi import APIRouter, UploadFile, File
 from fastapi.responses import JSONResponse
 
+import logging
 import os
 import shutil
 import uuid
 
 from  backend.services.upload_service import UploadService
 
+from backend.utils.debug_logger import LazyPformat
+
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 UPLOAD_DIRECTORY = "uploads"
 
 os.makedirs(UPLOAD_DIRECTORY, exist_ok=True)
@@ -35,9 +40,10 @@ async def upload_stock_candles(
         # -----------------------------------
         # DEBUG STEP 1
         # -----------------------------------
-        print("\n========== FILE UPLOAD STARTED ==========")
-
-        print(f"Uploaded filename: {file.filename}")
+        logger.info(
+            "File upload started filename=%s",
+            file.filename,
+        )
 
         # -----------------------------------
         # Generate unique filename
@@ -62,7 +68,10 @@ async def upload_stock_candles(
         # -----------------------------------
         # DEBUG STEP 2
         # -----------------------------------
-        print(f"File saved at: {saved_path}")
+        logger.debug(
+            "File saved at %s",
+            saved_path,
+        )
 
         # -----------------------------------
         # Process upload pipeline
@@ -75,23 +84,22 @@ async def upload_stock_candles(
         # -----------------------------------
         # DEBUG STEP 3
         # -----------------------------------
-        print(
-            f"Total normalized candles: "
-            f"{len(candles)}"
+        logger.info(
+            "File upload succeeded total_candles=%d",
+            len(candles),
         )
 
         # -----------------------------------
         # DEBUG STEP 4
-        # Print first candle
+        # First candle
         # -----------------------------------
 
-        if candles:
+        if candles and logger.isEnabledFor(logging.DEBUG):
 
-            print("First candle:")
-
-            print(candles[0].to_dict())
-
-        print("========== FILE UPLOAD SUCCESS ==========\n")
+            logger.debug(
+                "First candle:\n%s",
+                LazyPformat(candles[0].to_dict()),
+            )
 
         # -----------------------------------
         # API Response
@@ -116,11 +124,10 @@ async def upload_stock_candles(
         # DEBUG STEP 5
         # -----------------------------------
 
-        print("\n========== FILE UPLOAD FAILED ==========")
-
-        print(str(error))
-
-        print("========================================\n")
+        logger.warning(
+            "File upload failed: %s",
+            error,
+        )
 
         return JSONResponse(
             status_code=400,
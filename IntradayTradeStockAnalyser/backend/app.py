@@ -1,5 +1,7 @@
 #IntradayTradeStockAnalyser/backend/app.py
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
 
 from backend.api.upload import (router as upload_router)
 
@@ -7,9 +9,29 @@ from backend.api.trades import ( router as trades_router)
 
 from backend.api.nifty import (router as nifty_router)
 from backend.api.replay import (  router as replay_router)
+from backend.api.diagnostics import (router as diagnostics_router)
 from fastapi.middleware.cors import (    CORSMiddleware)
+
+from backend.utils.debug_logger import (
+    configure_logging,
+    shutdown_logging,
+)
+
+from backend.utils.stage_timer import (
+    format_server_timing,
+    start_request_trace,
+)
+
+# Send this header to get the per-stage
+# breakdown back as Server-Timing
+DEBUG_TIMING_HEADER = "X-Debug-Timing"
+
+configure_logging()
+
 app = FastAPI()
 
+app.add_event_handler("shutdown", shutdown_logging)
+
 app.include_router(upload_router)
 
 app.include_router(replay_router)
@@ -17,6 +39,37 @@ app.include_router(replay_router)
 app.include_router(trades_router)
 
 app.include_router(nifty_router)
+
+app.include_router(diagnostics_router)
+
+
+@app.middleware("http")
+async def stage_timing_middleware(
+    request: Request,
+    call_next
+):
+
+    spans = start_request_trace()
+
+    started_at = time.perf_counter()
+
+    response = await call_next(request)
+
+    if request.headers.get(DEBUG_TIMING_HEADER):
+
+        spans.append(
+            (
+                "total",
+                time.perf_counter() - started_at
+            )
+        )
+
+        response.headers["Server-Timing"] = (
+            format_server_timing(spans)
+        )
+
+    return response
+
 app.add_middleware(
     CORSMiddleware,
 
@@ -31,4 +84,6 @@ app.add_middleware(
     allow_methods=["*"],
 
     allow_headers=["*"],
+
+    expose_headers=["Server-Timing"],
 )
\ No newline at end of file
@@ -1,6 +1,11 @@
 from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
+from backend.utils.time_utils import (
+    format_epoch,
+    to_epoch,
+)
+
 
 @dataclass
 class Candle:
@@ -10,9 +15,13 @@ class Candle:
 
     ALL uploaded candle formats
     must be converted into this structure.
+
+    time is wall-clock epoch seconds;
+    it is only rendered as a string
+    when the candle is serialized.
     """
 
-    time: str
+    time: int
     open: float
     high: float
     low: float
@@ -25,7 +34,11 @@ class Candle:
         Convert candle object to dictionary.
         Useful for API responses and JSON serialization.
         """
-        return asdict(self)
+        data = asdict(self)
+
+        data["time"] = format_epoch(self.time)
+
+        return data
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Candle":
@@ -38,7 +51,7 @@ class Candle:
         """
 
         return Candle(
-            time=str(data.get("time", "")),
+            time=to_epoch(data.get("time")),
             open=float(data.get("open", 0)),
             high=float(data.get("high", 0)),
             low=float(data.get("low", 0)),
@@ -0,0 +1,41 @@
+# IntradayTradeStockAnalyser/backend/models/candle_signals.py
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(slots=True)
+class CandleSignals:
+    """
+    Dense per-candle detector outputs,
+    indexed by candle position.
+
+    Foundational detectors fill these in
+    as they scan; structure detectors read
+    them by index instead of rebuilding
+    timestamp sets from event lists.
+    """
+
+    is_volume_expansion: List[bool]
+
+    volume_ratio: List[float]
+
+    is_relative_strength: List[bool]
+
+    rs_value: List[float]
+
+    is_breakout: List[bool]
+
+    @classmethod
+    def for_candles(
+        cls,
+        candle_count: int,
+    ) -> "CandleSignals":
+
+        return cls(
+            is_volume_expansion=[False] * candle_count,
+            volume_ratio=[0.0] * candle_count,
+            is_relative_strength=[False] * candle_count,
+            rs_value=[0.0] * candle_count,
+            is_breakout=[False] * candle_count,
+        )
@@ -1,25 +1,101 @@
 # IntradayTradeStockAnalyser/backend/models/market_event.py
 
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from backend.constants.event_types import EventType
+from backend.utils.time_utils import format_epoch
 
 
-@dataclass
+# Events are immutable, slotted records.
+# A replay or multi-symbol scan can hold
+# an event for nearly every candle, so no
+# per-instance __dict__ is kept and the
+# repeated context objects / strings are
+# shared instead of copied per event.
+
+
+@dataclass(frozen=True, slots=True)
 class NiftyContext:
     direction: str
     relative_strength_score: float
 
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "direction": self.direction,
+            "relative_strength_score": (
+                self.relative_strength_score
+            ),
+        }
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EventValidation:
     above_vwap: bool
     volume_expansion: bool
     orb_valid: bool
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "above_vwap": self.above_vwap,
+            "volume_expansion": self.volume_expansion,
+            "orb_valid": self.orb_valid,
+        }
+
+
+@lru_cache(maxsize=None)
+def event_validation(
+    above_vwap: bool,
+    volume_expansion: bool,
+    orb_valid: bool,
+) -> EventValidation:
+    """
+    Shared EventValidation instance
+    for each flag combination.
+    """
+
+    return EventValidation(
+        above_vwap=bool(above_vwap),
+        volume_expansion=bool(volume_expansion),
+        orb_valid=bool(orb_valid),
+    )
+
+
+@lru_cache(maxsize=1024)
+def nifty_context(
+    direction: str,
+    relative_strength_score: float,
+) -> NiftyContext:
+    """
+    Shared NiftyContext instance
+    per (direction, score) pair.
+    """
+
+    return NiftyContext(
+        direction=sys.intern(direction),
+        relative_strength_score=(
+            relative_strength_score
+        ),
+    )
+
+
+def intern_text(
+    value: str,
+) -> str:
+    """
+    Intern explanation text that is built
+    at runtime (joined / concatenated), so
+    identical strings share one object.
+    """
+
+    return sys.intern(value)
+
+
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
     id: str
 
@@ -27,7 +103,8 @@ class MarketEvent:
 
     event_type: EventType
 
-    timestamp: str
+    # wall-clock epoch seconds
+    timestamp: int
 
     candle_index: int
 
@@ -43,4 +120,42 @@ class MarketEvent:
 
     trading_implication: str
 
-    event_metadata: Optional[dict] = None
\ No newline at end of file
+    event_metadata: Optional[dict] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        API / payload form of the event.
+        """
+
+        return {
+
+            "id": self.id,
+
+            "stock_symbol": self.symbol,
+
+            "event_type": self.event_type.value,
+
+            "time": format_epoch(self.timestamp),
+
+            "candle_index": self.candle_index,
+
+            "price": self.price,
+
+            "strength_score": self.strength_score,
+
+            "explanation": self.explanation,
+
+            "trading_implication": (
+                self.trading_implication
+            ),
+
+            "event_metadata": self.event_metadata,
+
+            "validation": (
+                self.validation.to_dict()
+            ),
+
+            "nifty_context": (
+                self.nifty_context.to_dict()
+            ),
+        }
@@ -8,20 +8,22 @@ from sqlalchemy.orm import Session
 
 from backend.models.market_event import MarketEvent
 
+from backend.utils.stage_timer import traced
+
+from backend.utils.time_utils import format_epoch
+
 from backend.utils.debug_logger import (
-    log_count,
-    log_error,
-    log_info,
-    log_object,
-    log_step,
+    get_debug_logger,
 )
 
 
+logger = get_debug_logger(__name__)
 
 
 class EventRepository:
 
     @staticmethod
+    @traced("repository.save_market_events")
     def save_market_events(
         db: Session,
         trade_date: str,
@@ -30,18 +32,18 @@ class EventRepository:
 
         try:
 
-            log_step(
+            logger.log_step(
                 "SAVING MARKET EVENTS"
             )
 
-            log_count(
+            logger.log_count(
                 "Events To Save",
                 events,
             )
 
             if not events:
 
-                log_info(
+                logger.log_info(
                     "Save Status",
                     "No events available to save"
                 )
@@ -116,7 +118,9 @@ class EventRepository:
 
                     "event_type": event.event_type.value,
 
-                    "candle_time": event.timestamp,
+                    "candle_time": format_epoch(
+                        event.timestamp
+                    ),
 
                     "candle_index": event.candle_index,
 
@@ -163,14 +167,14 @@ class EventRepository:
                     event_payload
                 )
 
-            log_count(
+            logger.log_count(
                 "Prepared DB Payload",
                 values
             )
 
             if values:
 
-                log_object(
+                logger.log_object(
                     "First Event Payload",
                     values[0]
                 )
@@ -180,19 +184,19 @@ class EventRepository:
                 values
             )
 
-            log_info(
+            logger.log_info(
                 "DB Execute Status",
                 "Insert query executed"
             )
 
             db.commit()
 
-            log_info(
+            logger.log_info(
                 "DB Commit Status",
                 "Transaction committed successfully"
             )
 
-            log_step(
+            logger.log_step(
                 "MARKET EVENTS SAVED SUCCESSFULLY"
             )
 
@@ -200,10 +204,10 @@ class EventRepository:
 
             db.rollback()
 
-            log_step(
+            logger.log_step(
                 "EVENT SAVE FAILED"
             )
 
-            log_error(error)
+            logger.log_error(error)
 
             raise
\ No newline at end of file
@@ -5,10 +5,15 @@ from types import SimpleNamespace
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from backend.utils.stage_timer import traced
+
+from backend.utils.time_utils import to_epoch
+
 
 class NiftyRepository:
 
     @staticmethod
+    @traced("repository.get_nifty_candles")
     def get_nifty_candles(
         db: Session,
         trade_date: str
@@ -48,7 +53,7 @@ class NiftyRepository:
 
             candle = SimpleNamespace(
 
-                time=row[0],
+                time=to_epoch(row[0]),
 
                 open=float(row[1]),
 
@@ -3,10 +3,13 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from backend.utils.stage_timer import traced
+
 
 class ReplayRepository:
 
     @staticmethod
+    @traced("repository.get_trade_metadata")
     def get_trade_metadata(
         db: Session,
         trade_date: str,
@@ -69,6 +72,7 @@ class ReplayRepository:
         }
 
     @staticmethod
+    @traced("repository.get_market_context")
     def get_market_context(
         db: Session,
         trade_date: str
@@ -135,6 +139,7 @@ class ReplayRepository:
         }
 
     @staticmethod
+    @traced("repository.get_market_behavior")
     def get_market_behavior(
         db: Session,
         trade_date: str
@@ -181,6 +186,7 @@ class ReplayRepository:
         }
 
     @staticmethod
+    @traced("repository.get_market_open_behavior")
     def get_market_open_behavior(
         db: Session,
         trade_date: str
@@ -261,6 +267,7 @@ class ReplayRepository:
         }
 
     @staticmethod
+    @traced("repository.get_execution_control")
     def get_execution_control(
         db: Session,
         trade_date: str
@@ -314,6 +321,7 @@ class ReplayRepository:
         }
 
     @staticmethod
+    @traced("repository.get_stock_selection_context")
     def get_stock_selection_context(
         db: Session,
         trade_date: str,
@@ -426,6 +434,7 @@ class ReplayRepository:
         }
 
     @staticmethod
+    @traced("repository.get_trade_construction")
     def get_trade_construction(
         db: Session,
         trade_date: str,
@@ -2,10 +2,13 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from backend.utils.stage_timer import traced
+
 
 class TradeRepository:
 
     @staticmethod
+    @traced("repository.get_trade_dates")
     def get_trade_dates(db: Session):
 
         query = text("""
@@ -27,6 +30,7 @@ class TradeRepository:
 
         return dates
     @staticmethod
+    @traced("repository.get_traded_stocks")
     def get_traded_stocks(db: Session, trade_date: str):
 
         query = text("""
@@ -22,6 +22,8 @@ from backend.services.ai_explanation.nifty_relationship_explainer import (
     build_nifty_relationship_analysis,
 )
 
+from backend.utils.stage_timer import trace_stage
+
 
 class ExplanationEngine:
     """
@@ -48,51 +50,61 @@ class ExplanationEngine:
         # CANDLE EXPLANATIONS
         # =====================================================
 
-        candle_explanations = (
-            build_candle_explanations(
-                replay_payload
+        with trace_stage("explanation.candle"):
+
+            candle_explanations = (
+                build_candle_explanations(
+                    replay_payload
+                )
             )
-        )
 
         # =====================================================
         # STRATEGY EXPLANATIONS
         # =====================================================
 
-        strategy_explanations = (
-            build_strategy_explanations(
-                replay_payload
+        with trace_stage("explanation.strategy"):
+
+            strategy_explanations = (
+                build_strategy_explanations(
+                    replay_payload
+                )
             )
-        )
 
         # =====================================================
         # TIMELINE NARRATION
         # =====================================================
 
-        timeline_narration = (
-            build_timeline_narration(
-                replay_payload
+        with trace_stage("explanation.timeline"):
+
+            timeline_narration = (
+                build_timeline_narration(
+                    replay_payload
+                )
             )
-        )
 
         # =====================================================
         # TRADE COACHING
         # =====================================================
 
-        trade_coaching = (
-            build_trade_coaching(
-                replay_payload
+        with trace_stage("explanation.trade_coach"):
+
+            trade_coaching = (
+                build_trade_coaching(
+                    replay_payload
+                )
             )
-        )
 
         # =====================================================
         # NIFTY RELATIONSHIP ANALYSIS
         # =====================================================
 
-        nifty_relationship_analysis = (
-            build_nifty_relationship_analysis(
-                replay_payload
+        with trace_stage("explanation.nifty_relationship"):
+
+            nifty_relationship_analysis = (
+                build_nifty_relationship_analysis(
+                    replay_payload
+                )
             )
-        )
 
         # =====================================================
         # FINAL EXPLANATION CONTEXT
@@ -3,11 +3,14 @@
 from typing import List
 
 from backend.constants.event_types import EventType
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    intern_text,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 
 LOOKBACK_PERIOD = 5
@@ -20,26 +23,16 @@ MIN_CLOSE_NEAR_HIGH = 0.7
 def detect_breakout_events(
     candles: List,
     symbol: str,
-    volume_events: List[MarketEvent],
-    relative_strength_events: List[MarketEvent],
+    signals: CandleSignals,
 ) -> List[MarketEvent]:
+    """
+    Reads volume / relative strength flags
+    from signals and publishes is_breakout
+    for the downstream structure detectors.
+    """
 
     detected_events: List[MarketEvent] = []
 
-    volume_event_timestamps = {
-        event.timestamp
-        for event in volume_events
-    }
-
-    relative_strength_timestamps = {
-        event.timestamp
-        for event in relative_strength_events
-        if (
-            event.event_type
-            == EventType.RELATIVE_STRENGTH
-        )
-    }
-
     if len(candles) <= LOOKBACK_PERIOD:
         return detected_events
 
@@ -113,15 +106,15 @@ def detect_breakout_events(
             continue
 
         has_volume_expansion = (
-            str(current_candle.time)
-            in volume_event_timestamps
+            signals.is_volume_expansion[index]
         )
 
         has_relative_strength = (
-            str(current_candle.time)
-            in relative_strength_timestamps
+            signals.is_relative_strength[index]
         )
 
+        signals.is_breakout[index] = True
+
         strength_score = 50
 
         if above_vwap:
@@ -159,16 +152,14 @@ def detect_breakout_events(
             MarketEvent(
                 id=(
                     f"{symbol}_BREAKOUT_"
-                    f"{current_candle.time}"
+                    f"{format_epoch(current_candle.time)}"
                 ),
 
                 symbol=symbol,
 
                 event_type=EventType.BREAKOUT,
 
-                timestamp=str(
-                    current_candle.time
-                ),
+                timestamp=current_candle.time,
 
                 candle_index=index,
 
@@ -179,7 +170,7 @@ def detect_breakout_events(
                     2,
                 ),
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction="NEUTRAL",
                     relative_strength_score=(
                         1 if has_relative_strength
@@ -187,7 +178,7 @@ def detect_breakout_events(
                     ),
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=above_vwap,
 
                     volume_expansion=(
@@ -197,7 +188,7 @@ def detect_breakout_events(
                     orb_valid=False,
                 ),
 
-                explanation=(
+                explanation=intern_text(
                     " ".join(explanation_parts)
                 ),
 
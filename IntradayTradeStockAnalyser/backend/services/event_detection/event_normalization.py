@@ -1,8 +1,14 @@
 #/IntradayTradeStockAnalyser/backend/services/event_detection/event_normalization.py
 
+import sys
+from dataclasses import replace
 from typing import List
 
-from backend.models.market_event import MarketEvent
+from backend.constants.event_types import EventType
+from backend.models.market_event import (
+    MarketEvent,
+    intern_text,
+)
 
 
 DEFAULT_EXPLANATION = (
@@ -13,6 +19,17 @@ DEFAULT_TRADING_IMPLICATION = (
     "Monitor price behavior for confirmation."
 )
 
+EVENT_CATEGORY_LABELS = {
+
+    event_type: sys.intern(
+        event_type.value
+        .replace("_", " ")
+        .title()
+    )
+
+    for event_type in EventType
+}
+
 
 def normalize_market_events(
     events: List[MarketEvent],
@@ -39,48 +56,52 @@ def normalize_event(
     event: MarketEvent,
 ) -> MarketEvent:
 
-    if not event.explanation:
-        event.explanation = (
-            DEFAULT_EXPLANATION
-        )
-
-    if not event.trading_implication:
-        event.trading_implication = (
-            DEFAULT_TRADING_IMPLICATION
-        )
-
-    if event.strength_score < 0:
-        event.strength_score = 0
-
-    if event.strength_score > 100:
-        event.strength_score = 100
+    explanation = (
+        event.explanation
+        or DEFAULT_EXPLANATION
+    )
 
-    if event.event_metadata is None:
-        event.event_metadata = {}
+    trading_implication = (
+        event.trading_implication
+        or DEFAULT_TRADING_IMPLICATION
+    )
 
-    event.explanation = (
-        event.explanation.strip()
+    strength_score = min(
+        max(event.strength_score, 0),
+        100,
     )
 
-    event.trading_implication = (
-        event.trading_implication.strip()
+    event_metadata = dict(
+        event.event_metadata or {}
     )
 
-    event.event_metadata[
+    event_metadata[
         "display_priority"
     ] = calculate_display_priority(
-        event.strength_score
+        strength_score
     )
 
-    event.event_metadata[
+    event_metadata[
         "event_category"
-    ] = (
-        event.event_type.value
-        .replace("_", " ")
-        .title()
-    )
+    ] = EVENT_CATEGORY_LABELS[
+        event.event_type
+    ]
 
-    return event
+    return replace(
+        event,
+
+        explanation=intern_text(
+            explanation.strip()
+        ),
+
+        trading_implication=intern_text(
+            trading_implication.strip()
+        ),
+
+        strength_score=strength_score,
+
+        event_metadata=event_metadata,
+    )
 
 
 def calculate_display_priority(
@@ -1,5 +1,6 @@
 # backend/services/event_detection/event_validation.py
 
+from operator import attrgetter
 from typing import List
 
 from backend.constants.event_types import EventType
@@ -21,7 +22,7 @@ def validate_market_events(
 
     sorted_events = sorted(
         events,
-        key=lambda event: event.candle_index
+        key=attrgetter("candle_index")
     )
 
     for event in sorted_events:
@@ -1,7 +1,9 @@
 # /IntradayTradeStockAnalyser/backend/services/event_detection/market_event_engine.py
 
+from dataclasses import replace
 from typing import List
 
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import MarketEvent
 
 from backend.services.event_detection.breakout_detector import (
@@ -44,6 +46,8 @@ from backend.services.event_detection.vwap_event_detector import (
     detect_vwap_events,
 )
 
+from backend.utils.stage_timer import trace_stage
+
 
 def generate_market_events(
     stock_candles: List,
@@ -55,67 +59,83 @@ def generate_market_events(
         MarketEvent
     ] = []
 
+    signals = CandleSignals.for_candles(
+        len(stock_candles)
+    )
+
     # -----------------------------------
     # Foundational Intelligence Layers
     # -----------------------------------
 
-    volume_events = (
-        detect_volume_expansion_events(
-            candles=stock_candles,
-            symbol=symbol,
+    with trace_stage("detector.volume_expansion"):
+
+        volume_events = (
+            detect_volume_expansion_events(
+                candles=stock_candles,
+                symbol=symbol,
+                signals=signals,
+            )
         )
-    )
 
-    relative_strength_events = (
-        detect_relative_strength_events(
-            stock_candles=stock_candles,
-            nifty_candles=nifty_candles,
-            symbol=symbol,
+    with trace_stage("detector.relative_strength"):
+
+        relative_strength_events = (
+            detect_relative_strength_events(
+                stock_candles=stock_candles,
+                nifty_candles=nifty_candles,
+                symbol=symbol,
+                signals=signals,
+            )
         )
-    )
 
-    vwap_events = detect_vwap_events(
-        candles=stock_candles,
-        symbol=symbol,
-    )
+    with trace_stage("detector.vwap"):
+
+        vwap_events = detect_vwap_events(
+            candles=stock_candles,
+            symbol=symbol,
+        )
 
     # -----------------------------------
     # Contextual Structure Engines
     # -----------------------------------
 
-    breakout_events = (
-        detect_breakout_events(
-            candles=stock_candles,
-            symbol=symbol,
-            volume_events=volume_events,
-            relative_strength_events=(
-                relative_strength_events
-            ),
+    with trace_stage("detector.breakout"):
+
+        breakout_events = (
+            detect_breakout_events(
+                candles=stock_candles,
+                symbol=symbol,
+                signals=signals,
+            )
         )
-    )
 
-    orb_events = detect_orb_events(
-        candles=stock_candles,
-        symbol=symbol,
-        breakout_events=breakout_events,
-    )
+    with trace_stage("detector.orb"):
 
-    momentum_events = (
-        detect_momentum_continuation_events(
+        orb_events = detect_orb_events(
             candles=stock_candles,
             symbol=symbol,
-            breakout_events=breakout_events,
-            volume_events=volume_events,
+            signals=signals,
         )
-    )
 
-    pullback_events = (
-        detect_pullback_continuation_events(
-            candles=stock_candles,
-            symbol=symbol,
-            breakout_events=breakout_events,
+    with trace_stage("detector.momentum_continuation"):
+
+        momentum_events = (
+            detect_momentum_continuation_events(
+                candles=stock_candles,
+                symbol=symbol,
+                signals=signals,
+            )
+        )
+
+    with trace_stage("detector.pullback_continuation"):
+
+        pullback_events = (
+            detect_pullback_continuation_events(
+                candles=stock_candles,
+                symbol=symbol,
+                signals=signals,
+            )
         )
-    )
 
     # -----------------------------------
     # Combine All Events
@@ -147,33 +167,45 @@ def generate_market_events(
     # Validation Layer
     # -----------------------------------
 
-    validated_events = (
-        validate_market_events(
-            all_events
+    with trace_stage("event_validation"):
+
+        validated_events = (
+            validate_market_events(
+                all_events
+            )
         )
-    )
 
     # -----------------------------------
     # Centralized Scoring
     # -----------------------------------
 
-    for event in validated_events:
+    with trace_stage("event_scoring"):
+
+        validated_events = [
 
-        event.strength_score = (
-            calculate_event_score(
-                event
+            replace(
+                event,
+                strength_score=(
+                    calculate_event_score(
+                        event
+                    )
+                ),
             )
-        )
+
+            for event in validated_events
+        ]
 
     # -----------------------------------
     # Normalization Layer
     # -----------------------------------
 
-    normalized_events = (
-        normalize_market_events(
-            validated_events
+    with trace_stage("event_normalization"):
+
+        normalized_events = (
+            normalize_market_events(
+                validated_events
+            )
         )
-    )
 
     # -----------------------------------
     # Final Event Ordering
@@ -3,11 +3,14 @@
 from typing import List
 
 from backend.constants.event_types import EventType
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    intern_text,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 
 MAX_PULLBACK_PERCENT = 0.5
@@ -18,23 +21,11 @@ MIN_CONTINUATION_BODY_STRENGTH = 0.6
 def detect_momentum_continuation_events(
     candles: List,
     symbol: str,
-    breakout_events: List[MarketEvent],
-    volume_events: List[MarketEvent],
+    signals: CandleSignals,
 ) -> List[MarketEvent]:
 
     detected_events: List[MarketEvent] = []
 
-    breakout_timestamps = {
-        event.timestamp
-        for event in breakout_events
-        if event.event_type == EventType.BREAKOUT
-    }
-
-    volume_event_timestamps = {
-        event.timestamp
-        for event in volume_events
-    }
-
     if len(candles) < 3:
         return detected_events
 
@@ -47,8 +38,7 @@ def detect_momentum_continuation_events(
         continuation_candle = candles[index]
 
         breakout_exists = (
-            str(breakout_candle.time)
-            in breakout_timestamps
+            signals.is_breakout[index - 2]
         )
 
         if not breakout_exists:
@@ -118,8 +108,7 @@ def detect_momentum_continuation_events(
             continue
 
         has_volume_expansion = (
-            str(continuation_candle.time)
-            in volume_event_timestamps
+            signals.is_volume_expansion[index]
         )
 
         strength_score = 60
@@ -154,7 +143,7 @@ def detect_momentum_continuation_events(
             MarketEvent(
                 id=(
                     f"{symbol}_MOMENTUM_CONTINUATION_"
-                    f"{continuation_candle.time}"
+                    f"{format_epoch(continuation_candle.time)}"
                 ),
 
                 symbol=symbol,
@@ -163,9 +152,7 @@ def detect_momentum_continuation_events(
                     EventType.MOMENTUM_CONTINUATION
                 ),
 
-                timestamp=str(
-                    continuation_candle.time
-                ),
+                timestamp=continuation_candle.time,
 
                 candle_index=index,
 
@@ -176,12 +163,12 @@ def detect_momentum_continuation_events(
                     2,
                 ),
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction="BULLISH",
                     relative_strength_score=0,
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=True,
 
                     volume_expansion=(
@@ -191,7 +178,7 @@ def detect_momentum_continuation_events(
                     orb_valid=False,
                 ),
 
-                explanation=(
+                explanation=intern_text(
                     " ".join(explanation_parts)
                 ),
 
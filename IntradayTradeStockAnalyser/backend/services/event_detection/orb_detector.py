@@ -3,11 +3,14 @@
 from typing import List
 
 from backend.constants.event_types import EventType
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    intern_text,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 # 09:15 → 09:45 opening range
 # assuming 5-minute candles for 6 candles in the opening range
@@ -20,7 +23,7 @@ MIN_BODY_STRENGTH = 0.6
 def detect_orb_events(
     candles: List,
     symbol: str,
-    breakout_events: List[MarketEvent],
+    signals: CandleSignals,
 ) -> List[MarketEvent]:
 
     detected_events: List[MarketEvent] = []
@@ -42,12 +45,6 @@ def detect_orb_events(
         for candle in opening_range_candles
     )
 
-    breakout_timestamps = {
-        event.timestamp
-        for event in breakout_events
-        if event.event_type == EventType.BREAKOUT
-    }
-
     for index in range(
         ORB_CANDLE_COUNT,
         len(candles),
@@ -103,8 +100,7 @@ def detect_orb_events(
         implication = ""
 
         breakout_confirmed = (
-            str(current_candle.time)
-            in breakout_timestamps
+            signals.is_breakout[index]
         )
 
         if orb_breakout:
@@ -167,16 +163,14 @@ def detect_orb_events(
             MarketEvent(
                 id=(
                     f"{symbol}_{event_type}_"
-                    f"{current_candle.time}"
+                    f"{format_epoch(current_candle.time)}"
                 ),
 
                 symbol=symbol,
 
                 event_type=event_type,
 
-                timestamp=str(
-                    current_candle.time
-                ),
+                timestamp=current_candle.time,
 
                 candle_index=index,
 
@@ -187,7 +181,7 @@ def detect_orb_events(
                     2,
                 ),
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction=(
                         "BULLISH"
                         if orb_breakout
@@ -197,7 +191,7 @@ def detect_orb_events(
                     relative_strength_score=0,
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=above_vwap,
 
                     volume_expansion=False,
@@ -205,7 +199,9 @@ def detect_orb_events(
                     orb_valid=True,
                 ),
 
-                explanation=explanation,
+                explanation=intern_text(
+                    explanation
+                ),
 
                 trading_implication=implication,
 
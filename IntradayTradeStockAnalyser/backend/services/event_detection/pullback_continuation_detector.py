@@ -3,11 +3,14 @@
 from typing import List
 
 from backend.constants.event_types import EventType
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    intern_text,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 
 MAX_PULLBACK_DEPTH = 0.7
@@ -18,17 +21,11 @@ MIN_RECOVERY_BODY_STRENGTH = 0.6
 def detect_pullback_continuation_events(
     candles: List,
     symbol: str,
-    breakout_events: List[MarketEvent],
+    signals: CandleSignals,
 ) -> List[MarketEvent]:
 
     detected_events: List[MarketEvent] = []
 
-    breakout_timestamps = {
-        event.timestamp
-        for event in breakout_events
-        if event.event_type == EventType.BREAKOUT
-    }
-
     if len(candles) < 4:
         return detected_events
 
@@ -43,8 +40,7 @@ def detect_pullback_continuation_events(
         recovery_candle = candles[index]
 
         breakout_exists = (
-            str(breakout_candle.time)
-            in breakout_timestamps
+            signals.is_breakout[index - 3]
         )
 
         if not breakout_exists:
@@ -155,7 +151,7 @@ def detect_pullback_continuation_events(
             MarketEvent(
                 id=(
                     f"{symbol}_PULLBACK_CONTINUATION_"
-                    f"{recovery_candle.time}"
+                    f"{format_epoch(recovery_candle.time)}"
                 ),
 
                 symbol=symbol,
@@ -164,9 +160,7 @@ def detect_pullback_continuation_events(
                     EventType.PULLBACK_CONTINUATION
                 ),
 
-                timestamp=str(
-                    recovery_candle.time
-                ),
+                timestamp=recovery_candle.time,
 
                 candle_index=index,
 
@@ -177,18 +171,18 @@ def detect_pullback_continuation_events(
                     2,
                 ),
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction="BULLISH",
                     relative_strength_score=0,
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=True,
                     volume_expansion=False,
                     orb_valid=False,
                 ),
 
-                explanation=(
+                explanation=intern_text(
                     " ".join(explanation_parts)
                 ),
 
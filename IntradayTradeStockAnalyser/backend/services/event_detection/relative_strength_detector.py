@@ -3,11 +3,13 @@
 from typing import List
 
 from backend.constants.event_types import EventType
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 
 RELATIVE_STRENGTH_THRESHOLD = 1.0
@@ -32,7 +34,12 @@ def detect_relative_strength_events(
     stock_candles: List,
     nifty_candles: List,
     symbol: str,
+    signals: CandleSignals,
 ) -> List[MarketEvent]:
+    """
+    Publishes rs_value / is_relative_strength
+    into signals for the structure detectors.
+    """
 
     detected_events: List[MarketEvent] = []
 
@@ -60,6 +67,10 @@ def detect_relative_strength_events(
             stock_move - nifty_move
         )
 
+        signals.rs_value[index] = (
+            relative_strength_value
+        )
+
         event_type = None
         explanation = ""
         implication = ""
@@ -73,6 +84,8 @@ def detect_relative_strength_events(
                 EventType.RELATIVE_STRENGTH
             )
 
+            signals.is_relative_strength[index] = True
+
             explanation = (
                 "Stock is outperforming NIFTY "
                 "during the current candle."
@@ -112,16 +125,14 @@ def detect_relative_strength_events(
             MarketEvent(
                 id=(
                     f"{symbol}_{event_type}_"
-                    f"{stock_candle.time}"
+                    f"{format_epoch(stock_candle.time)}"
                 ),
 
                 symbol=symbol,
 
                 event_type=event_type,
 
-                timestamp=str(
-                    stock_candle.time
-                ),
+                timestamp=stock_candle.time,
 
                 candle_index=index,
 
@@ -132,7 +143,7 @@ def detect_relative_strength_events(
                     2
                 ),
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction=(
                         "BULLISH"
                         if nifty_move > 0
@@ -145,7 +156,7 @@ def detect_relative_strength_events(
                     ),
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=False,
                     volume_expansion=False,
                     orb_valid=False,
@@ -3,11 +3,13 @@
 from typing import List
 
 from backend.constants.event_types import EventType
+from backend.models.candle_signals import CandleSignals
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 
 MIN_VOLUME_RATIO = 1.5
@@ -17,7 +19,12 @@ ROLLING_WINDOW = 5
 def detect_volume_expansion_events(
     candles: List,
     symbol: str,
+    signals: CandleSignals,
 ) -> List[MarketEvent]:
+    """
+    Publishes volume_ratio / is_volume_expansion
+    into signals for the structure detectors.
+    """
 
     detected_events: List[MarketEvent] = []
 
@@ -44,9 +51,13 @@ def detect_volume_expansion_events(
             current_candle.volume / average_volume
         )
 
+        signals.volume_ratio[index] = volume_ratio
+
         if volume_ratio < MIN_VOLUME_RATIO:
             continue
 
+        signals.is_volume_expansion[index] = True
+
         strength_score = min(
             round(volume_ratio * 25, 2),
             100
@@ -73,14 +84,14 @@ def detect_volume_expansion_events(
             MarketEvent(
                 id=(
                     f"{symbol}_VOLUME_EXPANSION_"
-                    f"{current_candle.time}"
+                    f"{format_epoch(current_candle.time)}"
                 ),
 
                 symbol=symbol,
 
                 event_type=EventType.VOLUME_EXPANSION,
 
-                timestamp=str(current_candle.time),
+                timestamp=current_candle.time,
 
                 candle_index=index,
 
@@ -88,12 +99,12 @@ def detect_volume_expansion_events(
 
                 strength_score=strength_score,
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction="NEUTRAL",
                     relative_strength_score=0,
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=False,
                     volume_expansion=True,
                     orb_valid=False,
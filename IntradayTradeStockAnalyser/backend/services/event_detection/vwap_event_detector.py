@@ -4,10 +4,11 @@ from typing import List
 
 from backend.constants.event_types import EventType
 from backend.models.market_event import (
-    EventValidation,
     MarketEvent,
-    NiftyContext,
+    event_validation,
+    nifty_context,
 )
+from backend.utils.time_utils import format_epoch
 
 
 def detect_vwap_events(
@@ -129,16 +130,14 @@ def detect_vwap_events(
             MarketEvent(
                 id=(
                     f"{symbol}_{event_type}_"
-                    f"{current_candle.time}"
+                    f"{format_epoch(current_candle.time)}"
                 ),
 
                 symbol=symbol,
 
                 event_type=event_type,
 
-                timestamp=str(
-                    current_candle.time
-                ),
+                timestamp=current_candle.time,
 
                 candle_index=index,
 
@@ -146,12 +145,12 @@ def detect_vwap_events(
 
                 strength_score=strength_score,
 
-                nifty_context=NiftyContext(
+                nifty_context=nifty_context(
                     direction="NEUTRAL",
                     relative_strength_score=0,
                 ),
 
-                validation=EventValidation(
+                validation=event_validation(
                     above_vwap=current_above_vwap,
                     volume_expansion=False,
                     orb_valid=False,
@@ -3,6 +3,10 @@ import pandas as pd
 from typing import List
 
 from backend.models.candle_model import Candle
+from backend.utils.time_utils import (
+    is_market_time,
+    to_epoch,
+)
 
 
 class NormalizationService:
@@ -174,14 +178,14 @@ class NormalizationService:
     def clean_time(value):
         """
         Normalize different broker timestamp formats
-        into standard replay format.
+        into replay epoch seconds.
 
-        Final format:
-        YYYY-MM-DD HH:MM:SS
+        The YYYY-MM-DD HH:MM:SS string form is only
+        produced again when a candle is serialized.
         """
 
         if pd.isna(value):
-            return ""
+            raise ValueError("Missing candle timestamp")
 
         value = str(value).strip()
 
@@ -203,8 +207,8 @@ class NormalizationService:
 
             parsed = pd.to_datetime(value)
 
-            return parsed.strftime(
-                "%Y-%m-%d %H:%M:%S"
+            return to_epoch(
+                parsed.to_pydatetime()
             )
 
         except Exception as error:
@@ -219,11 +223,4 @@ class NormalizationService:
          Keep only valid intraday market candles.
         """
 
-        parsed = pd.to_datetime(timestamp)
-
-        candle_time = parsed.strftime("%H:%M")
-
-        return (
-          candle_time >= "09:15"
-          and candle_time <= "15:15"
-             )
\ No newline at end of file
+        return is_market_time(timestamp)
@@ -19,11 +19,7 @@ from backend.services.replay_narrative_service import (
 )
 
 from backend.utils.debug_logger import (
-    log_count,
-    log_info,
-    log_object,
-    log_step,
-    log_error,
+    get_debug_logger,
 )
 
 from backend.services.market_event_service import (
@@ -34,6 +30,13 @@ from backend.services.ai_explanation.explanation_engine import (
     ExplanationEngine
 )
 
+from backend.utils.stage_timer import trace_stage
+
+from backend.utils.time_utils import format_epoch
+
+
+logger = get_debug_logger(__name__)
+
 
 class ReplayService:
 
@@ -46,16 +49,16 @@ class ReplayService:
 
         try:
 
-            log_step(
+            logger.log_step(
                 "FETCHING REPLAY DATA"
             )
 
-            log_info(
+            logger.log_info(
                 "Trade Date",
                 trade_date
             )
 
-            log_info(
+            logger.log_info(
                 "Stock",
                 stock
             )
@@ -69,7 +72,7 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Trade Metadata",
                 trade_data
             )
@@ -82,14 +85,14 @@ class ReplayService:
                 )
             )
 
-            log_count(
+            logger.log_count(
                 "NIFTY Candles",
                 nifty_candles
             )
 
             if nifty_candles:
 
-                log_object(
+                logger.log_object(
                     "First NIFTY Candle",
                     vars(nifty_candles[0])
                 )
@@ -99,33 +102,35 @@ class ReplayService:
                 .get_stock_candles()
             )
 
-            log_count(
+            logger.log_count(
                 "ReplayStore Stock Candles",
                 stock_candles
             )
 
             if stock_candles:
 
-                log_object(
+                logger.log_object(
                     "First ReplayStore Candle",
                     vars(stock_candles[0])
                 )
 
-            stock_candles = [
+            with trace_stage("serialization.stock_candles"):
 
-                candle.to_dict()
+                stock_candles = [
 
-                for candle in stock_candles
-            ]
+                    candle.to_dict()
 
-            log_count(
+                    for candle in stock_candles
+                ]
+
+            logger.log_count(
                 "Serialized Stock Candles",
                 stock_candles
             )
 
             if stock_candles:
 
-                log_object(
+                logger.log_object(
                     "First Serialized Stock Candle",
                     stock_candles[0]
                 )
@@ -134,7 +139,7 @@ class ReplayService:
             # MARKET EVENT GENERATION
             # =========================================
 
-            log_step(
+            logger.log_step(
                 "GENERATING MARKET EVENTS"
             )
 
@@ -147,76 +152,35 @@ class ReplayService:
                 )
             )
 
-            log_count(
+            logger.log_count(
                 "Generated Market Events",
                 market_events
             )
 
             if market_events:
 
-                log_object(
+                logger.log_object(
                     "First Market Event",
-                    vars(market_events[0])
+                    market_events[0].to_dict()
                 )
 
-            serialized_market_events = [
-
-                {
-
-                    "id": event.id,
-
-                    "stock_symbol": event.symbol,
+            with trace_stage("serialization.market_events"):
 
-                    "event_type": (
-                        event.event_type.value
-                    ),
+                serialized_market_events = [
 
-                    "time": str(
-                        event.timestamp
-                    ),
+                    event.to_dict()
 
-                    "candle_index": (
-                        event.candle_index
-                    ),
-
-                    "price": event.price,
-
-                    "strength_score": (
-                        event.strength_score
-                    ),
-
-                    "explanation": (
-                        event.explanation
-                    ),
-
-                    "trading_implication": (
-                        event.trading_implication
-                    ),
-
-                    "event_metadata": (
-                        event.event_metadata
-                    ),
-
-                    "validation": vars(
-                        event.validation
-                    ),
-
-                    "nifty_context": vars(
-                        event.nifty_context
-                    ),
-                }
-
-                for event in market_events
-            ]
+                    for event in market_events
+                ]
 
-            log_count(
+            logger.log_count(
                 "Serialized Market Events",
                 serialized_market_events
             )
 
             if serialized_market_events:
 
-                log_object(
+                logger.log_object(
                     "First Serialized Market Event",
                     serialized_market_events[0]
                 )
@@ -233,7 +197,7 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Market Context",
                 market_context
             )
@@ -246,7 +210,7 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Market Behavior",
                 market_behavior
             )
@@ -259,7 +223,7 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Market Open Behavior",
                 market_open_behavior
             )
@@ -272,7 +236,7 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Execution Control",
                 execution_control
             )
@@ -286,7 +250,7 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Stock Selection Context",
                 stock_selection_context
             )
@@ -300,45 +264,45 @@ class ReplayService:
                 )
             )
 
-            log_object(
+            logger.log_object(
                 "Trade Construction",
                 trade_construction
             )
 
-            narrative_context = (
-                ReplayNarrativeService
-                .build_replay_narrative(
-                    market_context=market_context,
-                    market_behavior=market_behavior,
-                    market_open_behavior=market_open_behavior,
-                    execution_control=execution_control,
-                    stock_selection_context=stock_selection_context,
-                    trade_construction=trade_construction
+            with trace_stage("narrative"):
+
+                narrative_context = (
+                    ReplayNarrativeService
+                    .build_replay_narrative(
+                        market_context=market_context,
+                        market_behavior=market_behavior,
+                        market_open_behavior=market_open_behavior,
+                        execution_control=execution_control,
+                        stock_selection_context=stock_selection_context,
+                        trade_construction=trade_construction
+                    )
                 )
-            )
 
-            log_object(
+            logger.log_object(
                 "Narrative Context",
                 narrative_context
             )
 
-            serialized_nifty_candles = [
+            with trace_stage("serialization.nifty_candles"):
 
-                {
+                serialized_nifty_candles = [
 
-                    **vars(candle),
+                    {
 
-                    "time": (
-                        candle.time.strftime(
-                            "%Y-%m-%d %H:%M:%S"
+                        **vars(candle),
+
+                        "time": format_epoch(
+                            candle.time
                         )
-                        if candle.time
-                        else None
-                    )
-                }
+                    }
 
-                for candle in nifty_candles
-            ]
+                    for candle in nifty_candles
+                ]
 
             replay_payload = {
 
@@ -346,22 +310,7 @@ class ReplayService:
 
                 "stock_candles": stock_candles,
 
-                "nifty_candles": [
-
-                    {
-                        **vars(candle),
-
-                        "time": (
-                            candle.time.strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            )
-                            if candle.time
-                            else None
-                        )
-                    }
-
-                    for candle in nifty_candles
-                ],
+                "nifty_candles": serialized_nifty_candles,
 
                 # =====================================
                 # MARKET EVENTS
@@ -409,31 +358,31 @@ class ReplayService:
                 "explanation_context"
             ] = explanation_context
 
-            log_step(
+            logger.log_step(
                 "REPLAY PAYLOAD GENERATED"
             )
 
-            log_info(
+            logger.log_info(
                 "Replay Payload Keys",
                 list(replay_payload.keys())
             )
 
-            log_count(
+            logger.log_count(
                 "Replay Payload Stock Candles",
                 replay_payload["stock_candles"]
             )
 
-            log_count(
+            logger.log_count(
                 "Replay Payload NIFTY Candles",
                 replay_payload["nifty_candles"]
             )
 
-            log_count(
+            logger.log_count(
                 "Replay Payload Market Events",
                 replay_payload["market_events"]
             )
 
-            log_object(
+            logger.log_object(
                 "Explanation Context",
                 replay_payload[
                     "explanation_context"
@@ -444,11 +393,11 @@ class ReplayService:
 
         except Exception as error:
 
-            log_step(
+            logger.log_step(
                 "REPLAY API FAILED"
             )
 
-            log_error(error)
+            logger.log_error(error)
 
             raise
 
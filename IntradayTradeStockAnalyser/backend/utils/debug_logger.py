@@ -1,106 +1,353 @@
 # backend/utils/debug_logger.py
 
-from datetime import datetime
+import logging
+import logging.handlers
+import os
+import queue
+from itertools import count
 from pprint import pformat
-import traceback
+from typing import Dict, Optional
 
 
-DEBUG_MODE = True
+ROOT_LOGGER_NAME = "backend"
 
+DEFAULT_LOG_LEVEL = os.getenv(
+    "LOG_LEVEL",
+    "INFO",
+)
 
-def log_step(
-    title: str,
-):
+# Per-module overrides, e.g.
+# "backend.services.replay_service=DEBUG,backend.api=WARNING"
+MODULE_LOG_LEVELS = os.getenv(
+    "LOG_LEVELS",
+    "",
+)
 
-    if not DEBUG_MODE:
-        return
+# Only one in every N payload dumps
+# per label is emitted
+PAYLOAD_SAMPLE_EVERY = max(
+    int(os.getenv("DEBUG_PAYLOAD_SAMPLE_EVERY", "10")),
+    1,
+)
 
-    print("\n" + "=" * 80)
+LOG_FORMAT = (
+    "%(asctime)s %(levelname)s "
+    "[%(name)s] %(message)s"
+)
 
-    print(
-        f"[PHASE3 DEBUG] "
-        f"{title}"
-    )
 
-    print("=" * 80)
+_listener: Optional[
+    logging.handlers.QueueListener
+] = None
 
+_sample_counters: Dict[str, count] = {}
 
-def log_info(
-    label: str,
-    value,
-):
 
-    if not DEBUG_MODE:
-        return
+class LazyPformat:
+    """
+    Defers pformat until a handler
+    actually renders the record.
+    """
 
-    print(
-        f"[INFO] "
-        f"{label}: "
-        f"{value}"
-    )
+    __slots__ = ("obj",)
 
+    def __init__(self, obj):
 
-def log_object(
-    label: str,
-    obj,
-):
-
-    if not DEBUG_MODE:
-        return
+        self.obj = obj
 
-    print(
-        f"\n[OBJECT] "
-        f"{label}"
-    )
+    def __str__(self) -> str:
 
-    print(
-        pformat(
-            obj,
+        return pformat(
+            self.obj,
             indent=2,
             width=120,
         )
-    )
 
 
-def log_count(
-    label: str,
-    items,
+class DeferredQueueHandler(
+    logging.handlers.QueueHandler
 ):
+    """
+    QueueHandler that hands the raw record
+    to the listener thread.
+
+    The stock handler formats the message
+    on the calling thread, which would run
+    every pformat on the request path.
+    """
+
+    def prepare(
+        self,
+        record: logging.LogRecord,
+    ) -> logging.LogRecord:
+
+        return record
+
+
+def configure_logging() -> None:
+    """
+    Route every backend.* logger through
+    a non-blocking queue drained by a
+    background listener thread.
+    """
 
-    if not DEBUG_MODE:
+    global _listener
+
+    if _listener is not None:
         return
 
-    print(
-        f"[COUNT] "
-        f"{label}: "
-        f"{len(items)}"
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+
+    stream_handler.setFormatter(
+        logging.Formatter(LOG_FORMAT)
     )
 
+    root_logger = logging.getLogger(
+        ROOT_LOGGER_NAME
+    )
 
-def log_error(
-    error,
-):
+    root_logger.handlers.clear()
 
-    print("\n" + "!" * 80)
+    root_logger.addHandler(
+        DeferredQueueHandler(log_queue)
+    )
 
-    print(
-        "[PHASE3 ERROR]"
+    root_logger.setLevel(
+        DEFAULT_LOG_LEVEL.upper()
     )
 
-    print(
-        f"Type: "
-        f"{type(error).__name__}"
+    root_logger.propagate = False
+
+    for name, level in parse_module_levels(
+        MODULE_LOG_LEVELS
+    ).items():
+
+        set_log_level(name, level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        stream_handler,
+        respect_handler_level=True,
     )
 
-    print(
-        f"Message: "
-        f"{error}"
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+
+    _listener = None
+
+
+def parse_module_levels(
+    raw_levels: str,
+) -> Dict[str, str]:
+
+    levels = {}
+
+    for entry in raw_levels.split(","):
+
+        if "=" not in entry:
+            continue
+
+        name, level = entry.split("=", 1)
+
+        levels[name.strip()] = (
+            level.strip().upper()
+        )
+
+    return levels
+
+
+def set_log_level(
+    name: str,
+    level: str,
+) -> None:
+    """
+    Change a module's level at runtime.
+    """
+
+    logging.getLogger(name).setLevel(
+        level.upper()
     )
 
-    print(
-        "\nFULL TRACEBACK:\n"
+
+def get_log_levels() -> Dict[str, str]:
+
+    levels = {
+        ROOT_LOGGER_NAME: logging.getLevelName(
+            logging.getLogger(
+                ROOT_LOGGER_NAME
+            ).level
+        )
+    }
+
+    for name, logger in (
+        logging.root.manager.loggerDict.items()
+    ):
+
+        if not name.startswith(
+            ROOT_LOGGER_NAME + "."
+        ):
+            continue
+
+        if not isinstance(
+            logger,
+            logging.Logger,
+        ):
+            continue
+
+        if logger.level == logging.NOTSET:
+            continue
+
+        levels[name] = logging.getLevelName(
+            logger.level
+        )
+
+    return levels
+
+
+def should_sample(
+    label: str,
+) -> bool:
+
+    counter = _sample_counters.get(label)
+
+    if counter is None:
+
+        counter = _sample_counters.setdefault(
+            label,
+            count(),
+        )
+
+    return (
+        next(counter)
+        % PAYLOAD_SAMPLE_EVERY
+        == 0
     )
 
-    traceback.print_exc()
 
-    print("!" * 80)
\ No newline at end of file
+class DebugLogger:
+    """
+    Structured replay debug logger
+    bound to one module.
+
+    Payload dumps are DEBUG level,
+    sampled and lazily formatted, so
+    they cost nothing when disabled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+    ):
+
+        self.logger = logging.getLogger(name)
+
+    def log_step(
+        self,
+        title: str,
+    ):
+
+        self.logger.info(
+            "[STEP] %s",
+            title,
+        )
+
+    def log_info(
+        self,
+        label: str,
+        value,
+    ):
+
+        self.logger.debug(
+            "[INFO] %s: %s",
+            label,
+            value,
+        )
+
+    def log_object(
+        self,
+        label: str,
+        obj,
+    ):
+
+        if not self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            return
+
+        if not should_sample(
+            f"{self.logger.name}:{label}"
+        ):
+            return
+
+        self.logger.debug(
+            "[OBJECT] %s\n%s",
+            label,
+            LazyPformat(obj),
+        )
+
+    def log_count(
+        self,
+        label: str,
+        items,
+    ):
+
+        if not self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            return
+
+        self.logger.debug(
+            "[COUNT] %s: %d",
+            label,
+            len(items),
+        )
+
+    def log_error(
+        self,
+        error,
+    ):
+
+        self.logger.error(
+            "[ERROR] %s: %s",
+            type(error).__name__,
+            error,
+            exc_info=error,
+        )
+
+
+def get_debug_logger(
+    name: str,
+) -> DebugLogger:
+
+    return DebugLogger(name)
+
+
+# -----------------------------------
+# Module-level helpers kept for
+# callers without their own logger
+# -----------------------------------
+
+_default_logger = DebugLogger(
+    ROOT_LOGGER_NAME
+)
+
+log_step = _default_logger.log_step
+
+log_info = _default_logger.log_info
+
+log_object = _default_logger.log_object
+
+log_count = _default_logger.log_count
+
+log_error = _default_logger.log_error
@@ -2,12 +2,9 @@
 from typing import Generator
 from sqlalchemy.orm import Session
 
-from backend.utils.database import SessionLocal
+from backend.utils.database import session_scope
 
 
 def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+    with session_scope() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,260 @@
+# backend/utils/stage_timer.py
+
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+
+# Seconds. Replay stages range from
+# sub-millisecond detectors to
+# multi-second DB round trips.
+HISTOGRAM_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+METRIC_NAME = "replay_stage_duration_seconds"
+
+
+_request_spans: ContextVar[
+    Optional[List[Tuple[str, float]]]
+] = ContextVar(
+    "request_spans",
+    default=None,
+)
+
+
+class StageHistogram:
+    """
+    Cumulative Prometheus-style histogram
+    for a single stage.
+    """
+
+    __slots__ = (
+        "bucket_counts",
+        "count",
+        "total",
+    )
+
+    def __init__(self):
+
+        self.bucket_counts = [0] * len(
+            HISTOGRAM_BUCKETS
+        )
+
+        self.count = 0
+
+        self.total = 0.0
+
+    def observe(
+        self,
+        seconds: float,
+    ):
+
+        position = bisect.bisect_left(
+            HISTOGRAM_BUCKETS,
+            seconds,
+        )
+
+        if position < len(self.bucket_counts):
+            self.bucket_counts[position] += 1
+
+        self.count += 1
+
+        self.total += seconds
+
+
+class StageMetrics:
+
+    _histograms: Dict[str, StageHistogram] = {}
+
+    _lock = Lock()
+
+    @classmethod
+    def observe(
+        cls,
+        stage: str,
+        seconds: float,
+    ):
+
+        with cls._lock:
+
+            histogram = cls._histograms.get(stage)
+
+            if histogram is None:
+
+                histogram = StageHistogram()
+
+                cls._histograms[stage] = histogram
+
+            histogram.observe(seconds)
+
+    @classmethod
+    def reset(cls):
+
+        with cls._lock:
+            cls._histograms = {}
+
+    @classmethod
+    def render_prometheus(cls) -> str:
+
+        lines = [
+            f"# HELP {METRIC_NAME} "
+            "Time spent in each replay pipeline stage.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+
+        with cls._lock:
+
+            for stage in sorted(cls._histograms):
+
+                histogram = cls._histograms[stage]
+
+                cumulative = 0
+
+                for upper_bound, bucket_count in zip(
+                    HISTOGRAM_BUCKETS,
+                    histogram.bucket_counts,
+                ):
+
+                    cumulative += bucket_count
+
+                    lines.append(
+                        f'{METRIC_NAME}_bucket{{stage="{stage}",'
+                        f'le="{upper_bound}"}} {cumulative}'
+                    )
+
+                lines.append(
+                    f'{METRIC_NAME}_bucket{{stage="{stage}",'
+                    f'le="+Inf"}} {histogram.count}'
+                )
+
+                lines.append(
+                    f'{METRIC_NAME}_sum{{stage="{stage}"}} '
+                    f"{histogram.total:.6f}"
+                )
+
+                lines.append(
+                    f'{METRIC_NAME}_count{{stage="{stage}"}} '
+                    f"{histogram.count}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def start_request_trace() -> List[Tuple[str, float]]:
+    """
+    Begin collecting spans for the
+    current request context.
+    """
+
+    spans: List[Tuple[str, float]] = []
+
+    _request_spans.set(spans)
+
+    return spans
+
+
+def get_request_spans() -> List[Tuple[str, float]]:
+
+    return _request_spans.get() or []
+
+
+def format_server_timing(
+    spans: List[Tuple[str, float]],
+) -> str:
+    """
+    Render spans as a Server-Timing
+    header value (durations in ms).
+    """
+
+    totals: Dict[str, float] = {}
+
+    for stage, seconds in spans:
+
+        totals[stage] = (
+            totals.get(stage, 0.0)
+            + seconds
+        )
+
+    return ", ".join(
+
+        f"{stage.replace('.', '_')};"
+        f"dur={seconds * 1000:.2f}"
+
+        for stage, seconds in totals.items()
+    )
+
+
+@contextmanager
+def trace_stage(
+    stage: str,
+):
+    """
+    Time a block and record it both in the
+    global histogram and the request trace.
+    """
+
+    started_at = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+
+        elapsed = (
+            time.perf_counter()
+            - started_at
+        )
+
+        StageMetrics.observe(
+            stage,
+            elapsed,
+        )
+
+        spans = _request_spans.get()
+
+        if spans is not None:
+
+            spans.append(
+                (stage, elapsed)
+            )
+
+
+def traced(
+    stage: str,
+):
+    """
+    Decorator form of trace_stage.
+    """
+
+    def decorator(function):
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+
+            with trace_stage(stage):
+
+                return function(
+                    *args,
+                    **kwargs,
+                )
+
+        return wrapper
+
+    return decorator
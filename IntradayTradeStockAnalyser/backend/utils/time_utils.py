@@ -0,0 +1,93 @@
+# IntradayTradeStockAnalyser/backend/utils/time_utils.py
+
+import calendar
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Union
+
+
+# Candle times are carried internally as
+# integer epoch seconds of the exchange
+# wall-clock time (naive IST encoded as
+# UTC), so no timezone conversion ever
+# happens. Strings only exist at the edges.
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+SECONDS_PER_DAY = 86400
+
+# Minute of day, inclusive (09:15 → 15:15)
+MARKET_START_MINUTE = 9 * 60 + 15
+
+MARKET_END_MINUTE = 15 * 60 + 15
+
+
+def to_epoch(
+    value: Union[int, float, str, datetime, date, None],
+) -> Optional[int]:
+    """
+    Convert a datetime / timestamp string
+    into wall-clock epoch seconds.
+    """
+
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    if isinstance(value, str):
+
+        value = datetime.strptime(
+            value.strip(),
+            TIMESTAMP_FORMAT,
+        )
+
+    elif not isinstance(value, datetime):
+
+        value = datetime(
+            value.year,
+            value.month,
+            value.day,
+        )
+
+    return calendar.timegm(
+        value.timetuple()
+    )
+
+
+@lru_cache(maxsize=4096)
+def format_epoch(
+    epoch: Optional[int],
+) -> Optional[str]:
+    """
+    Render epoch seconds back into the
+    YYYY-MM-DD HH:MM:SS payload format.
+    """
+
+    if epoch is None:
+        return None
+
+    return time.strftime(
+        TIMESTAMP_FORMAT,
+        time.gmtime(epoch),
+    )
+
+
+def minute_of_day(
+    epoch: int,
+) -> int:
+
+    return (epoch % SECONDS_PER_DAY) // 60
+
+
+def is_market_time(
+    epoch: int,
+) -> bool:
+
+    return (
+        MARKET_START_MINUTE
+        <= minute_of_day(epoch)
+        <= MARKET_END_MINUTE
+    )
@@ -1,13 +1,20 @@
-from datetime import datetime
 from typing import List
 
 from backend.models.candle_model import Candle
+from backend.utils.time_utils import (
+    MARKET_END_MINUTE,
+    MARKET_START_MINUTE,
+    format_epoch,
+    minute_of_day,
+)
 
 
 class CandleValidator:
 
-    MARKET_START = "09:15"
-    MARKET_END = "15:15"
+    MARKET_START = MARKET_START_MINUTE
+    MARKET_END = MARKET_END_MINUTE
+
+    INTERVAL_SECONDS = 5 * 60
 
     REQUIRED_FIELDS = [
         "time",
@@ -40,22 +47,22 @@ class CandleValidator:
 
         if candle.high < candle.open:
             raise ValueError(
-                f"Invalid candle: HIGH < OPEN at {candle.time}"
+                f"Invalid candle: HIGH < OPEN at {format_epoch(candle.time)}"
             )
 
         if candle.high < candle.close:
             raise ValueError(
-                f"Invalid candle: HIGH < CLOSE at {candle.time}"
+                f"Invalid candle: HIGH < CLOSE at {format_epoch(candle.time)}"
             )
 
         if candle.low > candle.open:
             raise ValueError(
-                f"Invalid candle: LOW > OPEN at {candle.time}"
+                f"Invalid candle: LOW > OPEN at {format_epoch(candle.time)}"
             )
 
         if candle.low > candle.close:
             raise ValueError(
-                f"Invalid candle: LOW > CLOSE at {candle.time}"
+                f"Invalid candle: LOW > CLOSE at {format_epoch(candle.time)}"
             )
 
     @classmethod
@@ -63,33 +70,27 @@ class CandleValidator:
 
         if candle.volume < 0:
             raise ValueError(
-                f"Negative volume detected at {candle.time}"
+                f"Negative volume detected at {format_epoch(candle.time)}"
             )
 
     @classmethod
     def validate_market_time(cls, candle: Candle):
 
-        try:
-            parsed_time = datetime.strptime(
-                candle.time,
-                "%Y-%m-%d %H:%M:%S"
-            )
-
-        except ValueError:
+        if not isinstance(candle.time, int):
             raise ValueError(
                 f"Invalid time format: {candle.time}"
             )
 
-        candle_time = parsed_time.strftime("%H:%M")
+        candle_minute = minute_of_day(candle.time)
 
-        if candle_time < cls.MARKET_START:
+        if candle_minute < cls.MARKET_START:
             raise ValueError(
-                f"Candle before market open: {candle.time}"
+                f"Candle before market open: {format_epoch(candle.time)}"
             )
 
-        if candle_time > cls.MARKET_END:
+        if candle_minute > cls.MARKET_END:
             raise ValueError(
-                f"Candle after market close: {candle.time}"
+                f"Candle after market close: {format_epoch(candle.time)}"
             )
 
     @classmethod
@@ -104,7 +105,7 @@ class CandleValidator:
 
             if candle.time in timestamps:
                 raise ValueError(
-                    f"Duplicate timestamp found: {candle.time}"
+                    f"Duplicate timestamp found: {format_epoch(candle.time)}"
                 )
 
             timestamps.add(candle.time)
@@ -124,21 +125,19 @@ class CandleValidator:
 
         for candle in sorted_candles:
 
-            current_time = datetime.strptime(
-                candle.time,
-                "%Y-%m-%d %H:%M:%S"
-            )
+            current_time = candle.time
 
-            if previous_time:
+            if previous_time is not None:
 
                 difference = (
                     current_time - previous_time
-                ).seconds / 60
+                )
 
-                if difference != 5:
+                if difference != cls.INTERVAL_SECONDS:
                     raise ValueError(
                         f"Invalid interval between "
-                        f"{previous_time} and {current_time}"
+                        f"{format_epoch(previous_time)} and "
+                        f"{format_epoch(current_time)}"
                     )
 
             previous_time = current_time
@@ -1,12 +1,9 @@
 from typing import Generator
 from sqlalchemy.orm import Session
 
-from app.database import SessionLocal
+from app.database import session_scope
 
 
 def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+    with session_scope() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,24 @@
+# =========================================================
+# File: backend/app/api/diagnostics.py
+# =========================================================
+
+from fastapi import APIRouter, status
+
+from backend.app.db.session import get_pool_status
+
+router = APIRouter(
+    prefix="/api/diagnostics",
+    tags=["DIAGNOSTICS"],
+)
+
+
+# =========================================================
+# DB POOL — Checked-out / idle / overflow per engine
+# =========================================================
+
+@router.get(
+    "/db-pool",
+    status_code=status.HTTP_200_OK,
+)
+def db_pool_status():
+    return get_pool_status()
@@ -0,0 +1,59 @@
+# =========================================================
+# File: backend/app/api/pipeline.py
+# =========================================================
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+import logging
+
+from backend.app.db.session import get_db, get_nifty_db
+from backend.app.schemas.pipeline_schema import (
+    PreopenPipelineRequest,
+    PreopenPipelineResponse,
+)
+from backend.app.services.preopen_pipeline_service import run_preopen_pipeline
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/pipeline",
+    tags=["PIPELINE"],
+)
+
+
+# =========================================================
+# PRE-OPEN — STEP-1..3 previews in one pass
+# =========================================================
+
+@router.post(
+    "/preopen",
+    response_model=PreopenPipelineResponse,
+    status_code=status.HTTP_200_OK,
+)
+def preopen_pipeline(
+    request: PreopenPipelineRequest,
+    db: Session = Depends(get_db),
+    nifty_db: Session = Depends(get_nifty_db),
+):
+    logger.info(
+        "[PIPELINE][API][PREOPEN][START] trade_date=%s",
+        request.trade_date,
+    )
+
+    try:
+        return run_preopen_pipeline(
+            db=db,
+            nifty_db=nifty_db,
+            trade_date=request.trade_date,
+            refresh=request.refresh,
+        )
+
+    except Exception:
+        logger.exception(
+            "[PIPELINE][API][PREOPEN][ERROR] trade_date=%s",
+            request.trade_date,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to run pre-open pipeline",
+        )
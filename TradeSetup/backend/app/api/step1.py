@@ -13,10 +13,13 @@ from backend.app.schemas.step1_schema import (
     Step1ComputeResponse,
 )
 from backend.app.services.step1_service import (
-    preview_step1_context,
     freeze_step1_context,
     compute_step1_context,
 )
+from backend.app.services.preopen_pipeline_service import (
+    get_step1_preview,
+    invalidate_preopen_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +48,7 @@ def preview_step1(
             request.trade_date,
         )
 
-        return preview_step1_context(
+        return get_step1_preview(
             db=db,
             nifty_db=nifty_db,
             trade_date=request.trade_date,
@@ -105,7 +108,7 @@ def freeze_step1(
     AUTHORITATIVE SNAPSHOT
     """
     try:
-        return freeze_step1_context(
+        response = freeze_step1_context(
             db=db,
             trade_date=request.trade_date,
             preopen_price=request.preopen_price,
@@ -115,6 +118,10 @@ def freeze_step1(
             premarket_notes=request.premarket_notes,
         )
 
+        invalidate_preopen_cache(request.trade_date)
+
+        return response
+
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -1,11 +1,16 @@
 # backend/app/api/step2.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+import asyncio
 import logging
+import time
 import traceback
 
-from backend.app.db.session import get_db
+from backend.app.db.session import get_db, get_nifty_db, nifty_session_scope
 from backend.app.schemas.step2_schema import (
     Step2PreviewRequest,
     Step2FreezeRequest,
@@ -13,15 +18,26 @@ from backend.app.schemas.step2_schema import (
     Step2PreviewResponse,
     Step2FrozenResponse,
     Step2ComputeResponse,
+    Step2LiveResponse,
 )
 from backend.app.services.step2_service import (
-    preview_step2_behavior,
     freeze_step2_behavior,
     compute_step2_behavior,
 )
+from backend.app.services.preopen_pipeline_service import (
+    get_step2_preview,
+    invalidate_preopen_cache,
+)
+from backend.app.services.step2_live_service import step2_live_tracker
 
 logger = logging.getLogger(__name__)
 
+# SSE poll cadence against nifty_prices
+LIVE_POLL_SECONDS = 5
+
+# Stream gives up after this long without completing the window
+LIVE_STREAM_MAX_SECONDS = 3600
+
 router = APIRouter(
     prefix="/api/step2",
     tags=["STEP-2"],
@@ -39,6 +55,7 @@ router = APIRouter(
 def preview_step2(
     request: Step2PreviewRequest,
     db: Session = Depends(get_db),
+    nifty_db: Session = Depends(get_nifty_db),
 ):
 
     logger.info(
@@ -47,9 +64,10 @@ def preview_step2(
     )
 
     try:
-        result = preview_step2_behavior(
+        result = get_step2_preview(
             db=db,
             trade_date=request.trade_date,
+            nifty_db=nifty_db,
         )
 
         logger.info(
@@ -180,6 +198,8 @@ def freeze_step2(
             reason=request.reason,  # baseline removed (correct)
         )
 
+        invalidate_preopen_cache(request.trade_date)
+
         logger.info(
             "[STEP2][API][FREEZE][SUCCESS] trade_date=%s",
             request.trade_date,
@@ -213,4 +233,92 @@ def freeze_step2(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to freeze STEP-2 behavior",
-        )
\ No newline at end of file
+        )
+
+
+# =====================================================
+# LIVE (AUTO MODE — nifty_prices)
+# =====================================================
+
+@router.get(
+    "/live",
+    response_model=Step2LiveResponse,
+    status_code=status.HTTP_200_OK,
+)
+def live_step2(
+    trade_date: date = Query(...),
+    nifty_db: Session = Depends(get_nifty_db),
+):
+
+    try:
+        return step2_live_tracker.poll(nifty_db, trade_date)
+
+    except Exception as e:
+
+        logger.error(
+            "[STEP2][API][LIVE][FATAL] trade_date=%s exception=%s",
+            trade_date,
+            str(e),
+        )
+
+        traceback.print_exc()
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to read live STEP-2 state",
+        )
+
+
+def _poll_live(trade_date: date) -> Step2LiveResponse:
+
+    with nifty_session_scope() as nifty_db:
+        return step2_live_tracker.poll(nifty_db, trade_date)
+
+
+@router.get("/live/stream")
+async def live_step2_stream(
+    trade_date: date = Query(...),
+):
+    """
+    Server-sent events: one `step2` event per new bar,
+    closes once the opening window is complete.
+
+    The stream waits on the event loop between polls;
+    a worker thread is used only for the poll itself.
+    """
+
+    async def events():
+
+        last_sent = -1
+        deadline = time.monotonic() + LIVE_STREAM_MAX_SECONDS
+
+        while time.monotonic() < deadline:
+
+            try:
+                live = await run_in_threadpool(_poll_live, trade_date)
+
+            except Exception as e:
+                logger.error(
+                    "[STEP2][API][LIVE_STREAM][ERROR] trade_date=%s exception=%s",
+                    trade_date,
+                    str(e),
+                )
+                yield "event: error\ndata: Failed to read live STEP-2 state\n\n"
+                return
+
+            if live.bars_observed != last_sent:
+                last_sent = live.bars_observed
+                yield f"event: step2\ndata: {live.model_dump_json()}\n\n"
+
+            if live.window_complete:
+                return
+
+            await asyncio.sleep(LIVE_POLL_SECONDS)
+
+    logger.info("[STEP2][API][LIVE_STREAM][START] trade_date=%s", trade_date)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
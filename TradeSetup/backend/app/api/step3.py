@@ -35,10 +35,13 @@ from backend.app.schemas.step3_schema import (
     Step3FreezeResponse,
 )
 from backend.app.services.step3_service import (
-    generate_step3_execution,
     compute_step3_candidates,
     freeze_step3_candidates,
 )
+from backend.app.services.preopen_pipeline_service import (
+    get_step3_preview,
+    invalidate_preopen_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +74,7 @@ def preview_step3(
     )
 
     try:
-        response = generate_step3_execution(
+        response = get_step3_preview(
             db=db,
             trade_date=request.trade_date,
         )
@@ -170,6 +173,8 @@ def freeze_step3(
             candidates=request.candidates,
         )
 
+        invalidate_preopen_cache(request.trade_date)
+
         logger.info(
             "[STEP3][API][FREEZE][SUCCESS] trade_date=%s",
             request.trade_date,
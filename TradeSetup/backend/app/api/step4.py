@@ -13,11 +13,14 @@ from backend.app.schemas.step4_schema import (
     Step4ComputeResponse,
     Step4FreezeRequest,
     Step4FrozenTradeResponse,
+    Step4SweepRequest,
+    Step4SweepResponse,
 )
 from backend.app.services.step4_service import (
     load_step4_context,
     compute_step4_trade,
     freeze_step4_trade,
+    sweep_step4_sizing,
 )
 
 logger = logging.getLogger(__name__)
@@ -185,4 +188,56 @@ def freeze_trade(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
-        )
\ No newline at end of file
+        )
+
+
+# =====================================================
+# STEP-4 SIZING SWEEP (READ-ONLY)
+# =====================================================
+
+@router.post(
+    "/sweep",
+    response_model=Step4SweepResponse,
+    status_code=status.HTTP_200_OK,
+)
+def sweep_sizing(
+    request: Step4SweepRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Evaluate a sizing grid across candidates and dates.
+    Nothing is persisted.
+    """
+
+    logger.info(
+        "[STEP4][API][SWEEP][START] dates=%d symbols=%d",
+        len(request.trade_dates),
+        len(request.symbols),
+    )
+
+    try:
+        response = sweep_step4_sizing(
+            db=db,
+            request=request,
+        )
+
+        logger.info(
+            "[STEP4][API][SWEEP][SUCCESS] points=%d",
+            response.count,
+        )
+
+        return response
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+
+    except Exception as e:
+        logger.error("[STEP4][SWEEP][UNEXPECTED ERROR]")
+        traceback.print_exc()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
@@ -2,8 +2,10 @@
 import os
 import urllib.parse
 import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from backend.app.db.base import Base
 
 logger = logging.getLogger(__name__)
@@ -38,6 +40,33 @@ def build_database_url(dbname: str):
     return f"mysql+pymysql://{user}:{encoded_pw}@{host}:{port}/{dbname}"
 
 
+# -------------------------------------------------
+# Connection pool limits (per engine)
+# Defaults: db_pool.env at the repo root
+# -------------------------------------------------
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+
+
+def create_pooled_engine(database_url: str):
+    """
+    Engine with explicit pool sizing; a checkout waits at most
+    POOL_TIMEOUT seconds instead of opening unbounded connections.
+    """
+
+    return create_engine(
+        database_url,
+        pool_pre_ping=True,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,
+    )
+
+
 # -------------------------------------------------
 # Primary DB: intradaytrading
 # -------------------------------------------------
@@ -50,11 +79,7 @@ logger.debug(
     INTRADAY_DB_NAME,
 )
 
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-)
+engine = create_pooled_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -75,11 +100,7 @@ logger.debug(
     NIFTY_DB_NAME,
 )
 
-engine_nifty = create_engine(
-    NIFTY_DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-)
+engine_nifty = create_pooled_engine(NIFTY_DATABASE_URL)
 
 SessionNifty = sessionmaker(
     autocommit=False,
@@ -89,26 +110,71 @@ SessionNifty = sessionmaker(
 
 
 # -------------------------------------------------
-# FastAPI dependencies
+# Scoped sessions
 # -------------------------------------------------
 
-def get_db():
+@contextmanager
+def session_scope(session_factory: sessionmaker = SessionLocal) -> Iterator[Session]:
     """
-    Primary trading engine DB (intradaytrading)
+    Yields a session and always returns its connection to the pool.
+    Rolls back on error; committing stays with the caller.
     """
-    db = SessionLocal()
+    db = session_factory()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
 
+def nifty_session_scope():
+    """
+    Scoped session on the market data DB (nifty)
+    """
+    return session_scope(SessionNifty)
+
+
+# -------------------------------------------------
+# FastAPI dependencies
+# -------------------------------------------------
+
+def get_db():
+    """
+    Primary DB (intradaytrading)
+    """
+    with session_scope(SessionLocal) as db:
+        yield db
+
+
 def get_nifty_db():
     """
     Market data DB (nifty)
     """
-    db = SessionNifty()
-    try:
+    with session_scope(SessionNifty) as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+
+# -------------------------------------------------
+# Pool metrics
+# -------------------------------------------------
+
+def get_pool_status() -> Dict[str, Dict[str, int]]:
+    """
+    Checked-out / idle / overflow connections per engine.
+    """
+
+    status = {}
+
+    for name, pooled_engine in (("primary", engine), ("nifty", engine_nifty)):
+        pool = pooled_engine.pool
+        status[name] = {
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_connections": POOL_SIZE + MAX_OVERFLOW,
+        }
+
+    return status
@@ -0,0 +1,76 @@
+# backend/app/jobs/after_market_data_import.py
+#
+# Run after importing (or re-importing) intraday_bhavcopy or
+# strategy_features rows. --from / --to are the oldest / newest trade
+# dates the import touched; omit them after a full reload.
+#
+# Rebuilds the liquidity rollup for those sessions plus the 30 that
+# follow (their windows include the re-imported days), then drops the
+# Layer-1 snapshots built from them.
+#
+# The imports do not call this job, and readers do not depend on it for
+# added / removed rows: Layer-1 snapshots and rollup sessions are checked
+# against a source watermark and rebuilt (dashboard: bypassed) on read.
+# Run it after value-only corrections, and to move rebuilds off the
+# request path. Other processes pick up added / removed dates on the
+# trading calendar's next refresh (60s).
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.after_market_data_import --from 2025-01-15
+#   python -m backend.app.jobs.after_market_data_import --from 2025-01-15 --to 2025-01-17
+#   python -m backend.app.jobs.after_market_data_import
+
+import argparse
+import logging
+from datetime import date
+
+from backend.app.db.session import engine, session_scope
+from backend.app.models.step3_layer1_snapshot import Step3Layer1Snapshot
+from backend.app.models.symbol_liquidity_daily import SymbolLiquidityDaily
+from backend.app.services.liquidity_rollup_service import rebuild_after_import
+from backend.app.services.step3_layer1_snapshot_service import (
+    invalidate_layer1_snapshots,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild / invalidate data derived from re-imported bhavcopy / strategy_features rows",
+    )
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat, default=None)
+
+    args = parser.parse_args()
+
+    if args.end_date is not None and args.start_date is None:
+        parser.error("--to requires --from")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    SymbolLiquidityDaily.__table__.create(bind=engine, checkfirst=True)
+    Step3Layer1Snapshot.__table__.create(bind=engine, checkfirst=True)
+
+    with session_scope() as db:
+
+        sessions = rebuild_after_import(db, args.start_date, args.end_date)
+
+        # a snapshot for T reads sessions before T, so only T > start_date is affected
+        deleted = invalidate_layer1_snapshots(db, from_date=args.start_date)
+
+    logger.info(
+        "[IMPORT][JOB][DONE] from=%s to=%s rollup_sessions=%s layer1_snapshots=%s",
+        args.start_date,
+        args.end_date,
+        sessions,
+        deleted,
+    )
+
+
+if __name__ == "__main__":
+    main()
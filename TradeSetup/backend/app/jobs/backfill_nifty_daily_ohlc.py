@@ -0,0 +1,50 @@
+# backend/app/jobs/backfill_nifty_daily_ohlc.py
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.backfill_nifty_daily_ohlc --from 2024-01-01 --to 2024-12-31
+
+import argparse
+import logging
+from datetime import date
+
+from backend.app.db.session import engine_nifty, nifty_session_scope
+from backend.app.models.nifty_daily_ohlc import NiftyDailyOhlc
+from backend.app.services.nifty_daily_ohlc_service import rebuild_daily_ohlc
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Backfill the nifty_daily_ohlc rollup from nifty_prices",
+    )
+    parser.add_argument("--from", dest="start_day", type=date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="end_day", type=date.fromisoformat, required=True)
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    NiftyDailyOhlc.__table__.create(bind=engine_nifty, checkfirst=True)
+
+    with nifty_session_scope() as nifty_db:
+        sessions = rebuild_daily_ohlc(
+            nifty_db=nifty_db,
+            start_day=args.start_day,
+            end_day=args.end_day,
+        )
+
+    logger.info(
+        "[NIFTY][OHLC][BACKFILL] sessions=%s from=%s to=%s",
+        sessions,
+        args.start_day,
+        args.end_day,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# backend/app/jobs/backfill_nifty_indicators.py
+#
+# Recomputes the NIFTY indicator series (SMA / EMA / RSI / ATR).
+# Without --from the whole series is rebuilt; with --from everything
+# from that date onward is rewritten (EMA / Wilder values carry forward).
+# --sync only appends bars newer than the stored series.
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.backfill_nifty_indicators
+#   python -m backend.app.jobs.backfill_nifty_indicators --timeframe 5m --from 2024-06-01
+#   python -m backend.app.jobs.backfill_nifty_indicators --sync
+
+import argparse
+import logging
+from datetime import date
+
+from backend.app.db.session import engine_nifty, nifty_session_scope
+from backend.app.models.nifty_daily_ohlc import NiftyDailyOhlc
+from backend.app.models.nifty_indicator import NiftyIndicator
+from backend.app.services.nifty_indicator_service import (
+    TIMEFRAMES,
+    rebuild_indicators,
+    sync_indicators,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Backfill the nifty_indicators series from nifty_prices / nifty_daily_ohlc",
+    )
+    parser.add_argument("--timeframe", choices=TIMEFRAMES + ("all",), default="all")
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat, default=None)
+    parser.add_argument("--sync", action="store_true", help="Append new bars only")
+
+    args = parser.parse_args()
+
+    if args.sync and args.start_date is not None:
+        parser.error("--sync and --from are mutually exclusive")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    NiftyDailyOhlc.__table__.create(bind=engine_nifty, checkfirst=True)
+    NiftyIndicator.__table__.create(bind=engine_nifty, checkfirst=True)
+
+    timeframes = TIMEFRAMES if args.timeframe == "all" else (args.timeframe,)
+
+    with nifty_session_scope() as nifty_db:
+        for timeframe in timeframes:
+
+            if args.sync:
+                bars = sync_indicators(nifty_db, timeframe)
+            else:
+                bars = rebuild_indicators(nifty_db, timeframe, start_date=args.start_date)
+
+            logger.info(
+                "[NIFTY][INDICATORS][BACKFILL] timeframe=%s bars=%s from=%s",
+                timeframe,
+                bars,
+                args.start_date,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# backend/app/jobs/build_layer1_snapshot.py
+#
+# Pre-open job: builds the Step-3 Layer-1 snapshot for a trade date.
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.build_layer1_snapshot               # today
+#   python -m backend.app.jobs.build_layer1_snapshot --date 2025-01-15
+
+import argparse
+import logging
+from datetime import date
+
+from backend.app.db.session import engine, session_scope
+from backend.app.models.step3_layer1_snapshot import Step3Layer1Snapshot
+from backend.app.services.step3_layer1_snapshot_service import build_layer1_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Build the Step-3 Layer-1 tradability snapshot",
+    )
+    parser.add_argument("--date", dest="trade_date", type=date.fromisoformat, default=date.today())
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    Step3Layer1Snapshot.__table__.create(bind=engine, checkfirst=True)
+
+    with session_scope() as db:
+        passed = build_layer1_snapshot(db, args.trade_date)
+
+    logger.info(
+        "[STEP3][JOB][LAYER1_SNAPSHOT] trade_date=%s passed=%s",
+        args.trade_date,
+        len(passed),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# backend/app/jobs/check_nifty_indicators.py
+#
+# Recomputes the NIFTY indicator series from scratch and compares it
+# with the stored rows (and the nifty_prices mirror columns for 5m).
+# Exits with status 1 when anything differs.
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.check_nifty_indicators
+#   python -m backend.app.jobs.check_nifty_indicators --timeframe 1d --from 2024-01-01 --to 2024-12-31
+
+import argparse
+import json
+import logging
+import sys
+from datetime import date
+
+from backend.app.db.session import nifty_session_scope
+from backend.app.services.nifty_indicator_service import (
+    TIMEFRAMES,
+    check_indicators,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Check nifty_indicators against a full recomputation",
+    )
+    parser.add_argument("--timeframe", choices=TIMEFRAMES + ("all",), default="all")
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat, default=None)
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="Relative tolerance")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    timeframes = TIMEFRAMES if args.timeframe == "all" else (args.timeframe,)
+    reports = []
+
+    with nifty_session_scope() as nifty_db:
+        for timeframe in timeframes:
+            reports.append(
+                check_indicators(
+                    nifty_db,
+                    timeframe,
+                    start_date=args.start_date,
+                    end_date=args.end_date,
+                    tolerance=args.tolerance,
+                )
+            )
+
+    print(json.dumps(reports, indent=2, default=str))
+
+    if not all(report["consistent"] for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# backend/app/jobs/run_backtest.py
+#
+# Replays the STEP-1 → STEP-4 engine over a date range and reports
+# the planned trades per day with daily-bar outcomes (see
+# services/backtest_service.py for the daily-bar limitation).
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.run_backtest --from 2024-01-01 --to 2024-12-31
+#   python -m backend.app.jobs.run_backtest --from 2024-01-01 --to 2024-12-31 \
+#       --workers 8 --liquidity-threshold 5e8 --rs-threshold 0.5 --out report.json
+
+import argparse
+import json
+import logging
+from datetime import date
+
+from backend.app.db.session import engine_nifty
+from backend.app.models.nifty_daily_ohlc import NiftyDailyOhlc
+from backend.app.services.backtest_service import BacktestConfig, run_backtest
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    defaults = BacktestConfig()
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Backtest the STEP-1..4 decision engine over a date range. "
+            "Outcomes are resolved on daily bars; days where stop and "
+            "target were both touched are reported as AMBIGUOUS."
+        ),
+    )
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat, required=True)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--liquidity-threshold", type=float, default=defaults.liquidity_threshold)
+    parser.add_argument("--rs-threshold", type=float, default=defaults.rs_threshold)
+    parser.add_argument("--capital", type=float, default=defaults.capital)
+    parser.add_argument("--risk-percent", type=float, default=defaults.risk_percent)
+    parser.add_argument("--r-multiple", type=float, default=defaults.r_multiple)
+    parser.add_argument("--entry-buffer", type=float, default=defaults.entry_buffer)
+    parser.add_argument("--out", default=None, help="Write the full JSON report here")
+
+    args = parser.parse_args()
+
+    if args.start_date > args.end_date:
+        parser.error("--from must not be after --to")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    NiftyDailyOhlc.__table__.create(bind=engine_nifty, checkfirst=True)
+
+    config = BacktestConfig(
+        liquidity_threshold=args.liquidity_threshold,
+        rs_threshold=args.rs_threshold,
+        capital=args.capital,
+        risk_percent=args.risk_percent,
+        r_multiple=args.r_multiple,
+        entry_buffer=args.entry_buffer,
+    )
+
+    report = run_backtest(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        config=config,
+        workers=args.workers,
+    )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+        logger.info("[BACKTEST][JOB][WRITTEN] path=%s", args.out)
+
+    print(json.dumps(report["summary"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# backend/app/jobs/sync_liquidity_rollup.py
+#
+# Extends the rolling liquidity rollup; pass --from/--to to backfill a range.
+# Optional: Layer-1 syncs the session it reads on demand, and both readers
+# rebuild / bypass a session whose row count no longer matches bhavcopy.
+# After correcting bhavcopy values (same rows) run
+# jobs/after_market_data_import.py, which rebuilds every affected window.
+#
+# Usage (from TradeSetup/):
+#   python -m backend.app.jobs.sync_liquidity_rollup
+#   python -m backend.app.jobs.sync_liquidity_rollup --from 2024-01-01 --to 2024-12-31
+
+import argparse
+import logging
+from datetime import date
+
+from backend.app.db.session import engine, session_scope
+from backend.app.models.symbol_liquidity_daily import SymbolLiquidityDaily
+from backend.app.services.liquidity_rollup_service import (
+    rebuild_liquidity_rollup,
+    sync_liquidity_rollup,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Maintain the symbol_liquidity_daily rollup from intraday_bhavcopy",
+    )
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat, default=None)
+
+    args = parser.parse_args()
+
+    if (args.start_date is None) != (args.end_date is None):
+        parser.error("--from and --to must be given together")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    SymbolLiquidityDaily.__table__.create(bind=engine, checkfirst=True)
+
+    with session_scope() as db:
+        if args.start_date is None:
+            sessions = sync_liquidity_rollup(db)
+        else:
+            sessions = rebuild_liquidity_rollup(
+                db=db,
+                start_date=args.start_date,
+                end_date=args.end_date,
+            )
+
+    logger.info(
+        "[LIQUIDITY][JOB][ROLLUP] sessions=%s from=%s to=%s",
+        sessions,
+        args.start_date,
+        args.end_date,
+    )
+
+
+if __name__ == "__main__":
+    main()
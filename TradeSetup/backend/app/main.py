@@ -15,11 +15,17 @@ from backend.app.models.step3_execution_control import Step3ExecutionControl
 from backend.app.models.step3_stock_selection import Step3StockSelection
 from backend.app.models.step4_trade import Step4Trade
 from backend.app.models.step4_trade_construction import Step4TradeConstruction 
+from backend.app.models.step3_layer1_snapshot import Step3Layer1Snapshot
+from backend.app.models.nifty_daily_ohlc import NiftyDailyOhlc
+from backend.app.models.nifty_indicator import NiftyIndicator
+from backend.app.models.symbol_liquidity_daily import SymbolLiquidityDaily
 
 from backend.app.api.step1 import router as step1_router
 from backend.app.api.step2 import router as step2_router
 from backend.app.api.step3 import router as step3_router
 from backend.app.api.step4 import router as step4_router
+from backend.app.api.pipeline import router as pipeline_router
+from backend.app.api.diagnostics import router as diagnostics_router
 
 logging.basicConfig(
     level=logging.INFO,
@@ -49,3 +55,5 @@ app.include_router(step1_router)
 app.include_router(step2_router)
 app.include_router(step3_router)
 app.include_router(step4_router)
+app.include_router(pipeline_router)
+app.include_router(diagnostics_router)
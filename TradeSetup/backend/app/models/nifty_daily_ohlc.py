@@ -0,0 +1,67 @@
+# backend/app/models/nifty_daily_ohlc.py
+
+from sqlalchemy import Column, Date, DateTime, Float, Integer
+from sqlalchemy.sql import func
+from backend.app.db.base import Base
+
+
+class NiftyDailyOhlc(Base):
+    """
+    NIFTY Daily OHLC Rollup (nifty DB)
+    ----------------------------------
+    One row per trading session, aggregated from
+    the 5-minute bars in nifty_prices.
+
+    Maintained incrementally: a session is rebuilt
+    whenever bars newer than last_bar_at exist.
+    Step-1 / Step-2 read this table instead of
+    aggregating nifty_prices per request.
+    """
+
+    __tablename__ = "nifty_daily_ohlc"
+
+    # =========================
+    # Identity
+    # =========================
+    trade_date = Column(Date, primary_key=True)
+
+    # =========================
+    # Daily OHLC
+    # =========================
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+
+    day_range = Column(Float, nullable=False)
+
+    # =========================
+    # Intraday aggregates
+    # =========================
+    candle_count = Column(Integer, nullable=False)
+
+    # Average (High - Low) of the session's last 20 bars
+    last20_avg_range = Column(Float, nullable=True)
+
+    # =========================
+    # Incremental watermark
+    # =========================
+    last_bar_at = Column(DateTime, nullable=False)
+
+    updated_at = Column(
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<NiftyDailyOhlc("
+            f"trade_date={self.trade_date}, "
+            f"high={self.high}, "
+            f"low={self.low}, "
+            f"close={self.close}, "
+            f"candles={self.candle_count}"
+            f")>"
+        )
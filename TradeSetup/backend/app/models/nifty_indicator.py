@@ -0,0 +1,65 @@
+# backend/app/models/nifty_indicator.py
+
+from sqlalchemy import Column, DateTime, Float, String
+from sqlalchemy.sql import func
+from backend.app.db.base import Base
+
+
+class NiftyIndicator(Base):
+    """
+    NIFTY Indicator Series (nifty DB)
+    ---------------------------------
+    One row per bar and timeframe:
+      5m → the 5-minute bars in nifty_prices
+      1d → the sessions in nifty_daily_ohlc
+
+    Appended incrementally: the Wilder / EMA state
+    stored on the last row (plus the last 20 closes)
+    is enough to extend the series by one bar in O(1).
+
+    The 5m values are mirrored into the legacy
+    nifty_prices SMA_5 / SMA_20 / RSI / ATR columns.
+    """
+
+    __tablename__ = "nifty_indicators"
+
+    # =========================
+    # Identity
+    # =========================
+    timeframe = Column(String(4), primary_key=True)
+    bar_at = Column(DateTime, primary_key=True)
+
+    close = Column(Float, nullable=False)
+
+    # =========================
+    # Indicators (NULL during warm-up)
+    # =========================
+    sma_5 = Column(Float, nullable=True)
+    sma_20 = Column(Float, nullable=True)
+    ema_20 = Column(Float, nullable=True)
+    rsi_14 = Column(Float, nullable=True)
+    atr_14 = Column(Float, nullable=True)
+
+    # =========================
+    # Wilder smoothing state (for incremental append)
+    # =========================
+    rsi_avg_gain = Column(Float, nullable=True)
+    rsi_avg_loss = Column(Float, nullable=True)
+
+    updated_at = Column(
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<NiftyIndicator("
+            f"timeframe={self.timeframe}, "
+            f"bar_at={self.bar_at}, "
+            f"sma_20={self.sma_20}, "
+            f"rsi_14={self.rsi_14}, "
+            f"atr_14={self.atr_14}"
+            f")>"
+        )
@@ -0,0 +1,70 @@
+# backend/app/models/step3_layer1_snapshot.py
+
+from sqlalchemy import Column, Date, DateTime, Integer, String, Text
+from sqlalchemy.sql import func
+from backend.app.db.base import Base
+
+
+class Step3Layer1Snapshot(Base):
+    """
+    STEP-3 Layer-1 Tradability Snapshot
+    -----------------------------------
+    One row per trading day, built before market open.
+
+    Layer-1 depends only on previous sessions
+    (20-day traded value, atr_14, yesterday's candle),
+    so the pass list is computed once and read by
+    primary key on every preview / compute.
+
+    source_fingerprint records the session window
+    (first:last) and a digest of the previous session's
+    inputs; a row whose digest no longer matches (the
+    data was re-imported) is rebuilt on read.
+    """
+
+    __tablename__ = "step3_layer1_snapshot"
+
+    # =========================
+    # Identity
+    # =========================
+    trade_date = Column(Date, primary_key=True, index=True)
+
+    # =========================
+    # Layer-1 Output
+    # =========================
+    # JSON list of {symbol, avg_traded_value_20d, atr_pct, abnormal_candle},
+    # sorted by avg_traded_value_20d DESC
+    passed_symbols = Column(Text, nullable=False)
+
+    universe_count = Column(Integer, nullable=False)
+    passed_count = Column(Integer, nullable=False)
+
+    # =========================
+    # Provenance
+    # =========================
+    source_fingerprint = Column(String(128), nullable=False)
+
+    built_at = Column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    # =========================
+    # Audit
+    # =========================
+    created_at = Column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Step3Layer1Snapshot("
+            f"trade_date={self.trade_date}, "
+            f"universe={self.universe_count}, "
+            f"passed={self.passed_count}, "
+            f"built_at={self.built_at}"
+            f")>"
+        )
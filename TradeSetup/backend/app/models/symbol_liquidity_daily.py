@@ -0,0 +1,57 @@
+# backend/app/models/symbol_liquidity_daily.py
+
+from sqlalchemy import Column, Date, DateTime, Float, Integer, String
+from sqlalchemy.sql import func
+from backend.app.db.base import Base
+
+
+class SymbolLiquidityDaily(Base):
+    """
+    Rolling Liquidity Rollup (intradaytrading DB)
+    ---------------------------------------------
+    One row per (trade_date, symbol): average net
+    traded value over the 20 / 30 sessions ending at
+    trade_date (inclusive), from intraday_bhavcopy.
+
+    Maintained incrementally, one session at a time,
+    as bhavcopy days land. SUM(sessions_30d) of a
+    session equals the bhavcopy rows in its window;
+    readers treat a mismatch as stale. Step-3 reads the row for the
+    previous session; the dashboard reads the row for
+    the selected date.
+    """
+
+    __tablename__ = "symbol_liquidity_daily"
+
+    # =========================
+    # Identity
+    # =========================
+    trade_date = Column(Date, primary_key=True)
+    symbol = Column(String(32), primary_key=True)
+
+    # =========================
+    # Rolling averages (net_trdval)
+    # =========================
+    avg_trdval_20d = Column(Float, nullable=True)
+    avg_trdval_30d = Column(Float, nullable=True)
+
+    # Sessions the symbol actually traded inside each window
+    sessions_20d = Column(Integer, nullable=False)
+    sessions_30d = Column(Integer, nullable=False)
+
+    updated_at = Column(
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SymbolLiquidityDaily("
+            f"trade_date={self.trade_date}, "
+            f"symbol={self.symbol}, "
+            f"avg_20d={self.avg_trdval_20d}, "
+            f"avg_30d={self.avg_trdval_30d}"
+            f")>"
+        )
@@ -0,0 +1,30 @@
+# =========================================================
+# File: backend/app/schemas/pipeline_schema.py
+# =========================================================
+
+from datetime import date
+from typing import Optional
+from pydantic import BaseModel
+
+from backend.app.schemas.step1_schema import Step1PreviewResponse
+from backend.app.schemas.step2_schema import Step2PreviewResponse
+from backend.app.schemas.step3_schema import Step3ExecutionResponse
+
+
+class PreopenPipelineRequest(BaseModel):
+    trade_date: date
+    refresh: bool = False
+
+
+class PreopenPipelineResponse(BaseModel):
+    """
+    Previews for every step that could be computed.
+    Later steps stay None when blocked_reason is set.
+    """
+    trade_date: date
+
+    step1: Optional[Step1PreviewResponse] = None
+    step2: Optional[Step2PreviewResponse] = None
+    step3: Optional[Step3ExecutionResponse] = None
+
+    blocked_reason: Optional[str] = None
@@ -121,6 +121,10 @@ class Step1ContextSnapshot(BaseModel):
 
     last_5_day_ranges: List[float] = []
 
+    # Previous session NIFTY daily indicators
+    # (sma_5, sma_20, ema_20, rsi_14, atr_14)
+    prior_session_indicators: Optional[Dict[str, Optional[float]]] = None
+
     market_bias: Optional[str] = None
     gap_context: Optional[str] = None
     premarket_notes: Optional[str] = None
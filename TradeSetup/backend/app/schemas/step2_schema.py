@@ -181,4 +181,19 @@ class Step2FrozenResponse(BaseModel):
     Response after STEP-2 is successfully frozen.
     """
     snapshot: Step2OpenBehaviorSnapshot
-    frozen: bool = True
\ No newline at end of file
+    frozen: bool = True
+
+class Step2LiveResponse(BaseModel):
+    """
+    AUTO STEP-2 state built from nifty_prices.
+    Evolves bar by bar until window_complete.
+    Does NOT freeze.
+    """
+    snapshot: Step2OpenBehaviorSnapshot
+
+    bars_observed: int
+    bars_expected: int
+    window_complete: bool
+
+    last_bar_at: Optional[datetime] = None
+    vwap: Optional[float] = None
@@ -20,10 +20,22 @@ This schema supports:
 """
 
 from datetime import date, datetime
+from enum import Enum
 from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
+# =========================================================
+# Rejection Codes (persisted as step3_stock_selection.rejection_tag)
+# =========================================================
+
+class Step3RejectionCode(str, Enum):
+    LAYER1_FAIL = "LAYER1_FAIL"
+    RS_NEUTRAL = "RS_NEUTRAL"
+    STRATEGY_FAIL = "STRATEGY_FAIL"
+    UNKNOWN = "UNKNOWN"
+
+
 # =========================================================
 # Canonical Input Model (Engine Input)
 # =========================================================
@@ -93,6 +105,9 @@ class TradeCandidate(BaseModel):
 
     structure_valid: bool = True
 
+    # Set by the engine for rejected candidates
+    rejection_code: Optional[Step3RejectionCode] = None
+
     # Mandatory deterministic explanation
     reason: str = Field(
         ...,
@@ -215,4 +215,67 @@ class Step4FrozenTradeResponse(BaseModel):
     Response after a STEP-4 trade is frozen.
     """
     trade: FrozenTradeSnapshot
-    frozen: bool = True
\ No newline at end of file
+    frozen: bool = True
+
+# =====================================================
+# STEP-4 SIZING SWEEP (NO PERSISTENCE)
+# =====================================================
+
+class Step4SweepRequest(BaseModel):
+    """
+    Grid of sizing parameters evaluated across STEP-3
+    candidates on one or more dates.
+    """
+
+    trade_dates: List[date] = Field(..., min_length=1)
+
+    # Empty → every tradable STEP-3 candidate on those dates
+    symbols: List[str] = Field(default_factory=list)
+
+    capitals: List[float] = Field(..., min_length=1)
+    risk_percents: List[float] = Field(..., min_length=1)
+    r_multiples: List[float] = Field(..., min_length=1)
+    entry_buffers: List[float] = Field(default_factory=lambda: [0.0], min_length=1)
+
+
+class Step4SweepPoints(BaseModel):
+    """
+    Columnar sweep surface: one array per field, all of
+    equal length; index i across the arrays is one point.
+    """
+
+    trade_date: List[date] = Field(default_factory=list)
+    symbol: List[str] = Field(default_factory=list)
+    direction: List[str] = Field(default_factory=list)
+    strategy_used: List[str] = Field(default_factory=list)
+
+    capital: List[float] = Field(default_factory=list)
+    risk_percent: List[float] = Field(default_factory=list)
+    entry_buffer: List[float] = Field(default_factory=list)
+    r_multiple: List[float] = Field(default_factory=list)
+
+    entry_price: List[float] = Field(default_factory=list)
+    stop_loss: List[float] = Field(default_factory=list)
+    risk_per_share: List[float] = Field(default_factory=list)
+    quantity: List[int] = Field(default_factory=list)
+    target_price: List[float] = Field(default_factory=list)
+
+    trade_status: List[str] = Field(default_factory=list)
+    block_reason: List[Optional[str]] = Field(default_factory=list)
+
+
+class Step4SweepSkipped(BaseModel):
+
+    trade_date: date
+    symbol: str
+    reason: str
+
+
+class Step4SweepResponse(BaseModel):
+    """
+    Full sizing surface (one point per candidate × grid cell).
+    """
+    grid_size: int
+    count: int
+    points: Step4SweepPoints
+    skipped: List[Step4SweepSkipped] = Field(default_factory=list)
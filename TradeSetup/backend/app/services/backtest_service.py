@@ -0,0 +1,497 @@
+# =========================================================
+# File: backend/app/services/backtest_service.py
+# =========================================================
+"""
+Historical replay of the STEP-1 → STEP-4 decision chain.
+
+Each trade date is replayed from nifty_prices, the
+nifty_daily_ohlc rollup, intraday_bhavcopy and
+strategy_features using the same engine functions as the
+interactive flow. Nothing is written to the step tables;
+only the derived rollups (nifty_daily_ohlc,
+symbol_liquidity_daily) are filled in for the range.
+
+Dates are independent, so they run across a process pool.
+
+DATA LIMITATION
+---------------
+Only daily stock bars (intraday_bhavcopy) are stored:
+
+- STEP-1 / STEP-2 / STEP-3A are replayed from NIFTY bars
+  exactly as in the live flow
+- Layer-1 uses the same filter on the prebuilt rollups
+- Layer-2/3 use an open-auction proxy: RS = stock gap %
+  vs NIFTY gap % at 09:15, gap_hold / structure_valid
+  assumed True, price_vs_vwap follows the gap direction
+- STEP-4 sizes each planned trade from the STEP-3
+  structure (_structural_levels + _size_position), as
+  the live flow does; no intraday bar is needed
+- outcomes are resolved against the day's high / low:
+  entry not touched → NOT_TRIGGERED, stop and target
+  both touched → AMBIGUOUS (intraday order unknown),
+  neither → CLOSED at the day's close
+
+Planned trades are reported per day; WIN / LOSS / CLOSED
+feed the R and P&L totals, AMBIGUOUS days are counted
+separately.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.app.db.session import (
+    engine,
+    engine_nifty,
+    nifty_session_scope,
+    session_scope,
+)
+from backend.app.schemas.step1_schema import Step1ComputeRequest
+from backend.app.schemas.step2_schema import Step2CandleInput
+from backend.app.schemas.step3_schema import Step3StockContext
+from backend.app.services.liquidity_rollup_service import rebuild_liquidity_rollup
+from backend.app.services.nifty_daily_ohlc_service import (
+    get_previous_sessions,
+    rebuild_daily_ohlc,
+)
+from backend.app.services.nifty_market_data_service import get_open_window_bars
+from backend.app.services.nifty_stock_data_service import get_layer1_features
+from backend.app.services.step1_service import compute_step1_context
+from backend.app.services.step2_service import OPEN_WINDOW_BARS, analyze_open_window
+from backend.app.services.step3_layer1_snapshot_service import (
+    LIQUIDITY_THRESHOLD_RUPEES,
+    apply_layer1_filter,
+)
+from backend.app.services.step3_service import (
+    RS_THRESHOLD,
+    _derive_step3a,
+    _evaluate_batch,
+)
+from backend.app.services.step4_service import _size_position, _structural_levels
+from backend.app.services.trading_calendar_service import trading_calendar
+
+logger = logging.getLogger(__name__)
+
+# Rollup lookback rebuilt before the first date (STEP-1 needs 6 sessions)
+ROLLUP_LOOKBACK_DAYS = 30
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """
+    Tunable engine thresholds and sizing for one run.
+    """
+
+    liquidity_threshold: float = LIQUIDITY_THRESHOLD_RUPEES
+    rs_threshold: float = RS_THRESHOLD
+
+    capital: float = 100_000.0
+    risk_percent: float = 1.0
+    r_multiple: float = 2.0
+    entry_buffer: float = 0.0
+
+
+# =========================================================
+# DATA LOADERS (READ-ONLY)
+# =========================================================
+
+def _load_open_window(nifty_db: Session, trade_date: date) -> List[Step2CandleInput]:
+
+    bars = get_open_window_bars(nifty_db, trade_date, limit=OPEN_WINDOW_BARS)
+
+    return [
+        Step2CandleInput(
+            timestamp=b["bar_at"].strftime("%H:%M"),
+            open=b["open"],
+            high=b["high"],
+            low=b["low"],
+            close=b["close"],
+            volume=b["volume"],
+        )
+        for b in bars
+    ]
+
+
+def _load_day_bars(db: Session, trade_date: date, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Daily stock bars. Only the open feeds the decision
+    chain; high / low / close resolve outcomes afterwards.
+    """
+
+    if not symbols:
+        return {}
+
+    rows = db.execute(text("""
+        SELECT symbol, open, high, low, close
+        FROM intraday_bhavcopy
+        WHERE trade_date = :trade_date
+          AND symbol IN :symbols
+    """), {"trade_date": trade_date, "symbols": tuple(symbols)}).fetchall()
+
+    return {
+        r[0]: {
+            "open": float(r[1] or 0),
+            "high": float(r[2] or 0),
+            "low": float(r[3] or 0),
+            "close": float(r[4] or 0),
+        }
+        for r in rows
+    }
+
+
+# =========================================================
+# TRADE OUTCOME (DAILY BAR)
+# =========================================================
+
+def _trade_outcome(direction: str, entry: float, stop: float, target: float, bar: Dict[str, float]) -> Tuple[str, Optional[float]]:
+    """
+    Returns (outcome, exit_price) for a stop-entry order
+    at `entry`, resolved against the day's high / low.
+    """
+
+    if direction == "LONG":
+        triggered = bar["high"] >= entry
+        stop_hit = bar["low"] <= stop
+        target_hit = bar["high"] >= target
+    else:
+        triggered = bar["low"] <= entry
+        stop_hit = bar["high"] >= stop
+        target_hit = bar["low"] <= target
+
+    if not triggered:
+        return "NOT_TRIGGERED", None
+    if stop_hit and target_hit:
+        return "AMBIGUOUS", None
+    if stop_hit:
+        return "LOSS", stop
+    if target_hit:
+        return "WIN", target
+
+    return "CLOSED", bar["close"]
+
+
+# =========================================================
+# ONE DAY
+# =========================================================
+
+def replay_trade_date(
+    db: Session,
+    nifty_db: Session,
+    trade_date: date,
+    config: BacktestConfig,
+) -> Dict:
+
+    report: Dict = {
+        "trade_date": trade_date.isoformat(),
+        "market_context": None,
+        "trade_permission": None,
+        "allowed_strategies": [],
+        "max_trades": 0,
+        "layer1_passed": 0,
+        "qualified": 0,
+        "trades": [],
+        "day_r": 0.0,
+        "day_pnl": 0.0,
+        "skipped_reason": None,
+    }
+
+    # ---------- STEP-1 ----------
+    sessions = get_previous_sessions(nifty_db, trade_date, limit=6, sync=False)
+    window = _load_open_window(nifty_db, trade_date)
+
+    if len(sessions) < 6 or not window:
+        report["skipped_reason"] = "Not enough NIFTY history"
+        return report
+
+    yesterday, day2 = sessions[0], sessions[1]
+
+    step1 = compute_step1_context(
+        Step1ComputeRequest(
+            yesterday_close=yesterday.close,
+            yesterday_high=yesterday.high,
+            yesterday_low=yesterday.low,
+            day2_high=day2.high,
+            day2_low=day2.low,
+            last_5_day_ranges=[s.day_range for s in sessions[:5]],
+            preopen_price=window[0].open,
+        )
+    )
+
+    market_context = step1.suggested_market_context
+
+    # ---------- STEP-2 ----------
+    step2 = analyze_open_window(window, yesterday.last20_avg_range)
+    trade_permission = "YES" if step2["trade_allowed"] else "NO"
+
+    # ---------- STEP-3A ----------
+    allowed, max_trades, execution_allowed = _derive_step3a(market_context, trade_permission)
+
+    report.update(
+        market_context=market_context,
+        trade_permission=trade_permission,
+        allowed_strategies=allowed,
+        max_trades=max_trades,
+    )
+
+    if not execution_allowed:
+        return report
+
+    # ---------- STEP-3 Layer-1 ----------
+    layer1_rows = get_layer1_features(db, trade_date, sync=False)
+
+    passed = apply_layer1_filter(
+        layer1_rows,
+        liquidity_threshold=config.liquidity_threshold,
+    )
+    report["layer1_passed"] = len(passed)
+
+    if not passed:
+        return report
+
+    features = {f["symbol"]: f for f in layer1_rows}
+    bars = _load_day_bars(db, trade_date, [p["symbol"] for p in passed])
+
+    nifty_prev_close = yesterday.close
+    nifty_open = window[0].open
+
+    # ---------- STEP-3 Layer-2/3 (open-auction proxy) ----------
+    contexts = []
+
+    for p in passed:
+
+        stock_open = bars.get(p["symbol"], {}).get("open")
+        prev_close = features[p["symbol"]]["close"]
+
+        if not stock_open or not prev_close:
+            continue
+
+        gap_pct = (stock_open - prev_close) / prev_close * 100
+
+        contexts.append(
+            Step3StockContext(
+                symbol=p["symbol"],
+                avg_traded_value_20d=p["avg_traded_value_20d"],
+                atr_pct=p["atr_pct"],
+                abnormal_candle=p["abnormal_candle"],
+                stock_open_0915=prev_close,
+                stock_current_price=stock_open,
+                nifty_open_0915=nifty_prev_close,
+                nifty_current_price=nifty_open,
+                gap_pct=gap_pct,
+                gap_hold=True,
+                price_vs_vwap="ABOVE" if gap_pct >= 0 else "BELOW",
+                structure_valid=True,
+            )
+        )
+
+    evaluated = _evaluate_batch(contexts, allowed, rs_threshold=config.rs_threshold)
+    qualified = [c for c in evaluated if c.strategy_used != "NO_TRADE"]
+
+    report["qualified"] = len(qualified)
+
+    # ---------- STEP-4 (sizing from the STEP-3 structure) ----------
+    for candidate in qualified[:max_trades]:
+
+        trade = {
+            "symbol": candidate.symbol,
+            "direction": candidate.direction,
+            "strategy_used": candidate.strategy_used,
+            "rs_value": candidate.rs_value,
+            "entry_price": None,
+            "stop_loss": None,
+            "target_price": None,
+            "quantity": 0,
+            "trade_status": "BLOCKED",
+            "block_reason": None,
+            "outcome": None,
+            "realised_r": 0.0,
+            "pnl": 0.0,
+        }
+
+        try:
+            entry_price, stop_loss = _structural_levels(candidate, config.entry_buffer)
+        except ValueError as e:
+            trade["block_reason"] = str(e)
+            report["trades"].append(trade)
+            continue
+
+        risk_per_share = abs(entry_price - stop_loss)
+
+        quantity, target_price, trade_status, block_reason = _size_position(
+            candidate.direction,
+            entry_price,
+            risk_per_share,
+            config.capital,
+            config.risk_percent,
+            config.r_multiple,
+        )
+
+        trade.update(
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            target_price=target_price,
+            quantity=quantity,
+            trade_status=trade_status,
+            block_reason=block_reason,
+        )
+
+        if trade_status == "READY":
+
+            outcome, exit_price = _trade_outcome(
+                candidate.direction, entry_price, stop_loss, target_price,
+                bars[candidate.symbol],
+            )
+            trade["outcome"] = outcome
+
+            if exit_price is not None:
+                sign = 1 if candidate.direction == "LONG" else -1
+                move = (exit_price - entry_price) * sign
+
+                trade["realised_r"] = move / risk_per_share
+                trade["pnl"] = move * quantity
+
+                report["day_r"] += trade["realised_r"]
+                report["day_pnl"] += trade["pnl"]
+
+        report["trades"].append(trade)
+
+    return report
+
+
+# =========================================================
+# PROCESS POOL
+# =========================================================
+
+def _init_worker() -> None:
+    # Connections inherited from the parent must not be reused
+    engine.dispose(close=False)
+    engine_nifty.dispose(close=False)
+
+
+def _replay_chunk(trade_dates: List[date], config: BacktestConfig) -> List[Dict]:
+
+    reports = []
+
+    with session_scope() as db, nifty_session_scope() as nifty_db:
+        for trade_date in trade_dates:
+            try:
+                reports.append(replay_trade_date(db, nifty_db, trade_date, config))
+            except Exception as e:
+                logger.exception("[BACKTEST][DAY][ERROR] trade_date=%s", trade_date)
+                reports.append({
+                    "trade_date": trade_date.isoformat(),
+                    "skipped_reason": f"Error: {e}",
+                    "trades": [],
+                })
+
+    return reports
+
+
+def summarize_backtest(reports: List[Dict]) -> Dict:
+
+    replayed = [r for r in reports if not r.get("skipped_reason")]
+    planned = [t for r in replayed for t in r["trades"]]
+    resolved = [t for t in planned if t["outcome"] in ("WIN", "LOSS", "CLOSED")]
+
+    def _rate(count: int, total: int) -> Optional[float]:
+        return round(count / total, 4) if total else None
+
+    def _counts(key: str, trades: List[Dict]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for t in trades:
+            if t[key] is not None:
+                counts[t[key]] = counts.get(t[key], 0) + 1
+        return counts
+
+    outcomes = _counts("outcome", planned)
+
+    return {
+        "days": len(reports),
+        "days_replayed": len(replayed),
+        "permission_rate": _rate(
+            sum(1 for r in replayed if r["trade_permission"] == "YES"),
+            len(replayed),
+        ),
+        "execution_rate": _rate(
+            sum(1 for r in replayed if r["max_trades"] > 0),
+            len(replayed),
+        ),
+        "avg_layer1_passed": _rate(sum(r["layer1_passed"] for r in replayed), len(replayed)),
+        "avg_qualified": _rate(sum(r["qualified"] for r in replayed), len(replayed)),
+        "planned_trades": len(planned),
+        "ready_trades": sum(1 for t in planned if t["trade_status"] == "READY"),
+        "by_strategy": _counts("strategy_used", planned),
+        "outcomes": outcomes,
+        "ambiguous_days": sum(
+            1 for r in replayed
+            if any(t["outcome"] == "AMBIGUOUS" for t in r["trades"])
+        ),
+        "win_rate": _rate(outcomes.get("WIN", 0), len(resolved)),
+        "total_r": round(sum(t["realised_r"] for t in resolved), 4),
+        "total_pnl": round(sum(t["pnl"] for t in resolved), 2),
+    }
+
+
+def run_backtest(
+    start_date: date,
+    end_date: date,
+    config: BacktestConfig,
+    workers: Optional[int] = None,
+    chunk_size: int = 20,
+) -> Dict:
+    """
+    Replays every bhavcopy session in [start_date, end_date].
+    Returns {"config", "summary", "days"}.
+    """
+
+    with session_scope() as db, nifty_session_scope() as nifty_db:
+
+        trade_dates = trading_calendar.sessions_between(db, start_date, end_date)
+
+        # Workers read the rollups; build them once up front
+        rebuild_daily_ohlc(
+            nifty_db=nifty_db,
+            start_day=start_date - timedelta(days=ROLLUP_LOOKBACK_DAYS),
+            end_day=end_date,
+        )
+
+        rebuild_liquidity_rollup(
+            db=db,
+            start_date=start_date - timedelta(days=ROLLUP_LOOKBACK_DAYS),
+            end_date=end_date,
+            only_missing=True,
+        )
+
+    logger.info(
+        "[BACKTEST][START] from=%s to=%s sessions=%d workers=%s",
+        start_date,
+        end_date,
+        len(trade_dates),
+        workers,
+    )
+
+    chunks = [
+        trade_dates[i:i + chunk_size]
+        for i in range(0, len(trade_dates), chunk_size)
+    ]
+
+    reports: List[Dict] = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for chunk_reports in pool.map(_replay_chunk, chunks, [config] * len(chunks)):
+            reports.extend(chunk_reports)
+
+    summary = summarize_backtest(reports)
+
+    logger.info("[BACKTEST][DONE] summary=%s", summary)
+
+    return {
+        "config": asdict(config),
+        "summary": summary,
+        "days": reports,
+    }
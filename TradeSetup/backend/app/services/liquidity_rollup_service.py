@@ -0,0 +1,291 @@
+# backend/app/services/liquidity_rollup_service.py
+
+import logging
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.app.services.trading_calendar_service import trading_calendar
+
+logger = logging.getLogger(__name__)
+
+
+# Rolling windows (sessions, inclusive of trade_date)
+SHORT_WINDOW_SESSIONS = 20
+LONG_WINDOW_SESSIONS = 30
+
+# Largest gap sync fills forward; beyond it only the
+# requested session is built (use the job to backfill).
+MAX_SYNC_SESSIONS = 30
+
+
+# -------------------------------------------------
+# BUILD ONE SESSION
+# -------------------------------------------------
+
+def _window_starts(db: Session, trade_date: date) -> tuple:
+    """
+    (short_start, long_start): first session of the
+    20 / 30 session windows ending at trade_date.
+    """
+
+    window = trading_calendar.last_n_sessions(
+        db, trade_date, LONG_WINDOW_SESSIONS - 1
+    )
+
+    # window is newest first and excludes trade_date itself
+    long_start = window[-1] if window else trade_date
+    short_window = window[:SHORT_WINDOW_SESSIONS - 1]
+    short_start = short_window[-1] if short_window else trade_date
+
+    return short_start, long_start
+
+
+def _build_session(db: Session, trade_date: date) -> int:
+    """
+    Upserts every symbol's 20 / 30 session averages as of
+    trade_date with one grouped scan of the 30-session window.
+    Rows of symbols no longer in the window are dropped.
+    Returns rows written.
+    """
+
+    short_start, long_start = _window_starts(db, trade_date)
+
+    db.execute(
+        text("""
+            DELETE FROM symbol_liquidity_daily
+            WHERE trade_date = :trade_date
+              AND symbol NOT IN (
+                  SELECT symbol FROM (
+                      SELECT DISTINCT symbol
+                      FROM intraday_bhavcopy
+                      WHERE trade_date >= :long_start
+                        AND trade_date <= :trade_date
+                  ) AS w
+              )
+        """),
+        {"trade_date": trade_date, "long_start": long_start},
+    )
+
+    result = db.execute(
+        text("""
+            INSERT INTO symbol_liquidity_daily (
+                trade_date, symbol,
+                avg_trdval_20d, avg_trdval_30d,
+                sessions_20d, sessions_30d
+            )
+            SELECT
+                :trade_date,
+                symbol,
+                AVG(CASE WHEN trade_date >= :short_start THEN net_trdval END),
+                AVG(net_trdval),
+                SUM(trade_date >= :short_start),
+                COUNT(*)
+            FROM intraday_bhavcopy
+            WHERE trade_date >= :long_start
+              AND trade_date <= :trade_date
+            GROUP BY symbol
+            ON DUPLICATE KEY UPDATE
+                avg_trdval_20d = VALUES(avg_trdval_20d),
+                avg_trdval_30d = VALUES(avg_trdval_30d),
+                sessions_20d = VALUES(sessions_20d),
+                sessions_30d = VALUES(sessions_30d),
+                updated_at = NOW()
+        """),
+        {
+            "trade_date": trade_date,
+            "short_start": short_start,
+            "long_start": long_start,
+        },
+    )
+
+    return result.rowcount
+
+
+# -------------------------------------------------
+# REBUILD (BACKFILL / RE-IMPORT) + SYNC
+# -------------------------------------------------
+
+def _session_state(db: Session, trade_date: date) -> str:
+    """
+    MISSING (no rows), STALE or CURRENT.
+
+    Watermark: the session's rows must account for
+    every bhavcopy row in its 30-session window
+    (SUM(sessions_30d) == COUNT(*)). A day or symbol
+    imported after the session was built changes the
+    count. Value-only corrections keep it and need
+    rebuild_after_import.
+    """
+
+    _, long_start = _window_starts(db, trade_date)
+
+    row = db.execute(
+        text("""
+            SELECT
+                (SELECT SUM(sessions_30d)
+                   FROM symbol_liquidity_daily
+                  WHERE trade_date = :trade_date),
+                (SELECT COUNT(*)
+                   FROM intraday_bhavcopy
+                  WHERE trade_date >= :long_start
+                    AND trade_date <= :trade_date)
+        """),
+        {"trade_date": trade_date, "long_start": long_start},
+    ).fetchone()
+
+    if row[0] is None:
+        return "MISSING"
+
+    return "CURRENT" if int(row[0]) == int(row[1]) else "STALE"
+
+
+def _built_sessions(db: Session, start_date: date, end_date: date) -> set:
+
+    rows = db.execute(
+        text("""
+            SELECT DISTINCT trade_date
+            FROM symbol_liquidity_daily
+            WHERE trade_date >= :start_date
+              AND trade_date <= :end_date
+        """),
+        {"start_date": start_date, "end_date": end_date},
+    ).fetchall()
+
+    return {r[0] for r in rows}
+
+
+def rebuild_liquidity_rollup(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    only_missing: bool = False,
+) -> int:
+    """
+    Recomputes the rollup for every session in
+    [start_date, end_date] (after re-importing bhavcopy
+    days), or only sessions without rows when
+    only_missing is set. Returns sessions written.
+    """
+
+    sessions = trading_calendar.sessions_between(db, start_date, end_date)
+
+    if only_missing:
+        built = _built_sessions(db, start_date, end_date)
+        sessions = [d for d in sessions if d not in built]
+
+    for session_date in sessions:
+        _build_session(db, session_date)
+        db.commit()
+
+    logger.info(
+        "[LIQUIDITY][ROLLUP][REBUILD] sessions=%s start_date=%s end_date=%s",
+        len(sessions),
+        start_date,
+        end_date,
+    )
+
+    return len(sessions)
+
+
+def rebuild_after_import(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> int:
+    """
+    Rebuilds every session whose window contains a
+    re-imported day in [start_date, end_date]: those
+    sessions plus the LONG_WINDOW_SESSIONS after
+    end_date (end_date=None → through the latest
+    session, start_date=None → from the first).
+
+    The calendar is reloaded first, as the import may
+    have added or removed dates.
+    """
+
+    trading_calendar.invalidate()
+
+    sessions = trading_calendar.sessions_between(db, start_date or date.min, date.max)
+
+    if end_date is not None:
+        following = [d for d in sessions if d > end_date][:LONG_WINDOW_SESSIONS]
+        sessions = [d for d in sessions if d <= end_date] + following
+
+    if not sessions:
+        return 0
+
+    return rebuild_liquidity_rollup(db, sessions[0], sessions[-1])
+
+
+def sync_liquidity_rollup(
+    db: Session,
+    through_date: Optional[date] = None,
+) -> int:
+    """
+    Makes sure the rollup has current rows for
+    through_date (default: latest bhavcopy session).
+    When it does, this is one indexed count per table
+    (see _session_state).
+
+    Sessions are independent, so a missing session is
+    built on its own; a short gap after the newest
+    built session is filled forward with it. A stale
+    session (bhavcopy rows added / removed in its window
+    since it was built) is rebuilt on its own.
+    """
+
+    if through_date is None:
+        through_date = trading_calendar.previous(db, date.max)
+        if through_date is None:
+            return 0
+
+    state = _session_state(db, through_date)
+
+    if state == "CURRENT":
+        return 0
+
+    if state == "STALE":
+        _build_session(db, through_date)
+        db.commit()
+
+        logger.info(
+            "[LIQUIDITY][ROLLUP][STALE] trade_date=%s rebuilt",
+            through_date,
+        )
+
+        return 1
+
+    watermark = db.execute(
+        text("""
+            SELECT MAX(trade_date)
+            FROM symbol_liquidity_daily
+            WHERE trade_date < :through_date
+        """),
+        {"through_date": through_date},
+    ).scalar()
+
+    pending = [through_date]
+
+    if watermark is not None:
+        gap = [
+            d for d in trading_calendar.sessions_between(db, watermark, through_date)
+            if d > watermark
+        ]
+        if 0 < len(gap) <= MAX_SYNC_SESSIONS:
+            pending = gap
+
+    for session_date in pending:
+        _build_session(db, session_date)
+        db.commit()
+
+    logger.info(
+        "[LIQUIDITY][ROLLUP][SYNC] sessions=%s first=%s last=%s",
+        len(pending),
+        pending[0],
+        pending[-1],
+    )
+
+    return len(pending)
@@ -0,0 +1,247 @@
+# backend/app/services/nifty_daily_ohlc_service.py
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from backend.app.models.nifty_daily_ohlc import NiftyDailyOhlc
+
+logger = logging.getLogger(__name__)
+
+
+# Bars per session used for the Step-2 baseline
+LAST_N_CANDLES = 20
+
+# When the rollup is empty, rebuild this many calendar
+# days back from the newest bar (covers 6+ sessions).
+BOOTSTRAP_LOOKBACK_DAYS = 30
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+# -------------------------------------------------
+# AGGREGATION
+# -------------------------------------------------
+
+def _aggregate_sessions(rows) -> List[Dict]:
+    """
+    Folds 5-minute bars (ordered by Date ASC)
+    into one rollup row per session.
+    """
+
+    sessions: Dict[date, Dict] = {}
+    ranges_by_day: Dict[date, List[float]] = {}
+
+    for bar_at, bar_open, bar_high, bar_low, bar_close in rows:
+
+        day = bar_at.date()
+        session = sessions.get(day)
+
+        if session is None:
+            session = {
+                "trade_date": day,
+                "open": float(bar_open),
+                "high": float(bar_high),
+                "low": float(bar_low),
+                "close": float(bar_close),
+                "candle_count": 0,
+                "last_bar_at": bar_at,
+            }
+            sessions[day] = session
+            ranges_by_day[day] = []
+
+        session["high"] = max(session["high"], float(bar_high))
+        session["low"] = min(session["low"], float(bar_low))
+        session["close"] = float(bar_close)
+        session["candle_count"] += 1
+        session["last_bar_at"] = bar_at
+
+        ranges_by_day[day].append(float(bar_high - bar_low))
+
+    for day, session in sessions.items():
+
+        session["day_range"] = session["high"] - session["low"]
+
+        last_ranges = ranges_by_day[day][-LAST_N_CANDLES:]
+        session["last20_avg_range"] = (
+            sum(last_ranges) / len(last_ranges)
+            if last_ranges
+            else None
+        )
+
+    return list(sessions.values())
+
+
+# -------------------------------------------------
+# REBUILD (INCREMENTAL + BACKFILL)
+# -------------------------------------------------
+
+def rebuild_daily_ohlc(
+    nifty_db: Session,
+    start_day: date,
+    end_day: date,
+) -> int:
+    """
+    Recomputes rollup rows for every session in
+    [start_day, end_day] from nifty_prices and upserts them.
+
+    Uses a half-open range on `Date` so the index is used.
+    Returns the number of sessions written.
+    """
+
+    logger.debug(
+        "[NIFTY][OHLC][REBUILD] start_day=%s end_day=%s",
+        start_day,
+        end_day,
+    )
+
+    bars_query = text(
+        """
+        SELECT `Date`, `Open`, `High`, `Low`, `Close`
+        FROM nifty_prices
+        WHERE `Date` >= :range_start
+          AND `Date` < :range_end
+        ORDER BY `Date` ASC
+        """
+    )
+
+    rows = nifty_db.execute(
+        bars_query,
+        {
+            "range_start": _day_start(start_day),
+            "range_end": _day_start(end_day + timedelta(days=1)),
+        },
+    ).fetchall()
+
+    sessions = _aggregate_sessions(rows)
+
+    if not sessions:
+        return 0
+
+    table = NiftyDailyOhlc.__table__
+
+    upsert = mysql_insert(table).values(sessions)
+    upsert = upsert.on_duplicate_key_update(
+        {
+            column: upsert.inserted[column]
+            for column in (
+                "open",
+                "high",
+                "low",
+                "close",
+                "day_range",
+                "candle_count",
+                "last20_avg_range",
+                "last_bar_at",
+            )
+        },
+        updated_at=func.now(),
+    )
+
+    nifty_db.execute(upsert)
+    nifty_db.commit()
+
+    logger.info(
+        "[NIFTY][OHLC][REBUILD] sessions=%s start_day=%s end_day=%s",
+        len(sessions),
+        start_day,
+        end_day,
+    )
+
+    return len(sessions)
+
+
+def sync_daily_ohlc(
+    nifty_db: Session,
+    before_date: date,
+) -> int:
+    """
+    Brings the rollup up to date for sessions before
+    before_date. Only sessions at or after the rollup's
+    last_bar_at watermark are rebuilt, so a current
+    rollup costs two indexed MAX() lookups.
+    """
+
+    latest_bar_at = nifty_db.execute(
+        text(
+            """
+            SELECT MAX(`Date`)
+            FROM nifty_prices
+            WHERE `Date` < :cutoff
+            """
+        ),
+        {"cutoff": _day_start(before_date)},
+    ).scalar()
+
+    if latest_bar_at is None:
+        return 0
+
+    watermark = nifty_db.execute(
+        text(
+            """
+            SELECT MAX(last_bar_at)
+            FROM nifty_daily_ohlc
+            WHERE trade_date < :before_date
+            """
+        ),
+        {"before_date": before_date},
+    ).scalar()
+
+    if watermark is not None and watermark >= latest_bar_at:
+        return 0
+
+    start_day = (
+        watermark.date()
+        if watermark is not None
+        else latest_bar_at.date() - timedelta(days=BOOTSTRAP_LOOKBACK_DAYS)
+    )
+
+    return rebuild_daily_ohlc(
+        nifty_db=nifty_db,
+        start_day=start_day,
+        end_day=latest_bar_at.date(),
+    )
+
+
+# -------------------------------------------------
+# READS
+# -------------------------------------------------
+
+def get_previous_sessions(
+    nifty_db: Session,
+    trade_date: date,
+    limit: int,
+    sync: bool = True,
+) -> List[NiftyDailyOhlc]:
+    """
+    Last `limit` sessions before trade_date, newest first.
+    sync=False reads the rollup as-is (backtest workers,
+    after the parent has rebuilt the range once).
+    """
+
+    if sync:
+        sync_daily_ohlc(nifty_db, trade_date)
+
+    return (
+        nifty_db.query(NiftyDailyOhlc)
+        .filter(NiftyDailyOhlc.trade_date < trade_date)
+        .order_by(NiftyDailyOhlc.trade_date.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def get_previous_session(
+    nifty_db: Session,
+    trade_date: date,
+) -> Optional[NiftyDailyOhlc]:
+
+    sessions = get_previous_sessions(nifty_db, trade_date, limit=1)
+
+    return sessions[0] if sessions else None
@@ -0,0 +1,744 @@
+# backend/app/services/nifty_indicator_service.py
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from sqlalchemy import func, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from backend.app.models.nifty_indicator import NiftyIndicator
+from backend.app.services.nifty_daily_ohlc_service import sync_daily_ohlc
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------
+# PARAMETERS
+# -------------------------------------------------
+
+SMA_FAST = 5
+SMA_SLOW = 20
+# EMA is seeded with the SMA_SLOW window, so the periods match
+EMA_PERIOD = SMA_SLOW
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+
+# Every indicator is warm after this many bars;
+# resuming needs this many stored closes.
+WARMUP_BARS = max(SMA_SLOW, EMA_PERIOD, RSI_PERIOD + 1, ATR_PERIOD)
+
+TIMEFRAME_5M = "5m"
+TIMEFRAME_1D = "1d"
+TIMEFRAMES = (TIMEFRAME_5M, TIMEFRAME_1D)
+
+INDICATOR_COLUMNS = ("sma_5", "sma_20", "ema_20", "rsi_14", "atr_14")
+
+# nifty_prices column ← indicator (5m mirror)
+LEGACY_COLUMNS = {
+    "SMA_5": "sma_5",
+    "SMA_20": "sma_20",
+    "RSI": "rsi_14",
+    "ATR": "atr_14",
+}
+
+WRITE_CHUNK_SIZE = 2000
+
+
+def _rsi(avg_gain: float, avg_loss: float) -> float:
+
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+def _true_range(high: float, low: float, prev_close: Optional[float]) -> float:
+
+    if prev_close is None:
+        return high - low
+
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+# -------------------------------------------------
+# FULL SERIES (NUMPY)
+# -------------------------------------------------
+
+def compute_indicator_series(
+    high: Sequence[float],
+    low: Sequence[float],
+    close: Sequence[float],
+) -> Dict[str, np.ndarray]:
+    """
+    Indicators for a whole series, oldest bar first.
+    NaN during warm-up.
+
+    SMA / true range / gains are vectorized; the
+    EMA and Wilder recursions are a single pass.
+    """
+
+    h = np.asarray(high, dtype=float)
+    l = np.asarray(low, dtype=float)
+    c = np.asarray(close, dtype=float)
+    n = len(c)
+
+    def sma(window: int) -> np.ndarray:
+        out = np.full(n, np.nan)
+        if n >= window:
+            out[window - 1:] = sliding_window_view(c, window).mean(axis=1)
+        return out
+
+    sma_fast = sma(SMA_FAST)
+    sma_slow = sma(SMA_SLOW)
+
+    # EMA seeded with the SMA of its first window
+    ema = np.full(n, np.nan)
+    if n >= EMA_PERIOD:
+        alpha = 2.0 / (EMA_PERIOD + 1)
+        ema[EMA_PERIOD - 1] = c[:EMA_PERIOD].mean()
+        for i in range(EMA_PERIOD, n):
+            ema[i] = ema[i - 1] + alpha * (c[i] - ema[i - 1])
+
+    # RSI (Wilder), first value after RSI_PERIOD changes
+    avg_gain = np.full(n, np.nan)
+    avg_loss = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    if n > RSI_PERIOD:
+        delta = np.diff(c)
+        gains = np.maximum(delta, 0.0)
+        losses = np.maximum(-delta, 0.0)
+        avg_gain[RSI_PERIOD] = gains[:RSI_PERIOD].mean()
+        avg_loss[RSI_PERIOD] = losses[:RSI_PERIOD].mean()
+        for i in range(RSI_PERIOD + 1, n):
+            avg_gain[i] = (avg_gain[i - 1] * (RSI_PERIOD - 1) + gains[i - 1]) / RSI_PERIOD
+            avg_loss[i] = (avg_loss[i - 1] * (RSI_PERIOD - 1) + losses[i - 1]) / RSI_PERIOD
+        for i in range(RSI_PERIOD, n):
+            rsi[i] = _rsi(avg_gain[i], avg_loss[i])
+
+    # ATR (Wilder), first value after ATR_PERIOD bars
+    atr = np.full(n, np.nan)
+    if n >= ATR_PERIOD:
+        tr = h - l
+        if n > 1:
+            prev = c[:-1]
+            tr[1:] = np.maximum.reduce([h[1:] - l[1:], np.abs(h[1:] - prev), np.abs(l[1:] - prev)])
+        atr[ATR_PERIOD - 1] = tr[:ATR_PERIOD].mean()
+        for i in range(ATR_PERIOD, n):
+            atr[i] = (atr[i - 1] * (ATR_PERIOD - 1) + tr[i]) / ATR_PERIOD
+
+    return {
+        "sma_5": sma_fast,
+        "sma_20": sma_slow,
+        "ema_20": ema,
+        "rsi_14": rsi,
+        "atr_14": atr,
+        "rsi_avg_gain": avg_gain,
+        "rsi_avg_loss": avg_loss,
+    }
+
+
+# -------------------------------------------------
+# INCREMENTAL STATE (O(1) PER BAR)
+# -------------------------------------------------
+
+class IndicatorState:
+    """
+    Running indicator state for one series.
+    update() folds in the next bar and returns that
+    bar's values; same definitions as
+    compute_indicator_series().
+    """
+
+    def __init__(self) -> None:
+
+        self.count = 0
+        self.last_bar_at: Optional[datetime] = None
+
+        # last SMA_SLOW closes (ring buffer) and window sums
+        self._closes = np.zeros(SMA_SLOW)
+        self._sum_fast = 0.0
+        self._sum_slow = 0.0
+        self._prev_close: Optional[float] = None
+
+        self.ema: Optional[float] = None
+
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+
+        self._tr_sum = 0.0
+        self.atr: Optional[float] = None
+
+    @classmethod
+    def resume(cls, rows: List[Dict]) -> Optional["IndicatorState"]:
+        """
+        State after the last of `rows` (stored bars,
+        oldest first). None when there are too few warm
+        rows to resume from.
+        """
+
+        if len(rows) < WARMUP_BARS:
+            return None
+
+        last = rows[-1]
+
+        if any(last[k] is None for k in ("ema_20", "rsi_avg_gain", "rsi_avg_loss", "atr_14")):
+            return None
+
+        state = cls()
+        closes = [float(r["close"]) for r in rows[-SMA_SLOW:]]
+
+        # ring is indexed by count % SMA_SLOW: pick a warm count
+        # whose next slot is the oldest close
+        state.count = WARMUP_BARS + (-WARMUP_BARS) % SMA_SLOW
+        state._closes[:] = closes
+        state._sum_fast = sum(closes[-SMA_FAST:])
+        state._sum_slow = sum(closes)
+        state._prev_close = closes[-1]
+        state.last_bar_at = last["bar_at"]
+
+        state.ema = float(last["ema_20"])
+        state.avg_gain = float(last["rsi_avg_gain"])
+        state.avg_loss = float(last["rsi_avg_loss"])
+        state.atr = float(last["atr_14"])
+
+        return state
+
+    def update(self, bar_at: datetime, high: float, low: float, close: float) -> Dict:
+
+        i = self.count
+        slot = i % SMA_SLOW
+
+        # ---- SMA windows ----
+        self._sum_fast += close
+        if i >= SMA_FAST:
+            self._sum_fast -= self._closes[(i - SMA_FAST) % SMA_SLOW]
+        self._sum_slow += close - (self._closes[slot] if i >= SMA_SLOW else 0.0)
+        self._closes[slot] = close
+
+        sma_fast = self._sum_fast / SMA_FAST if i >= SMA_FAST - 1 else None
+        sma_slow = self._sum_slow / SMA_SLOW if i >= SMA_SLOW - 1 else None
+
+        # ---- EMA ----
+        if i == EMA_PERIOD - 1:
+            self.ema = sma_slow
+        elif i >= EMA_PERIOD:
+            self.ema += 2.0 / (EMA_PERIOD + 1) * (close - self.ema)
+
+        # ---- RSI (Wilder) ----
+        if self._prev_close is not None:
+            delta = close - self._prev_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            if i < RSI_PERIOD:
+                self._gain_sum += gain
+                self._loss_sum += loss
+            elif i == RSI_PERIOD:
+                self.avg_gain = (self._gain_sum + gain) / RSI_PERIOD
+                self.avg_loss = (self._loss_sum + loss) / RSI_PERIOD
+            else:
+                self.avg_gain = (self.avg_gain * (RSI_PERIOD - 1) + gain) / RSI_PERIOD
+                self.avg_loss = (self.avg_loss * (RSI_PERIOD - 1) + loss) / RSI_PERIOD
+
+        # ---- ATR (Wilder) ----
+        tr = _true_range(high, low, self._prev_close)
+        if i < ATR_PERIOD - 1:
+            self._tr_sum += tr
+        elif i == ATR_PERIOD - 1:
+            self.atr = (self._tr_sum + tr) / ATR_PERIOD
+        else:
+            self.atr = (self.atr * (ATR_PERIOD - 1) + tr) / ATR_PERIOD
+
+        self._prev_close = close
+        self.last_bar_at = bar_at
+        self.count += 1
+
+        rsi_ready = i >= RSI_PERIOD
+
+        return {
+            "bar_at": bar_at,
+            "close": close,
+            "sma_5": sma_fast,
+            "sma_20": sma_slow,
+            "ema_20": self.ema,
+            "rsi_14": _rsi(self.avg_gain, self.avg_loss) if rsi_ready else None,
+            "atr_14": self.atr,
+            "rsi_avg_gain": self.avg_gain if rsi_ready else None,
+            "rsi_avg_loss": self.avg_loss if rsi_ready else None,
+        }
+
+
+# -------------------------------------------------
+# SOURCE BARS
+# -------------------------------------------------
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def _load_bars(
+    nifty_db: Session,
+    timeframe: str,
+    after: Optional[datetime] = None,
+    with_legacy: bool = False,
+    sync_rollup: bool = True,
+) -> List[Dict]:
+    """
+    Source bars newer than `after`, oldest first:
+    nifty_prices for 5m, nifty_daily_ohlc for 1d.
+    sync_rollup=False reads nifty_daily_ohlc as-is
+    (request paths, where STEP-1 has already synced it).
+    """
+
+    after = after or datetime.min
+
+    if timeframe == TIMEFRAME_5M:
+
+        legacy = ", `SMA_5`, `SMA_20`, `RSI`, `ATR`" if with_legacy else ""
+
+        rows = nifty_db.execute(
+            text(f"""
+                SELECT `Date` AS bar_at, `High` AS high, `Low` AS low, `Close` AS close{legacy}
+                FROM nifty_prices
+                WHERE `Date` > :after
+                ORDER BY `Date` ASC
+            """),
+            {"after": after},
+        ).mappings().all()
+
+        return [dict(r) for r in rows]
+
+    if timeframe == TIMEFRAME_1D:
+
+        # only closed sessions; today's bar is still forming
+        if sync_rollup:
+            sync_daily_ohlc(nifty_db, date.today())
+
+        rows = nifty_db.execute(
+            text("""
+                SELECT trade_date, high, low, close
+                FROM nifty_daily_ohlc
+                WHERE trade_date > :after
+                  AND trade_date < :today
+                ORDER BY trade_date ASC
+            """),
+            {"after": after.date(), "today": date.today()},
+        ).mappings().all()
+
+        return [
+            {
+                "bar_at": _day_start(r["trade_date"]),
+                "high": r["high"],
+                "low": r["low"],
+                "close": r["close"],
+            }
+            for r in rows
+        ]
+
+    raise ValueError(f"Unknown timeframe {timeframe!r}; expected one of {TIMEFRAMES}")
+
+
+def _load_state_rows(
+    nifty_db: Session,
+    timeframe: str,
+    before: Optional[datetime] = None,
+) -> List[Dict]:
+    """
+    Last WARMUP_BARS stored rows (before `before`),
+    oldest first.
+    """
+
+    rows = nifty_db.execute(
+        text("""
+            SELECT bar_at, close, ema_20, rsi_avg_gain, rsi_avg_loss, atr_14
+            FROM nifty_indicators
+            WHERE timeframe = :timeframe
+              AND bar_at < :before
+            ORDER BY bar_at DESC
+            LIMIT :limit
+        """),
+        {
+            "timeframe": timeframe,
+            "before": before or datetime.max,
+            "limit": WARMUP_BARS,
+        },
+    ).mappings().all()
+
+    return [dict(r) for r in reversed(rows)]
+
+
+# -------------------------------------------------
+# WRITES
+# -------------------------------------------------
+
+def _clean(value) -> Optional[float]:
+
+    if value is None:
+        return None
+
+    value = float(value)
+
+    return None if np.isnan(value) else value
+
+
+def _write_rows(nifty_db: Session, timeframe: str, rows: List[Dict]) -> None:
+
+    table = NiftyIndicator.__table__
+    update_columns = ("close",) + INDICATOR_COLUMNS + ("rsi_avg_gain", "rsi_avg_loss")
+
+    for start in range(0, len(rows), WRITE_CHUNK_SIZE):
+
+        chunk = [
+            {
+                "timeframe": timeframe,
+                "bar_at": r["bar_at"],
+                "close": float(r["close"]),
+                **{k: _clean(r[k]) for k in update_columns if k != "close"},
+            }
+            for r in rows[start:start + WRITE_CHUNK_SIZE]
+        ]
+
+        upsert = mysql_insert(table).values(chunk)
+        upsert = upsert.on_duplicate_key_update(
+            {column: upsert.inserted[column] for column in update_columns},
+            updated_at=func.now(),
+        )
+
+        nifty_db.execute(upsert)
+
+        if timeframe == TIMEFRAME_5M:
+            nifty_db.execute(
+                text("""
+                    UPDATE nifty_prices
+                    SET `SMA_5` = :sma_5,
+                        `SMA_20` = :sma_20,
+                        `RSI` = :rsi_14,
+                        `ATR` = :atr_14
+                    WHERE `Date` = :bar_at
+                """),
+                chunk,
+            )
+
+    nifty_db.commit()
+
+
+# -------------------------------------------------
+# REBUILD / SYNC
+# -------------------------------------------------
+
+def _full_rebuild(nifty_db: Session, timeframe: str) -> int:
+
+    bars = _load_bars(nifty_db, timeframe)
+
+    if not bars:
+        return 0
+
+    series = compute_indicator_series(
+        [b["high"] for b in bars],
+        [b["low"] for b in bars],
+        [b["close"] for b in bars],
+    )
+
+    rows = [
+        {
+            "bar_at": bar["bar_at"],
+            "close": bar["close"],
+            **{name: values[i] for name, values in series.items()},
+        }
+        for i, bar in enumerate(bars)
+    ]
+
+    _write_rows(nifty_db, timeframe, rows)
+
+    logger.info(
+        "[NIFTY][INDICATORS][REBUILD] timeframe=%s bars=%s",
+        timeframe,
+        len(rows),
+    )
+
+    return len(rows)
+
+
+def _extend(
+    nifty_db: Session,
+    timeframe: str,
+    state: IndicatorState,
+    bars: List[Dict],
+) -> int:
+
+    rows = [
+        state.update(bar["bar_at"], float(bar["high"]), float(bar["low"]), float(bar["close"]))
+        for bar in bars
+    ]
+
+    _write_rows(nifty_db, timeframe, rows)
+
+    return len(rows)
+
+
+def rebuild_indicators(
+    nifty_db: Session,
+    timeframe: str,
+    start_date: Optional[date] = None,
+) -> int:
+    """
+    Recomputes the series from start_date to the
+    newest bar (EMA / Wilder values carry forward, so
+    everything after start_date is rewritten).
+
+    start_date=None, or too little stored history
+    before it, recomputes the whole series.
+    Returns the number of bars written.
+    """
+
+    if start_date is None:
+        return _full_rebuild(nifty_db, timeframe)
+
+    state = IndicatorState.resume(
+        _load_state_rows(nifty_db, timeframe, before=_day_start(start_date))
+    )
+
+    if state is None:
+        return _full_rebuild(nifty_db, timeframe)
+
+    written = _extend(
+        nifty_db,
+        timeframe,
+        state,
+        _load_bars(nifty_db, timeframe, after=state.last_bar_at),
+    )
+
+    logger.info(
+        "[NIFTY][INDICATORS][REBUILD] timeframe=%s start_date=%s bars=%s",
+        timeframe,
+        start_date,
+        written,
+    )
+
+    return written
+
+
+def sync_indicators(
+    nifty_db: Session,
+    timeframe: str,
+    allow_rebuild: bool = True,
+) -> int:
+    """
+    Appends bars newer than the stored series.
+    A current series costs one MAX() lookup and one
+    empty range read; each new bar is O(1).
+
+    allow_rebuild=False (request paths) only ever
+    appends: an empty series or one that cannot be
+    resumed is logged and skipped, and the daily
+    rollup is not synced. Full rebuilds are left to
+    jobs/backfill_nifty_indicators.py.
+    """
+
+    watermark = nifty_db.execute(
+        text("""
+            SELECT MAX(bar_at)
+            FROM nifty_indicators
+            WHERE timeframe = :timeframe
+        """),
+        {"timeframe": timeframe},
+    ).scalar()
+
+    if watermark is None:
+
+        if not allow_rebuild:
+            logger.warning(
+                "[NIFTY][INDICATORS][SKIP] timeframe=%s reason=empty series, run backfill_nifty_indicators",
+                timeframe,
+            )
+            return 0
+
+        return _full_rebuild(nifty_db, timeframe)
+
+    bars = _load_bars(nifty_db, timeframe, after=watermark, sync_rollup=allow_rebuild)
+
+    if not bars:
+        return 0
+
+    state = IndicatorState.resume(_load_state_rows(nifty_db, timeframe))
+
+    if state is None:
+
+        if not allow_rebuild:
+            logger.warning(
+                "[NIFTY][INDICATORS][SKIP] timeframe=%s reason=cannot resume, run backfill_nifty_indicators",
+                timeframe,
+            )
+            return 0
+
+        return _full_rebuild(nifty_db, timeframe)
+
+    written = _extend(nifty_db, timeframe, state, bars)
+
+    logger.info(
+        "[NIFTY][INDICATORS][SYNC] timeframe=%s appended=%s",
+        timeframe,
+        written,
+    )
+
+    return written
+
+
+# -------------------------------------------------
+# READS
+# -------------------------------------------------
+
+def get_previous_session_indicators(
+    nifty_db: Session,
+    trade_date: date,
+) -> Optional[Dict[str, Optional[float]]]:
+    """
+    Daily NIFTY indicators of the last session
+    before trade_date (appended first, never rebuilt).
+    """
+
+    sync_indicators(nifty_db, TIMEFRAME_1D, allow_rebuild=False)
+
+    row = nifty_db.execute(
+        text("""
+            SELECT sma_5, sma_20, ema_20, rsi_14, atr_14
+            FROM nifty_indicators
+            WHERE timeframe = :timeframe
+              AND bar_at < :before
+            ORDER BY bar_at DESC
+            LIMIT 1
+        """),
+        {"timeframe": TIMEFRAME_1D, "before": _day_start(trade_date)},
+    ).mappings().first()
+
+    return dict(row) if row else None
+
+
+# -------------------------------------------------
+# CONSISTENCY CHECK
+# -------------------------------------------------
+
+def _matches(stored, expected, tolerance: float) -> bool:
+
+    stored = _clean(stored)
+    expected = _clean(expected)
+
+    if stored is None or expected is None:
+        return stored is None and expected is None
+
+    return abs(stored - expected) <= tolerance * max(1.0, abs(expected))
+
+
+def check_indicators(
+    nifty_db: Session,
+    timeframe: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    tolerance: float = 1e-6,
+    max_examples: int = 10,
+) -> Dict:
+    """
+    Recomputes the full series with NumPy and compares
+    it to the stored rows in [start_date, end_date]
+    (and, for 5m, to the nifty_prices mirror columns).
+    """
+
+    bars = _load_bars(nifty_db, timeframe, with_legacy=timeframe == TIMEFRAME_5M)
+
+    series = compute_indicator_series(
+        [b["high"] for b in bars],
+        [b["low"] for b in bars],
+        [b["close"] for b in bars],
+    )
+
+    range_start = _day_start(start_date) if start_date else datetime.min
+    range_end = _day_start(end_date + timedelta(days=1)) if end_date else datetime.max
+
+    stored = {
+        r["bar_at"]: r
+        for r in nifty_db.execute(
+            text("""
+                SELECT bar_at, sma_5, sma_20, ema_20, rsi_14, atr_14
+                FROM nifty_indicators
+                WHERE timeframe = :timeframe
+                  AND bar_at >= :range_start
+                  AND bar_at < :range_end
+            """),
+            {"timeframe": timeframe, "range_start": range_start, "range_end": range_end},
+        ).mappings()
+    }
+
+    mismatches = {column: 0 for column in INDICATOR_COLUMNS}
+    legacy_mismatches = {column: 0 for column in LEGACY_COLUMNS}
+    missing = 0
+    checked = 0
+    examples: List[Dict] = []
+    seen = set()
+
+    for i, bar in enumerate(bars):
+
+        bar_at = bar["bar_at"]
+
+        if not range_start <= bar_at < range_end:
+            continue
+
+        checked += 1
+        seen.add(bar_at)
+        row = stored.get(bar_at)
+
+        if row is None:
+            missing += 1
+            if len(examples) < max_examples:
+                examples.append({"bar_at": bar_at, "issue": "missing"})
+            continue
+
+        for column in INDICATOR_COLUMNS:
+            expected = series[column][i]
+            if not _matches(row[column], expected, tolerance):
+                mismatches[column] += 1
+                if len(examples) < max_examples:
+                    examples.append({
+                        "bar_at": bar_at,
+                        "column": column,
+                        "stored": row[column],
+                        "expected": _clean(expected),
+                    })
+
+        if timeframe == TIMEFRAME_5M:
+            for legacy, column in LEGACY_COLUMNS.items():
+                if not _matches(bar[legacy], series[column][i], tolerance):
+                    legacy_mismatches[legacy] += 1
+
+    orphaned = len(set(stored) - seen)
+
+    report = {
+        "timeframe": timeframe,
+        "bars_checked": checked,
+        "missing_rows": missing,
+        "orphaned_rows": orphaned,
+        "mismatches": mismatches,
+        "examples": examples,
+    }
+
+    if timeframe == TIMEFRAME_5M:
+        report["legacy_mismatches"] = legacy_mismatches
+
+    report["consistent"] = (
+        missing == 0
+        and orphaned == 0
+        and not any(mismatches.values())
+        and not any(legacy_mismatches.values())
+    )
+
+    logger.info(
+        "[NIFTY][INDICATORS][CHECK] timeframe=%s checked=%s consistent=%s",
+        timeframe,
+        checked,
+        report["consistent"],
+    )
+
+    return report
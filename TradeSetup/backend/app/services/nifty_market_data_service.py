@@ -1,11 +1,19 @@
 # backend/app/services/nifty_market_data_service.py
 
 import logging
-from datetime import date
+from datetime import date, datetime, time, timedelta
 from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.app.services.nifty_daily_ohlc_service import (
+    get_previous_session,
+    get_previous_sessions,
+)
+from backend.app.services.nifty_indicator_service import (
+    get_previous_session_indicators,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +30,11 @@ def get_step1_structural_data(
     Fetches structural market data required for STEP-1 preview.
 
     Logic:
-    - Identify last 6 trading days before trade_date
-    - Aggregate 5-min candles into daily OHLC
+    - Read last 6 sessions before trade_date from the
+      nifty_daily_ohlc rollup (synced incrementally)
     - Return yesterday + day2 + last 5 daily ranges
+    - Plus yesterday's daily indicators (series
+      appended incrementally on read)
     """
 
     logger.debug(
@@ -32,54 +42,22 @@ def get_step1_structural_data(
         trade_date,
     )
 
-    trading_days_query = text(
-        """
-        SELECT DISTINCT DATE(`Date`) AS trading_day
-        FROM nifty_prices
-        WHERE DATE(`Date`) < :trade_date
-        ORDER BY trading_day DESC
-        LIMIT 6
-        """
-    )
+    sessions = get_previous_sessions(nifty_db, trade_date, limit=6)
 
-    result = nifty_db.execute(
-        trading_days_query,
-        {"trade_date": trade_date},
-    )
-
-    trading_days = [row.trading_day for row in result.fetchall()]
-
-    if len(trading_days) < 6:
+    if len(sessions) < 6:
         raise ValueError("Not enough historical data for STEP-1")
 
-    daily_data = {}
-
-    for day in trading_days:
-        daily_query = text(
-            """
-            SELECT
-                MAX(`High`) AS day_high,
-                MIN(`Low`) AS day_low,
-                (
-                    SELECT `Close`
-                    FROM nifty_prices
-                    WHERE DATE(`Date`) = :day
-                    ORDER BY `Date` DESC
-                    LIMIT 1
-                ) AS day_close
-            FROM nifty_prices
-            WHERE DATE(`Date`) = :day
-            """
-        )
-
-        row = nifty_db.execute(daily_query, {"day": day}).fetchone()
+    trading_days = [session.trade_date for session in sessions]
 
-        daily_data[day] = {
-            "high": float(row.day_high),
-            "low": float(row.day_low),
-            "close": float(row.day_close),
-            "range": float(row.day_high - row.day_low),
+    daily_data = {
+        session.trade_date: {
+            "high": session.high,
+            "low": session.low,
+            "close": session.close,
+            "range": session.day_range,
         }
+        for session in sessions
+    }
 
     yesterday = trading_days[0]
     day2 = trading_days[1]
@@ -94,6 +72,10 @@ def get_step1_structural_data(
         "last_5_day_ranges": [
             daily_data[d]["range"] for d in last_5_days
         ],
+        "prior_session_indicators": get_previous_session_indicators(
+            nifty_db=nifty_db,
+            trade_date=trade_date,
+        ),
     }
 
     logger.debug(
@@ -117,9 +99,9 @@ def get_previous_session_last20_avg_range(
     five-minute candles from the previous trading session.
 
     Behavior:
-    - Identifies the most recent session before trade_date
-    - Selects last 20 candles of that session
-    - Returns average(high - low)
+    - Reads the most recent session before trade_date
+      from the nifty_daily_ohlc rollup
+    - Returns its precomputed last-20 average(high - low)
     - Returns None if no candles exist
     """
 
@@ -128,56 +110,67 @@ def get_previous_session_last20_avg_range(
         trade_date,
     )
 
-    # 1️⃣ Identify previous trading session
-    previous_session_query = text(
-        """
-        SELECT DISTINCT DATE(`Date`) AS trading_day
-        FROM nifty_prices
-        WHERE DATE(`Date`) < :trade_date
-        ORDER BY trading_day DESC
-        LIMIT 1
-        """
-    )
-
-    session_row = nifty_db.execute(
-        previous_session_query,
-        {"trade_date": trade_date},
-    ).fetchone()
+    previous_session = get_previous_session(nifty_db, trade_date)
 
-    if not session_row:
+    if previous_session is None or previous_session.last20_avg_range is None:
         return None
 
-    previous_session = session_row.trading_day
-
-    # 2️⃣ Fetch last 20 candles of that session
-    last20_query = text(
-        """
-        SELECT (`High` - `Low`) AS candle_range
-        FROM nifty_prices
-        WHERE DATE(`Date`) = :previous_session
-        ORDER BY `Date` DESC
-        LIMIT 20
-        """
+    avg_range = previous_session.last20_avg_range
+
+    logger.debug(
+        "[NIFTY][STEP2] baseline computed trade_date=%s",
+        trade_date,
     )
 
-    rows = nifty_db.execute(
-        last20_query,
-        {"previous_session": previous_session},
-    ).fetchall()
+    return float(avg_range)
 
-    if not rows:
-        return None
 
-    ranges = [float(row.candle_range) for row in rows if row.candle_range is not None]
+# -------------------------------------------------
+# STEP-2 OPENING CANDLES (AUTO MODE / BACKTEST)
+# -------------------------------------------------
 
-    if not ranges:
-        return None
+def get_open_window_bars(
+    nifty_db: Session,
+    trade_date: date,
+    limit: int,
+    after: Optional[datetime] = None,
+) -> List[Dict]:
+    """
+    First `limit` five-minute bars of trade_date from
+    nifty_prices, oldest first.
 
-    avg_range = sum(ranges) / len(ranges)
+    after → only bars newer than this timestamp
+    (incremental polling; limit then caps the remainder).
+    """
 
-    logger.debug(
-        "[NIFTY][STEP2] baseline computed trade_date=%s",
-        trade_date,
-    )
+    day_start = datetime.combine(trade_date, time.min)
+
+    rows = nifty_db.execute(
+        text("""
+            SELECT `Date`, `Open`, `High`, `Low`, `Close`, `Volume`
+            FROM nifty_prices
+            WHERE `Date` >= :day_start
+              AND `Date` < :day_end
+              AND `Date` > :after
+            ORDER BY `Date` ASC
+            LIMIT :limit
+        """),
+        {
+            "day_start": day_start,
+            "day_end": day_start + timedelta(days=1),
+            "after": after or day_start - timedelta(seconds=1),
+            "limit": limit,
+        },
+    ).fetchall()
 
-    return float(avg_range)
\ No newline at end of file
+    return [
+        {
+            "bar_at": r[0],
+            "open": float(r[1]),
+            "high": float(r[2]),
+            "low": float(r[3]),
+            "close": float(r[4]),
+            "volume": float(r[5] or 0),
+        }
+        for r in rows
+    ]
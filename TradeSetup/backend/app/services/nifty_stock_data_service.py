@@ -8,6 +8,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 import logging
 
+from backend.app.services.liquidity_rollup_service import sync_liquidity_rollup
+from backend.app.services.trading_calendar_service import trading_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +21,7 @@ def _get_previous_trading_date(db: Session, trade_date: date) -> date:
     """
     Returns the most recent trading date before the given trade_date.
     """
-    sql = text("""
-        SELECT MAX(trade_date) AS prev_trade_date
-        FROM intraday_bhavcopy
-        WHERE trade_date < :trade_date
-    """)
-
-    row = db.execute(sql, {"trade_date": trade_date}).fetchone()
-    return row[0] if row and row[0] else None
+    return trading_calendar.previous(db, trade_date)
 
 
 # =========================================================
@@ -70,33 +65,25 @@ def get_avg_traded_value_20d(
     if not symbols:
         return {}
 
-    # Step 1: Get last 20 trading dates before the provided date
-    date_sql = text("""
-        SELECT DISTINCT trade_date
-        FROM intraday_bhavcopy
-        WHERE trade_date < :trade_date
-        ORDER BY trade_date DESC
-        LIMIT 20
-    """)
-
-    date_rows = db.execute(date_sql, {"trade_date": trade_date}).fetchall()
-    last_20_dates = [r[0] for r in date_rows]
+    # 20 sessions before trade_date == rollup row of the previous session
+    previous_trading_date = trading_calendar.previous(db, trade_date)
 
-    if not last_20_dates:
+    if previous_trading_date is None:
         # no history available yet
         return {}
 
-    # Step 2: Calculate average net traded value over those dates
+    sync_liquidity_rollup(db, previous_trading_date)
+
     sql = text("""
-        SELECT symbol, AVG(net_trdval) AS avg_20d
-        FROM intraday_bhavcopy
-        WHERE trade_date IN :last_20_dates
+        SELECT symbol, avg_trdval_20d
+        FROM symbol_liquidity_daily
+        WHERE trade_date = :previous_trading_date
           AND symbol IN :symbols
-        GROUP BY symbol
+          AND avg_trdval_20d IS NOT NULL
     """)
 
     rows = db.execute(sql, {
-        "last_20_dates": tuple(last_20_dates),
+        "previous_trading_date": previous_trading_date,
         "symbols": tuple(symbols),
     }).fetchall()
 
@@ -213,6 +200,101 @@ def get_yesterday_candles(
     return result
 
 
+# =========================================================
+# LAYER-1 FEATURES (SINGLE JOINED QUERY)
+# =========================================================
+
+def get_layer1_features(
+    db: Session,
+    trade_date: date,
+    sync: bool = True,
+) -> List[Dict]:
+    """
+    Loads everything Layer-1 needs for the whole universe
+    in one round trip: 20-day average traded value (from
+    the symbol_liquidity_daily rollup), atr_14 and the
+    previous session's candle.
+
+    Joins against instruments_master instead of binding the
+    universe into IN lists. Symbols missing any of the three
+    inputs are dropped (inner joins), as the Layer-1 filter
+    would skip them anyway.
+
+    sync=False reads the liquidity rollup as-is and never
+    writes (backtest workers, after the parent has rebuilt
+    the range once).
+
+    Returns:
+    [
+        {
+            "symbol": str,
+            "avg_traded_value_20d": float,
+            "atr_14": float,
+            "high": float,
+            "low": float,
+            "close": float,
+        }
+    ]
+    """
+
+    previous_trading_date = trading_calendar.previous(db, trade_date)
+
+    if previous_trading_date is None:
+        return []
+
+    if sync:
+        sync_liquidity_rollup(db, previous_trading_date)
+
+    sql = text("""
+        SELECT
+            im.symbol,
+            liq.avg_trdval_20d,
+            atr.value,
+            y.high,
+            y.low,
+            y.close
+        FROM instruments_master im
+        JOIN symbol_liquidity_daily liq
+            ON liq.symbol = im.symbol
+           AND liq.trade_date = :previous_trading_date
+           AND liq.avg_trdval_20d IS NOT NULL
+        JOIN strategy_features atr
+            ON atr.symbol = im.symbol
+           AND atr.trade_date = :previous_trading_date
+           AND atr.feature_name = 'atr_14'
+        JOIN intraday_bhavcopy y
+            ON y.symbol = im.symbol
+           AND y.trade_date = :previous_trading_date
+        WHERE im.include_in_bhav = 1
+    """)
+
+    rows = db.execute(sql, {
+        "previous_trading_date": previous_trading_date,
+    }).fetchall()
+
+    # keyed by symbol so duplicate joins collapse like the dict loaders
+    features = {
+        r[0]: {
+            "symbol": r[0],
+            "avg_traded_value_20d": float(r[1] or 0),
+            "atr_14": float(r[2] or 0),
+            "high": float(r[3] or 0),
+            "low": float(r[4] or 0),
+            "close": float(r[5] or 0),
+        }
+        for r in rows
+    }
+
+    logger.info(
+        "[MARKET_DATA][STATE][LAYER1_FEATURES_FETCHED] trade_date=%s previous=%s count=%s",
+        trade_date,
+        previous_trading_date,
+        len(features),
+    )
+
+    return list(features.values())
+
+
 # =========================================================
 # WRAPPER FUNCTIONS (ADDED — DO NOT REMOVE ORIGINALS)
 # =========================================================
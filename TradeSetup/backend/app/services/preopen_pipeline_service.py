@@ -0,0 +1,161 @@
+# =========================================================
+# File: backend/app/services/preopen_pipeline_service.py
+# =========================================================
+"""
+Pre-open pipeline: STEP-1 → STEP-2 → STEP-3 previews in one pass.
+
+Previews are cached per trade_date so the individual step
+preview endpoints serve the already-computed result during
+09:15–09:30 instead of repeating the DB / NIFTY work.
+
+Any freeze for a trade_date must call invalidate_preopen_cache().
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+import logging
+import threading
+
+from sqlalchemy.orm import Session
+
+from backend.app.schemas.pipeline_schema import PreopenPipelineResponse
+from backend.app.schemas.step1_schema import Step1PreviewResponse
+from backend.app.schemas.step2_schema import Step2PreviewResponse
+from backend.app.schemas.step3_schema import Step3ExecutionResponse
+from backend.app.services.step1_service import preview_step1_context
+from backend.app.services.step2_service import preview_step2_behavior
+from backend.app.services.step3_service import generate_step3_execution
+
+logger = logging.getLogger(__name__)
+
+# Trade dates kept in memory (today plus a few replays)
+MAX_CACHED_DATES = 8
+
+
+@dataclass
+class _PreviewCacheEntry:
+    step1: Optional[Step1PreviewResponse] = None
+    step2: Optional[Step2PreviewResponse] = None
+    step3: Optional[Step3ExecutionResponse] = None
+
+
+_cache: "OrderedDict[date, _PreviewCacheEntry]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# =========================================================
+# CACHE
+# =========================================================
+
+def _entry(trade_date: date) -> _PreviewCacheEntry:
+
+    with _cache_lock:
+        entry = _cache.get(trade_date)
+
+        if entry is None:
+            entry = _PreviewCacheEntry()
+            _cache[trade_date] = entry
+
+            while len(_cache) > MAX_CACHED_DATES:
+                _cache.popitem(last=False)
+        else:
+            _cache.move_to_end(trade_date)
+
+        return entry
+
+
+def invalidate_preopen_cache(trade_date: date) -> None:
+
+    with _cache_lock:
+        _cache.pop(trade_date, None)
+
+    logger.info("[PIPELINE][STATE][CACHE_INVALIDATED] trade_date=%s", trade_date)
+
+
+# =========================================================
+# CACHED STEP PREVIEWS
+# =========================================================
+
+def get_step1_preview(db: Session, nifty_db: Session, trade_date: date) -> Step1PreviewResponse:
+
+    entry = _entry(trade_date)
+
+    if entry.step1 is None:
+        entry.step1 = preview_step1_context(db=db, nifty_db=nifty_db, trade_date=trade_date)
+    else:
+        logger.debug("[PIPELINE][STATE][STEP1_CACHE_HIT] trade_date=%s", trade_date)
+
+    return entry.step1
+
+
+def get_step2_preview(
+    db: Session,
+    trade_date: date,
+    nifty_db: Session | None = None,
+) -> Step2PreviewResponse:
+
+    entry = _entry(trade_date)
+
+    if entry.step2 is None:
+        entry.step2 = preview_step2_behavior(db=db, trade_date=trade_date, nifty_db=nifty_db)
+    else:
+        logger.debug("[PIPELINE][STATE][STEP2_CACHE_HIT] trade_date=%s", trade_date)
+
+    return entry.step2
+
+
+def get_step3_preview(db: Session, trade_date: date) -> Step3ExecutionResponse:
+
+    entry = _entry(trade_date)
+
+    if entry.step3 is None:
+        entry.step3 = generate_step3_execution(db=db, trade_date=trade_date)
+    else:
+        logger.debug("[PIPELINE][STATE][STEP3_CACHE_HIT] trade_date=%s", trade_date)
+
+    return entry.step3
+
+
+# =========================================================
+# PIPELINE
+# =========================================================
+
+def run_preopen_pipeline(
+    db: Session,
+    nifty_db: Session,
+    trade_date: date,
+    refresh: bool = False,
+) -> PreopenPipelineResponse:
+    """
+    Computes every previewable step for trade_date with one
+    pair of sessions. Stops at the first step whose
+    prerequisites are missing (e.g. STEP-1 not frozen yet)
+    and reports why.
+    """
+
+    logger.info("[PIPELINE][STATE][START] trade_date=%s refresh=%s", trade_date, refresh)
+
+    if refresh:
+        invalidate_preopen_cache(trade_date)
+
+    response = PreopenPipelineResponse(trade_date=trade_date)
+
+    try:
+        response.step1 = get_step1_preview(db, nifty_db, trade_date)
+        response.step2 = get_step2_preview(db, trade_date, nifty_db=nifty_db)
+        response.step3 = get_step3_preview(db, trade_date)
+
+    except ValueError as e:
+        response.blocked_reason = str(e)
+
+        logger.info(
+            "[PIPELINE][STATE][BLOCKED] trade_date=%s reason=%s",
+            trade_date,
+            response.blocked_reason,
+        )
+
+    logger.info("[PIPELINE][STATE][DONE] trade_date=%s", trade_date)
+
+    return response
@@ -91,6 +91,7 @@ def preview_step1_context(
         day2_high=structural_data["day2_high"],
         day2_low=structural_data["day2_low"],
         last_5_day_ranges=structural_data["last_5_day_ranges"],
+        prior_session_indicators=structural_data["prior_session_indicators"],
         frozen_at=None,
     )
 
@@ -0,0 +1,212 @@
+# backend/app/services/step2_live_service.py
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from backend.app.schemas.step2_schema import (
+    Step2CandleInput,
+    Step2LiveResponse,
+)
+from backend.app.services.nifty_indicator_service import (
+    TIMEFRAME_5M,
+    sync_indicators,
+)
+from backend.app.services.nifty_market_data_service import (
+    get_open_window_bars,
+    get_previous_session_last20_avg_range,
+)
+from backend.app.services.step2_service import (
+    OPEN_WINDOW_BARS,
+    OpenWindowState,
+    _build_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Trade dates kept in memory (today + a few replays)
+MAX_TRACKED_DATES = 4
+
+
+class _LiveDay:
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.state = OpenWindowState()
+        self.avg_5m_range_prev_day: Optional[float] = None
+        self.baseline_loaded = False
+        self.last_bar_at: Optional[datetime] = None
+
+
+class Step2LiveTracker:
+    """
+    AUTO STEP-2
+    -----------
+    Reads the opening 5-minute bars straight from
+    nifty_prices and folds each new bar into an
+    OpenWindowState, so a poll only fetches bars
+    newer than the last one seen.
+
+    The baseline (previous session last-20 avg range)
+    is read once per trade date.
+
+    Each trade date has its own lock, held only while
+    folding bars into its state; DB reads and the
+    indicator append run outside it.
+    """
+
+    def __init__(self, max_dates: int = MAX_TRACKED_DATES) -> None:
+
+        self._days: "OrderedDict[date, _LiveDay]" = OrderedDict()
+        self._max_dates = max_dates
+        self._lock = threading.Lock()
+
+    def reset(self, trade_date: Optional[date] = None) -> None:
+
+        with self._lock:
+            if trade_date is None:
+                self._days.clear()
+            else:
+                self._days.pop(trade_date, None)
+
+        logger.info("[STEP2][LIVE][RESET] trade_date=%s", trade_date)
+
+    def _day(self, trade_date: date) -> _LiveDay:
+
+        with self._lock:
+
+            day = self._days.get(trade_date)
+
+            if day is None:
+
+                day = _LiveDay()
+                self._days[trade_date] = day
+
+                while len(self._days) > self._max_dates:
+                    self._days.popitem(last=False)
+
+            self._days.move_to_end(trade_date)
+
+            return day
+
+    def poll(self, nifty_db: Session, trade_date: date) -> Step2LiveResponse:
+
+        day = self._day(trade_date)
+
+        if not day.baseline_loaded:
+
+            baseline = get_previous_session_last20_avg_range(
+                nifty_db=nifty_db,
+                trade_date=trade_date,
+            )
+
+            with day.lock:
+                if not day.baseline_loaded:
+                    day.avg_5m_range_prev_day = baseline
+                    day.baseline_loaded = True
+
+        with day.lock:
+            remaining = OPEN_WINDOW_BARS - day.state.bar_count
+            after = day.last_bar_at
+
+        bars = []
+        if remaining > 0:
+            bars = get_open_window_bars(
+                nifty_db,
+                trade_date,
+                limit=remaining,
+                after=after,
+            )
+
+        added = 0
+
+        with day.lock:
+
+            for bar in bars:
+
+                # a concurrent poll may have folded these already
+                if day.last_bar_at is not None and bar["bar_at"] <= day.last_bar_at:
+                    continue
+                if day.state.bar_count >= OPEN_WINDOW_BARS:
+                    break
+
+                day.state.add(
+                    Step2CandleInput(
+                        timestamp=bar["bar_at"].strftime("%H:%M"),
+                        open=bar["open"],
+                        high=bar["high"],
+                        low=bar["low"],
+                        close=bar["close"],
+                        volume=bar["volume"],
+                    )
+                )
+                day.last_bar_at = bar["bar_at"]
+                added += 1
+
+            response = _live_response(trade_date, day)
+
+        if added:
+            logger.info(
+                "[STEP2][LIVE][BARS] trade_date=%s added=%s observed=%s",
+                trade_date,
+                added,
+                response.bars_observed,
+            )
+
+            # new bars landed: append them to the 5m indicator series
+            # (mirrored into nifty_prices for the dashboard)
+            try:
+                sync_indicators(nifty_db, TIMEFRAME_5M, allow_rebuild=False)
+            except Exception:
+                nifty_db.rollback()
+                logger.exception(
+                    "[STEP2][LIVE][INDICATORS] sync failed trade_date=%s",
+                    trade_date,
+                )
+
+        return response
+
+
+def _live_response(trade_date: date, day: _LiveDay) -> Step2LiveResponse:
+
+    analysis = {}
+    if day.state.bar_count:
+        analysis = day.state.analysis(day.avg_5m_range_prev_day)
+
+    snapshot = _build_snapshot(
+        trade_date=trade_date,
+        mode="AUTO",
+        manual_input_required=False,
+        avg_5m_range_prev_day=day.avg_5m_range_prev_day,
+        ir_high=analysis.get("ir_high"),
+        ir_low=analysis.get("ir_low"),
+        ir_range=analysis.get("ir_range"),
+        ir_ratio=analysis.get("ir_ratio"),
+        volatility_state=analysis.get("volatility_state"),
+        vwap_cross_count=analysis.get("vwap_cross_count"),
+        vwap_state=analysis.get("vwap_state"),
+        range_hold_status=analysis.get("range_hold_status"),
+        index_open_behavior=analysis.get("index_open_behavior"),
+        early_volatility=analysis.get("early_volatility"),
+        market_participation=analysis.get("market_participation"),
+        trade_allowed=analysis.get("trade_allowed"),
+        frozen_at=None,
+    )
+
+    return Step2LiveResponse(
+        snapshot=snapshot,
+        bars_observed=day.state.bar_count,
+        bars_expected=OPEN_WINDOW_BARS,
+        window_complete=day.state.bar_count >= OPEN_WINDOW_BARS,
+        last_bar_at=day.last_bar_at,
+        vwap=day.state.vwap,
+    )
+
+
+# Shared by the STEP-2 live endpoints
+step2_live_tracker = Step2LiveTracker()
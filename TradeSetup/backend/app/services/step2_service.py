@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from typing import List
 import logging
 
-from backend.app.db.session import get_nifty_db
+from backend.app.db.session import nifty_session_scope
 from backend.app.models.step1_market_context import Step1MarketContext
 from backend.app.models.step2_market_behavior import Step2MarketBehavior
 from backend.app.models.step2_market_open_behavior import Step2MarketOpenBehavior
@@ -27,42 +27,118 @@ logger = logging.getLogger(__name__)
 # ANALYTICAL ENGINE
 # =====================================================
 
-def _compute_ir(candles: List[Step2CandleInput]):
-    highs = [c.high for c in candles]
-    lows = [c.low for c in candles]
+# Opening observation window: 09:15 → 09:45 (six 5-minute bars)
+OPEN_WINDOW_BARS = 6
 
-    ir_high = max(highs)
-    ir_low = min(lows)
-    ir_range = ir_high - ir_low
 
-    return ir_high, ir_low, ir_range
+class OpenWindowState:
+    """
+    Incremental STEP-2 accumulator.
 
+    Each bar is folded in O(1): IR high/low, cumulative
+    VWAP, VWAP side and cross count, last close. Used by
+    manual compute (fold all candles at once) and by the
+    live tracker (fold each bar as it lands).
+    """
 
-def _compute_vwap(candles: List[Step2CandleInput]):
-    cumulative_pv = 0
-    cumulative_volume = 0
-    cross_count = 0
-    prev_relation = None
+    def __init__(self) -> None:
 
-    for c in candles:
-        typical_price = (c.high + c.low + c.close) / 3
-        cumulative_pv += typical_price * c.volume
-        cumulative_volume += c.volume
+        self.bar_count = 0
 
-        vwap = cumulative_pv / cumulative_volume if cumulative_volume else typical_price
-        relation = "ABOVE" if c.close > vwap else "BELOW"
+        self.ir_high: float | None = None
+        self.ir_low: float | None = None
 
-        if prev_relation and relation != prev_relation:
-            cross_count += 1
+        self.cumulative_pv = 0.0
+        self.cumulative_volume = 0.0
+        self.vwap: float | None = None
 
-        prev_relation = relation
+        self.cross_count = 0
+        self.prev_relation: str | None = None
 
-    if cross_count == 0:
-        vwap_state = "ABOVE_VWAP" if prev_relation == "ABOVE" else "BELOW_VWAP"
-    else:
-        vwap_state = "MIXED"
+        self.last_close: float | None = None
+
+    def add(self, candle: Step2CandleInput) -> None:
+
+        self.bar_count += 1
+
+        self.ir_high = candle.high if self.ir_high is None else max(self.ir_high, candle.high)
+        self.ir_low = candle.low if self.ir_low is None else min(self.ir_low, candle.low)
+
+        typical_price = (candle.high + candle.low + candle.close) / 3
+        self.cumulative_pv += typical_price * candle.volume
+        self.cumulative_volume += candle.volume
+
+        self.vwap = (
+            self.cumulative_pv / self.cumulative_volume
+            if self.cumulative_volume
+            else typical_price
+        )
+
+        relation = "ABOVE" if candle.close > self.vwap else "BELOW"
+
+        if self.prev_relation and relation != self.prev_relation:
+            self.cross_count += 1
+
+        self.prev_relation = relation
+        self.last_close = candle.close
+
+    @property
+    def ir_range(self) -> float:
+        return self.ir_high - self.ir_low
+
+    @property
+    def vwap_state(self) -> str:
+        if self.cross_count == 0:
+            return "ABOVE_VWAP" if self.prev_relation == "ABOVE" else "BELOW_VWAP"
+        return "MIXED"
+
+    @property
+    def range_hold_status(self) -> str:
+        if self.last_close > self.ir_high:
+            return "BROKEN_UP"
+        if self.last_close < self.ir_low:
+            return "BROKEN_DOWN"
+        return "HELD"
+
+    def analysis(self, avg_5m_range_prev_day: float | None) -> dict:
+        """
+        Same keys as analyze_open_window. Requires at least one bar.
+        """
+
+        ir_range = self.ir_range
 
-    return cross_count, vwap_state
+        ir_ratio = None
+        if avg_5m_range_prev_day:
+            ir_ratio = ir_range / avg_5m_range_prev_day
+
+        volatility_state = _classify_volatility(ir_range, avg_5m_range_prev_day)
+
+        vwap_cross_count = self.cross_count
+        range_hold_status = self.range_hold_status
+
+        index_open_behavior = _derive_behavior(
+            ir_range, vwap_cross_count, volatility_state
+        )
+
+        trade_allowed = _evaluate_trade_permission(
+            volatility_state,
+            range_hold_status,
+        )
+
+        return {
+            "ir_high": self.ir_high,
+            "ir_low": self.ir_low,
+            "ir_range": ir_range,
+            "ir_ratio": ir_ratio,
+            "volatility_state": volatility_state,
+            "vwap_cross_count": vwap_cross_count,
+            "vwap_state": self.vwap_state,
+            "range_hold_status": range_hold_status,
+            "index_open_behavior": index_open_behavior,
+            "early_volatility": volatility_state,
+            "market_participation": "BROAD",
+            "trade_allowed": trade_allowed,
+        }
 
 
 def _classify_volatility(ir_range: float, avg_5m_range_prev_day: float | None):
@@ -78,16 +154,6 @@ def _classify_volatility(ir_range: float, avg_5m_range_prev_day: float | None):
     return "NORMAL"
 
 
-def _range_hold_status(candles: List[Step2CandleInput], ir_high, ir_low):
-    last_close = candles[-1].close
-
-    if last_close > ir_high:
-        return "BROKEN_UP"
-    if last_close < ir_low:
-        return "BROKEN_DOWN"
-    return "HELD"
-
-
 def _derive_behavior(ir_range, vwap_cross_count, volatility_state):
     if volatility_state == "EXPANDING" and vwap_cross_count == 0:
         return "STRONG_UP"
@@ -149,7 +215,11 @@ def _build_snapshot(
 # PREVIEW
 # =====================================================
 
-def preview_step2_behavior(db: Session, trade_date: date) -> Step2PreviewResponse:
+def preview_step2_behavior(
+    db: Session,
+    trade_date: date,
+    nifty_db: Session | None = None,
+) -> Step2PreviewResponse:
 
     logger.debug("[STEP2][PREVIEW] trade_date=%s", trade_date)
 
@@ -162,11 +232,18 @@ def preview_step2_behavior(db: Session, trade_date: date) -> Step2PreviewRespons
     if not step1:
         raise ValueError("STEP-1 must be frozen before STEP-2")
 
-    nifty_db = next(get_nifty_db())
-    avg_5m_range_prev_day = get_previous_session_last20_avg_range(
-        nifty_db=nifty_db,
-        trade_date=trade_date,
-    )
+    # Reuse the caller's NIFTY session (pre-open pipeline) when given
+    if nifty_db is not None:
+        avg_5m_range_prev_day = get_previous_session_last20_avg_range(
+            nifty_db=nifty_db,
+            trade_date=trade_date,
+        )
+    else:
+        with nifty_session_scope() as scoped_nifty_db:
+            avg_5m_range_prev_day = get_previous_session_last20_avg_range(
+                nifty_db=scoped_nifty_db,
+                trade_date=trade_date,
+            )
 
     snapshot = _build_snapshot(
         trade_date=trade_date,
@@ -211,53 +288,37 @@ def compute_step2_behavior(
     if not step1:
         raise ValueError("STEP-1 must be frozen before STEP-2")
 
-    ir_high, ir_low, ir_range = _compute_ir(candles)
-
-    ir_ratio = None
-    if avg_5m_range_prev_day:
-        ir_ratio = ir_range / avg_5m_range_prev_day
-
-    volatility_state = _classify_volatility(ir_range, avg_5m_range_prev_day)
-
-    vwap_cross_count, vwap_state = _compute_vwap(candles)
-
-    range_hold_status = _range_hold_status(candles, ir_high, ir_low)
-
-    index_open_behavior = _derive_behavior(
-        ir_range, vwap_cross_count, volatility_state
-    )
-
-    early_volatility = volatility_state
-    market_participation = "BROAD"
-
-    trade_allowed = _evaluate_trade_permission(
-        volatility_state,
-        range_hold_status,
-    )
+    analysis = analyze_open_window(candles, avg_5m_range_prev_day)
 
     snapshot = _build_snapshot(
         trade_date=trade_date,
         mode="MANUAL",
         manual_input_required=True,
         avg_5m_range_prev_day=avg_5m_range_prev_day,
-        ir_high=ir_high,
-        ir_low=ir_low,
-        ir_range=ir_range,
-        ir_ratio=ir_ratio,
-        volatility_state=volatility_state,
-        vwap_cross_count=vwap_cross_count,
-        vwap_state=vwap_state,
-        range_hold_status=range_hold_status,
-        index_open_behavior=index_open_behavior,
-        early_volatility=early_volatility,
-        market_participation=market_participation,
-        trade_allowed=trade_allowed,
         frozen_at=None,
+        **analysis,
     )
 
     return Step2ComputeResponse(snapshot=snapshot, can_freeze=True)
 
 
+def analyze_open_window(
+    candles: List[Step2CandleInput],
+    avg_5m_range_prev_day: float | None,
+) -> dict:
+    """
+    Pure STEP-2 analytics over the opening candles
+    (no DB access); shared by compute and the backtest.
+    """
+
+    state = OpenWindowState()
+
+    for candle in candles:
+        state.add(candle)
+
+    return state.analysis(avg_5m_range_prev_day)
+
+
 # =====================================================
 # FREEZE
 # =====================================================
@@ -270,8 +331,8 @@ def freeze_step2_behavior(
     
 ) -> Step2FrozenResponse:
     #To compute the snapshot, we need the avg_5m_range_prev_day which is derived from nifty_db. To ensure consistency between preview and freeze, we fetch it again here instead of relying on the value from preview. This way, even if there are changes in the underlying data or logic, the freeze will always compute based on the latest available information.
-    nifty_db = next(get_nifty_db())
-    avg_5m_range_prev_day = get_previous_session_last20_avg_range(nifty_db=nifty_db,trade_date=trade_date,)
+    with nifty_session_scope() as nifty_db:
+        avg_5m_range_prev_day = get_previous_session_last20_avg_range(nifty_db=nifty_db,trade_date=trade_date,)
 
     compute_response = compute_step2_behavior(
         db=db,
@@ -0,0 +1,247 @@
+# =========================================================
+# File: backend/app/services/step3_layer1_snapshot_service.py
+# =========================================================
+
+from datetime import date
+from typing import Dict, List, Optional
+import hashlib
+import json
+import logging
+
+import numpy as np
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from backend.app.models.step3_layer1_snapshot import Step3Layer1Snapshot
+from backend.app.services.nifty_stock_data_service import get_layer1_features
+from backend.app.services.trading_calendar_service import trading_calendar
+
+logger = logging.getLogger(__name__)
+
+LIQUIDITY_THRESHOLD_RUPEES = 1_000_000_000
+
+# Sessions covered by the 20-day liquidity average
+LAYER1_LOOKBACK_SESSIONS = 20
+
+
+# =========================================================
+# LAYER-1 TRADABILITY FILTER
+# =========================================================
+
+def apply_layer1_filter(
+    features: List[Dict],
+    liquidity_threshold: float = LIQUIDITY_THRESHOLD_RUPEES,
+) -> List[Dict]:
+    """
+    One array pass over the joined Layer-1 rows
+    (see get_layer1_features): liquidity, ATR% band
+    and abnormal-candle rules are boolean masks.
+
+    Returns the pass list sorted by
+    avg_traded_value_20d DESC.
+    """
+
+    if not features:
+        return []
+
+    avg_val = np.array([row["avg_traded_value_20d"] or 0 for row in features], dtype=float)
+    atr = np.array([row["atr_14"] or 0 for row in features], dtype=float)
+    close = np.array([row["close"] or 0 for row in features], dtype=float)
+    day_range = np.array([row["high"] - row["low"] for row in features], dtype=float)
+
+    atr_pct = np.divide(atr * 100, close, out=np.zeros_like(atr), where=close != 0)
+    abnormal = day_range >= 2 * atr
+
+    passed_mask = (
+        (avg_val > 0)
+        & (atr != 0)
+        & (avg_val >= liquidity_threshold)
+        & (atr_pct >= 1)
+        & (atr_pct <= 4)
+        & ~abnormal
+    )
+
+    index = np.flatnonzero(passed_mask)
+    index = index[np.argsort(-avg_val[index], kind="stable")]
+
+    return [
+        {
+            "symbol": features[i]["symbol"],
+            "avg_traded_value_20d": features[i]["avg_traded_value_20d"],
+            "atr_pct": round(float(atr_pct[i]), 2),
+            "abnormal_candle": False,
+        }
+        for i in index
+    ]
+
+
+# =========================================================
+# SOURCE FINGERPRINT (STALENESS)
+# =========================================================
+
+def _source_window(db: Session, trade_date: date) -> str:
+    """
+    First:last session of the bhavcopy window the
+    snapshot is built from (in-memory calendar, no scan).
+    """
+
+    sessions = trading_calendar.last_n_sessions(
+        db, trade_date, LAYER1_LOOKBACK_SESSIONS
+    )
+
+    if not sessions:
+        return "EMPTY"
+
+    return f"{sessions[-1]}:{sessions[0]}"
+
+
+def _source_watermark(db: Session, trade_date: date) -> str:
+    """
+    Digest of the previous session's Layer-1 inputs:
+    bhavcopy rows, atr_14 rows and the liquidity rollup
+    rows (whose updated_at moves whenever a re-import
+    rebuilds the 20-day window).
+
+    Three single-date index lookups; a re-import that
+    changes any input changes the digest.
+    """
+
+    previous_trading_date = trading_calendar.previous(db, trade_date)
+
+    if previous_trading_date is None:
+        return "NONE"
+
+    row = db.execute(text("""
+        SELECT
+            (SELECT CONCAT_WS('-', COUNT(*), SUM(net_trdval), SUM(close))
+               FROM intraday_bhavcopy
+              WHERE trade_date = :d),
+            (SELECT CONCAT_WS('-', COUNT(*), SUM(CRC32(CONCAT_WS('|', symbol, value))))
+               FROM strategy_features
+              WHERE trade_date = :d
+                AND feature_name = 'atr_14'),
+            (SELECT CONCAT_WS('-', COUNT(*), MAX(updated_at))
+               FROM symbol_liquidity_daily
+              WHERE trade_date = :d)
+    """), {"d": previous_trading_date}).fetchone()
+
+    raw = "|".join(str(v) for v in row)
+
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def _source_fingerprint(db: Session, trade_date: date) -> str:
+    return f"{_source_window(db, trade_date)}|{_source_watermark(db, trade_date)}"
+
+
+# =========================================================
+# BUILD (PRE-OPEN JOB)
+# =========================================================
+
+def build_layer1_snapshot(db: Session, trade_date: date) -> List[Dict]:
+    """
+    Computes the Layer-1 pass list for trade_date,
+    upserts the snapshot row and returns the list.
+    """
+
+    # rollup is synced first so the fingerprint sees its final updated_at
+    features = get_layer1_features(db, trade_date)
+    passed = apply_layer1_filter(features)
+
+    source_fingerprint = _source_fingerprint(db, trade_date)
+
+    snapshot = db.query(Step3Layer1Snapshot).filter(
+        Step3Layer1Snapshot.trade_date == trade_date
+    ).first()
+
+    if not snapshot:
+        snapshot = Step3Layer1Snapshot(trade_date=trade_date)
+        db.add(snapshot)
+
+    snapshot.passed_symbols = json.dumps(passed)
+    snapshot.universe_count = len(features)
+    snapshot.passed_count = len(passed)
+    snapshot.source_fingerprint = source_fingerprint
+    snapshot.built_at = func.now()
+
+    db.commit()
+
+    logger.info(
+        "[STEP3][STATE][LAYER1_SNAPSHOT_BUILT] trade_date=%s universe=%s passed=%s",
+        trade_date,
+        len(features),
+        len(passed),
+    )
+
+    return passed
+
+
+# =========================================================
+# READ
+# =========================================================
+
+def get_layer1_pass_list(db: Session, trade_date: date) -> List[Dict]:
+    """
+    Layer-1 pass list for trade_date.
+
+    Reads the snapshot by primary key and checks its
+    source fingerprint against the current inputs (see
+    _source_watermark); rebuilds it on a miss or when a
+    re-import changed the data it was built from.
+    """
+
+    snapshot = db.query(Step3Layer1Snapshot).filter(
+        Step3Layer1Snapshot.trade_date == trade_date
+    ).first()
+
+    if snapshot and snapshot.source_fingerprint != _source_fingerprint(db, trade_date):
+        logger.info(
+            "[STEP3][STATE][LAYER1_SNAPSHOT_STALE] trade_date=%s fingerprint=%s",
+            trade_date,
+            snapshot.source_fingerprint,
+        )
+        return build_layer1_snapshot(db, trade_date)
+
+    if snapshot:
+        logger.info(
+            "[STEP3][STATE][LAYER1_SNAPSHOT_HIT] trade_date=%s passed=%s",
+            trade_date,
+            snapshot.passed_count,
+        )
+        return json.loads(snapshot.passed_symbols)
+
+    logger.info(
+        "[STEP3][STATE][LAYER1_SNAPSHOT_MISS] trade_date=%s",
+        trade_date,
+    )
+
+    return build_layer1_snapshot(db, trade_date)
+
+
+def invalidate_layer1_snapshots(db: Session, from_date: Optional[date] = None) -> int:
+    """
+    Drops snapshots that may depend on re-imported data
+    (all snapshots after from_date, or every snapshot).
+
+    Optional: stale snapshots are already rebuilt on
+    read (get_layer1_pass_list). The post-import job
+    (jobs/after_market_data_import.py) calls this to
+    drop them eagerly.
+    """
+
+    query = db.query(Step3Layer1Snapshot)
+
+    if from_date is not None:
+        query = query.filter(Step3Layer1Snapshot.trade_date > from_date)
+
+    deleted = query.delete()
+    db.commit()
+
+    logger.info(
+        "[STEP3][STATE][LAYER1_SNAPSHOT_INVALIDATED] from_date=%s deleted=%s",
+        from_date,
+        deleted,
+    )
+
+    return deleted
@@ -3,9 +3,12 @@
 # =========================================================
 
 from datetime import date, datetime
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 import logging
 
+import numpy as np
+
 from backend.app.models.step1_market_context import Step1MarketContext
 from backend.app.models.step2_market_behavior import Step2MarketBehavior
 from backend.app.models.step2_market_open_behavior import Step2MarketOpenBehavior
@@ -19,18 +22,15 @@ from backend.app.schemas.step3_schema import (
     Step3ComputeResponse,
     Step3FreezeResponse,
     Step3StockContext,
+    Step3RejectionCode,
 )
 # NEW — data provider 
-from backend.app.services.nifty_stock_data_service import (
-    get_universe_symbols,
-    get_avg_traded_value_20d,
-    get_atr_14_for_date,
-    get_yesterday_candles,
-)
+from backend.app.services.step3_layer1_snapshot_service import get_layer1_pass_list
 
 logger = logging.getLogger(__name__)
 
-LIQUIDITY_THRESHOLD_RUPEES = 1_000_000_000
+# |stock% - nifty%| needed for a LONG / SHORT direction (Layer-2)
+RS_THRESHOLD = 0.3
 
 # =========================================================
 # STEP-3A — Deterministic Matrix
@@ -68,114 +68,224 @@ def _derive_step3a(market_context: str | None, trade_permission: str | None):
     execution_allowed = max_trades > 0
     return allowed, max_trades, execution_allowed
 # =========================================================
-# CORE DETERMINISTIC ENGINE (UNCHANGED)
+# CORE DETERMINISTIC ENGINE (BATCH)
 # =========================================================
 
-def _evaluate_stock(context: Step3StockContext, allowed_strategies: list[str]) -> TradeCandidate:
+def _evaluate_batch(
+    stocks: list[Step3StockContext],
+    allowed_strategies: list[str],
+    rs_threshold: float = RS_THRESHOLD,
+) -> list[TradeCandidate]:
+    """
+    Evaluates every context through Layer-1/2/3 in one
+    array pass: each layer is a boolean mask over the
+    batch, the rejection code comes from the first
+    failing mask, and TradeCandidate objects are built
+    only at the end.
+    """
+
+    if not stocks:
+        return []
+
+    avg_traded_value = np.array([c.avg_traded_value_20d for c in stocks], dtype=float)
+    atr_pct = np.array([c.atr_pct for c in stocks], dtype=float)
+    abnormal = np.array([c.abnormal_candle for c in stocks], dtype=bool)
+
+    stock_open = np.array([c.stock_open_0915 for c in stocks], dtype=float)
+    stock_current = np.array([c.stock_current_price for c in stocks], dtype=float)
+    nifty_open = np.array([c.nifty_open_0915 for c in stocks], dtype=float)
+    nifty_current = np.array([c.nifty_current_price for c in stocks], dtype=float)
+
+    gap_pct = np.array([c.gap_pct for c in stocks], dtype=float)
+    gap_hold = np.array([c.gap_hold for c in stocks], dtype=bool)
+    structure_valid = np.array([c.structure_valid for c in stocks], dtype=bool)
+    above_vwap = np.array([c.price_vs_vwap == "ABOVE" for c in stocks], dtype=bool)
+    below_vwap = np.array([c.price_vs_vwap == "BELOW" for c in stocks], dtype=bool)
+
+    # ---------- Layer-1 ----------
+    layer1_ok = (
+        (avg_traded_value >= 100)
+        & (atr_pct >= 1)
+        & (atr_pct <= 4)
+        & ~abnormal
+    )
 
-    symbol = context.symbol.upper()
+    # ---------- Layer-2 ----------
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stock_pct = (stock_current - stock_open) / stock_open * 100
+        nifty_pct = (nifty_current - nifty_open) / nifty_open * 100
 
-    if (
-        context.avg_traded_value_20d < 100
-        or not (1 <= context.atr_pct <= 4)
-        or context.abnormal_candle
-    ):
-        return TradeCandidate(
-            symbol=symbol,
-            direction="LONG",
-            strategy_used="NO_TRADE",
-            reason="Rejected at Layer-1 (Tradability filter failed)",
-            structure_valid=False,
-        )
-
-    stock_pct = (
-        (context.stock_current_price - context.stock_open_0915)
-        / context.stock_open_0915
-        * 100
+    rs = stock_pct - nifty_pct
+    is_long = rs >= rs_threshold
+    is_short = rs <= -rs_threshold
+
+    # ---------- Layer-3 ----------
+    gap_fit = (
+        ("GAP_FOLLOW" in allowed_strategies)
+        & (np.abs(gap_pct) >= 1.0)
+        & gap_hold
+        & structure_valid
     )
-
-    nifty_pct = (
-        (context.nifty_current_price - context.nifty_open_0915)
-        / context.nifty_open_0915
-        * 100
+    momentum_fit = (
+        ("MOMENTUM" in allowed_strategies)
+        & structure_valid
+        & ((is_long & above_vwap) | (is_short & below_vwap))
+    )
+    strategy = np.select([gap_fit, momentum_fit], ["GAP_FOLLOW", "MOMENTUM"], default="NO_TRADE")
+
+    rejection = np.select(
+        [~layer1_ok, ~(is_long | is_short), strategy == "NO_TRADE"],
+        [
+            Step3RejectionCode.LAYER1_FAIL.value,
+            Step3RejectionCode.RS_NEUTRAL.value,
+            Step3RejectionCode.STRATEGY_FAIL.value,
+        ],
+        default="",
     )
 
-    rs = stock_pct - nifty_pct
+    evaluated: list[TradeCandidate] = []
 
-    if rs >= 0.3:
-        direction = "LONG"
-    elif rs <= -0.3:
-        direction = "SHORT"
-    else:
-        return TradeCandidate(
-            symbol=symbol,
-            direction="LONG",
-            strategy_used="NO_TRADE",
-            rs_value=rs,
-            reason="Rejected at Layer-2 (RS Neutral)",
-            structure_valid=False,
-        )
+    for i, context in enumerate(stocks):
 
-    strategy = "NO_TRADE"
+        symbol = context.symbol.upper()
+        code = rejection[i]
 
-    if (
-        "GAP_FOLLOW" in allowed_strategies
-        and abs(context.gap_pct) >= 1.0
-        and context.gap_hold
-        and context.structure_valid
-    ):
-        strategy = "GAP_FOLLOW"
-
-    elif (
-        "MOMENTUM" in allowed_strategies
-        and context.structure_valid
-        and (
-            (direction == "LONG" and context.price_vs_vwap == "ABOVE")
-            or (direction == "SHORT" and context.price_vs_vwap == "BELOW")
-        )
-    ):
-        strategy = "MOMENTUM"
+        if code == Step3RejectionCode.LAYER1_FAIL.value:
+            evaluated.append(TradeCandidate(
+                symbol=symbol,
+                direction="LONG",
+                strategy_used="NO_TRADE",
+                reason="Rejected at Layer-1 (Tradability filter failed)",
+                structure_valid=False,
+                rejection_code=Step3RejectionCode.LAYER1_FAIL,
+            ))
+            continue
+
+        rs_value = float(rs[i])
+
+        if code == Step3RejectionCode.RS_NEUTRAL.value:
+            evaluated.append(TradeCandidate(
+                symbol=symbol,
+                direction="LONG",
+                strategy_used="NO_TRADE",
+                rs_value=rs_value,
+                reason="Rejected at Layer-2 (RS Neutral)",
+                structure_valid=False,
+                rejection_code=Step3RejectionCode.RS_NEUTRAL,
+            ))
+            continue
 
-    if strategy == "NO_TRADE":
-        return TradeCandidate(
+        direction = "LONG" if is_long[i] else "SHORT"
+
+        if code == Step3RejectionCode.STRATEGY_FAIL.value:
+            evaluated.append(TradeCandidate(
+                symbol=symbol,
+                direction=direction,
+                strategy_used="NO_TRADE",
+                rs_value=rs_value,
+                reason="Rejected at Layer-3 (Strategy fit failed)",
+                structure_valid=False,
+                rejection_code=Step3RejectionCode.STRATEGY_FAIL,
+            ))
+            continue
+
+        strategy_used = str(strategy[i])
+        intraday_high = context.stock_current_price
+        intraday_low = context.stock_open_0915
+
+        evaluated.append(TradeCandidate(
             symbol=symbol,
             direction=direction,
-            strategy_used="NO_TRADE",
-            rs_value=rs,
-            reason="Rejected at Layer-3 (Strategy fit failed)",
-            structure_valid=False,
-        )
+            strategy_used=strategy_used,
+            rs_value=rs_value,
+            gap_high=intraday_high if strategy_used == "GAP_FOLLOW" else None,
+            gap_low=intraday_low if strategy_used == "GAP_FOLLOW" else None,
+            intraday_high=intraday_high,
+            intraday_low=intraday_low,
+            last_higher_low=intraday_low if strategy_used == "MOMENTUM" else None,
+            yesterday_close=context.stock_open_0915,
+            vwap_value=context.stock_current_price,
+            structure_valid=context.structure_valid,
+            reason="Qualified through deterministic Layer-1/2/3 evaluation",
+        ))
+
+    return evaluated
+
+
+def _evaluate_stock(context: Step3StockContext, allowed_strategies: list[str]) -> TradeCandidate:
+    return _evaluate_batch([context], allowed_strategies)[0]
+
+
+# =========================================================
+# PERSISTENCE HELPERS
+# =========================================================
+
+def _rejection_tag(candidate: TradeCandidate) -> str:
+    """
+    Engine-evaluated candidates carry rejection_code;
+    client-supplied ones (freeze) may only have the reason.
+    """
+
+    if candidate.rejection_code is not None:
+        return candidate.rejection_code.value
+
+    reason = candidate.reason or ""
+
+    if "Layer-1" in reason:
+        return Step3RejectionCode.LAYER1_FAIL.value
+    if "Layer-2" in reason:
+        return Step3RejectionCode.RS_NEUTRAL.value
+    if "Layer-3" in reason:
+        return Step3RejectionCode.STRATEGY_FAIL.value
+
+    return Step3RejectionCode.UNKNOWN.value
+
+
+def _selection_row(
+    trade_date: date,
+    candidate: TradeCandidate,
+    evaluated_at: datetime,
+    tradable: bool,
+    rejection_tag: str | None,
+) -> dict:
+
+    return {
+        "trade_date": trade_date,
+        "symbol": candidate.symbol,
+        "direction": candidate.direction,
+        "strategy_used": candidate.strategy_used,
+        "rs_value": candidate.rs_value,
+        "gap_high": candidate.gap_high,
+        "gap_low": candidate.gap_low,
+        "intraday_high": candidate.intraday_high,
+        "intraday_low": candidate.intraday_low,
+        "last_higher_low": candidate.last_higher_low,
+        "yesterday_close": candidate.yesterday_close,
+        "vwap_value": candidate.vwap_value,
+        "structure_valid": int(candidate.structure_valid),
+        "reason": candidate.reason,
+        "evaluated_at": evaluated_at,
+        "tradable": tradable,
+        "rejection_tag": rejection_tag,
+    }
+
+
+def _replace_selection_rows(db: Session, trade_date: date, rows: list[dict]) -> None:
+    """
+    Deletes the day's rows and writes the new set
+    with a single executemany INSERT.
+    """
+
+    db.query(Step3StockSelection).filter(
+        Step3StockSelection.trade_date == trade_date
+    ).delete()
+
+    if rows:
+        db.execute(insert(Step3StockSelection), rows)
+
+    db.commit()
+
 
-    intraday_high = context.stock_current_price
-    intraday_low = context.stock_open_0915
-    yesterday_close = context.stock_open_0915
-    vwap_value = context.stock_current_price
-
-    gap_high = None
-    gap_low = None
-    last_higher_low = None
-
-    if strategy == "GAP_FOLLOW":
-        gap_high = intraday_high
-        gap_low = intraday_low
-    elif strategy == "MOMENTUM":
-        last_higher_low = intraday_low
-
-    return TradeCandidate(
-        symbol=symbol,
-        direction=direction,
-        strategy_used=strategy,
-        rs_value=rs,
-        gap_high=gap_high,
-        gap_low=gap_low,
-        intraday_high=intraday_high,
-        intraday_low=intraday_low,
-        last_higher_low=last_higher_low,
-        yesterday_close=yesterday_close,
-        vwap_value=vwap_value,
-        structure_valid=context.structure_valid,
-        reason="Qualified through deterministic Layer-1/2/3 evaluation",
-    )
 # =========================================================
 # PREVIEW (UPDATED — LAYER1 INTEGRATED, CONTROL PERSISTENCE KEPT)
 # =========================================================
@@ -282,42 +392,9 @@ def generate_step3_execution(db: Session, trade_date: date) -> Step3ExecutionRes
     # LAYER 1 — UNIVERSE
     # ==========================
 
-    symbols = get_universe_symbols(db)
-    logger.info("[STEP3][STATE][UNIVERSE_LOADED] trade_date=%s count=%s", trade_date, len(symbols))
-    avg_map = get_avg_traded_value_20d(db, trade_date, symbols)
-    atr_map = get_atr_14_for_date(db, trade_date, symbols)
-    candle_map = get_yesterday_candles(db, trade_date, symbols)
-
-    passed = []
-
-    for symbol in symbols:
-
-        avg_val = avg_map.get(symbol)
-        atr = atr_map.get(symbol)
-        candle = candle_map.get(symbol)
-
-        if not avg_val or not atr or not candle:
-            continue
-
-        if avg_val < LIQUIDITY_THRESHOLD_RUPEES:
-            continue
-
-        atr_pct = (atr / candle["close"]) * 100 if candle["close"] else 0
-        if atr_pct < 1 or atr_pct > 4:
-            continue
-
-        abnormal = (candle["high"] - candle["low"]) >= (2 * atr)
-        if abnormal:
-            continue
-
-        passed.append({
-            "symbol": symbol,
-            "avg_traded_value_20d": avg_val,
-            "atr_pct": round(atr_pct, 2),
-            "abnormal_candle": abnormal,
-        })
+    # Pre-open snapshot (already sorted by avg_traded_value_20d DESC)
+    passed = get_layer1_pass_list(db, trade_date)
     logger.info("[STEP3][STATE][LAYER1_PASS] trade_date=%s passed=%s", trade_date, len(passed))
-    passed.sort(key=lambda x: x["avg_traded_value_20d"], reverse=True)
     top6 = passed[:6]
     logger.info("[STEP3][STATE][TOP6_SELECTED] trade_date=%s count=%s", trade_date, len(top6))
     candidates = [
@@ -358,65 +435,32 @@ def generate_step3_execution(db: Session, trade_date: date) -> Step3ExecutionRes
     )
 
 # =========================================================
-# COMPUTE (UNCHANGED)
+# COMPUTE (BATCH EVALUATION, BULK PERSISTENCE)
 # =========================================================
 def compute_step3_candidates(db: Session, trade_date: date, stocks: list[Step3StockContext]) -> Step3ComputeResponse:
 
     preview = generate_step3_execution(db, trade_date)
     snapshot = preview.snapshot
 
-    evaluated = []
-
-    for context in stocks:
-        candidate = _evaluate_stock(context, snapshot.allowed_strategies)
-        evaluated.append(candidate)
+    evaluated = _evaluate_batch(stocks, snapshot.allowed_strategies)
 
     can_freeze = (
         snapshot.execution_enabled
         and any(c.strategy_used != "NO_TRADE" for c in evaluated)
     )
 
-    if snapshot.execution_enabled and not any(c.strategy_used != "NO_TRADE" for c in evaluated):
-
-        db.query(Step3StockSelection).filter(
-            Step3StockSelection.trade_date == trade_date
-        ).delete()
-
-        for c in evaluated:
-
-            rejection_tag = None
-            if c.reason and "Layer-1" in c.reason:
-                rejection_tag = "LAYER1_FAIL"
-            elif c.reason and "Layer-2" in c.reason:
-                rejection_tag = "RS_NEUTRAL"
-            elif c.reason and "Layer-3" in c.reason:
-                rejection_tag = "STRATEGY_FAIL"
-            else:
-                rejection_tag = "UNKNOWN"
-
-            db.add(
-                Step3StockSelection(
-                    trade_date=trade_date,
-                    symbol=c.symbol,
-                    direction=c.direction,
-                    strategy_used=c.strategy_used,
-                    rs_value=c.rs_value,
-                    gap_high=c.gap_high,
-                    gap_low=c.gap_low,
-                    intraday_high=c.intraday_high,
-                    intraday_low=c.intraday_low,
-                    last_higher_low=c.last_higher_low,
-                    yesterday_close=c.yesterday_close,
-                    vwap_value=c.vwap_value,
-                    structure_valid=int(c.structure_valid),
-                    reason=c.reason,
-                    evaluated_at=datetime.utcnow(),
-                    tradable=False,
-                    rejection_tag=rejection_tag,
-                )
-            )
+    if snapshot.execution_enabled and not can_freeze:
 
-        db.commit()
+        evaluated_at = datetime.utcnow()
+
+        _replace_selection_rows(
+            db,
+            trade_date,
+            [
+                _selection_row(trade_date, c, evaluated_at, False, _rejection_tag(c))
+                for c in evaluated
+            ],
+        )
 
     return Step3ComputeResponse(
         snapshot=Step3ExecutionSnapshot(
@@ -449,48 +493,24 @@ def freeze_step3_candidates(db: Session, trade_date: date, candidates: list[Trad
 
     qualified = candidates[:control_row.max_trades_allowed]
 
-    db.query(Step3StockSelection).filter(
-        Step3StockSelection.trade_date == trade_date
-    ).delete()
+    rows = []
 
     for idx, c in enumerate(candidates):
 
         is_tradable = c.strategy_used != "NO_TRADE" and idx < control_row.max_trades_allowed
 
-        rejection_tag = None
-        if not is_tradable:
-            if c.reason and "Layer-1" in c.reason:
-                rejection_tag = "LAYER1_FAIL"
-            elif c.reason and "Layer-2" in c.reason:
-                rejection_tag = "RS_NEUTRAL"
-            elif c.reason and "Layer-3" in c.reason:
-                rejection_tag = "STRATEGY_FAIL"
-            else:
-                rejection_tag = "UNKNOWN"
-
-        db.add(
-            Step3StockSelection(
-                trade_date=trade_date,
-                symbol=c.symbol,
-                direction=c.direction,
-                strategy_used=c.strategy_used,
-                rs_value=c.rs_value,
-                gap_high=c.gap_high,
-                gap_low=c.gap_low,
-                intraday_high=c.intraday_high,
-                intraday_low=c.intraday_low,
-                last_higher_low=c.last_higher_low,
-                yesterday_close=c.yesterday_close,
-                vwap_value=c.vwap_value,
-                structure_valid=int(c.structure_valid),
-                reason=c.reason,
-                evaluated_at=decided_at,
-                tradable=is_tradable,
-                rejection_tag=rejection_tag,
+        rows.append(
+            _selection_row(
+                trade_date,
+                c,
+                decided_at,
+                is_tradable,
+                None if is_tradable else _rejection_tag(c),
             )
         )
 
-    db.commit()
+    _replace_selection_rows(db, trade_date, rows)
+
     logger.info(
         "[STEP3][STATE][FREEZE_SUCCESS] trade_date=%s persisted=%d",
         trade_date,
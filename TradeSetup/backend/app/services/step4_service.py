@@ -5,6 +5,8 @@
 import logging
 from datetime import datetime
 from math import floor
+
+import numpy as np
 from sqlalchemy.orm import Session
 
 from backend.app.models.step1_market_context import Step1MarketContext
@@ -23,10 +25,17 @@ from backend.app.schemas.step4_schema import (
     Step4FreezeRequest,
     Step4FrozenTradeResponse,
     FrozenTradeSnapshot,
+    Step4SweepRequest,
+    Step4SweepPoints,
+    Step4SweepSkipped,
+    Step4SweepResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on evaluated points per sweep request
+MAX_SWEEP_POINTS = 50_000
+
 
 # =====================================================
 # STEP-4 PHASE-1 → LOAD CONTEXT (STRUCTURAL ONLY)
@@ -94,6 +103,84 @@ def load_step4_context(
     )
 
 
+# =====================================================
+# EXECUTION MATH (SHARED BY COMPUTE + SWEEP)
+# =====================================================
+
+def _structural_levels(
+    candidate: Step3StockSelection,
+    entry_buffer: float,
+) -> tuple[float, float]:
+    """
+    Entry / stop from the frozen STEP-3 structure.
+    """
+
+    direction = candidate.direction
+    strategy = candidate.strategy_used
+
+    if strategy == "GAP_FOLLOW":
+        if candidate.gap_high is None or candidate.gap_low is None:
+            raise ValueError("Invalid GAP structure from STEP-3")
+
+        if direction == "LONG":
+            entry_price = float(candidate.gap_high) + entry_buffer
+            stop_loss = float(candidate.gap_low)
+        else:
+            entry_price = float(candidate.gap_low) - entry_buffer
+            stop_loss = float(candidate.gap_high)
+
+    elif strategy == "MOMENTUM":
+        if candidate.intraday_high is None or candidate.last_higher_low is None:
+            raise ValueError("Invalid MOMENTUM structure from STEP-3")
+
+        if direction == "LONG":
+            entry_price = float(candidate.intraday_high) + entry_buffer
+        else:
+            entry_price = float(candidate.intraday_high) - entry_buffer
+
+        stop_loss = float(candidate.last_higher_low)
+
+    else:
+        raise ValueError("Invalid strategy from STEP-3")
+
+    return entry_price, stop_loss
+
+
+def _size_position(
+    direction: str,
+    entry_price: float,
+    risk_per_share: float,
+    capital: float,
+    risk_percent: float,
+    r_multiple: float,
+) -> tuple[int, float, str, str | None]:
+    """
+    Returns (quantity, target_price, trade_status, block_reason).
+    """
+
+    risk_amount = capital * (risk_percent / 100.0)
+
+    trade_status = "READY"
+    block_reason = None
+
+    if risk_per_share <= 0:
+        trade_status = "BLOCKED"
+        block_reason = "INVALID_RISK_DISTANCE"
+
+    quantity = floor(risk_amount / risk_per_share) if risk_per_share > 0 else 0
+
+    if quantity < 1:
+        trade_status = "BLOCKED"
+        block_reason = "INSUFFICIENT_CAPITAL"
+
+    if direction == "LONG":
+        target_price = entry_price + (risk_per_share * r_multiple)
+    else:
+        target_price = entry_price - (risk_per_share * r_multiple)
+
+    return quantity, target_price, trade_status, block_reason
+
+
 # =====================================================
 # STEP-4 PHASE-2 → COMPUTE (RISK + UPSERT)
 # =====================================================
@@ -161,55 +248,30 @@ def compute_step4_trade(
     # STRUCTURAL DETERMINISTIC READ
     # -------------------------------------------------
 
-    if strategy == "GAP_FOLLOW":
-        if candidate.gap_high is None or candidate.gap_low is None:
-            raise ValueError("Invalid GAP structure from STEP-3")
-
-        if direction == "LONG":
-            entry_price = float(candidate.gap_high) + request.entry_buffer
-            stop_loss = float(candidate.gap_low)
-        else:
-            entry_price = float(candidate.gap_low) - request.entry_buffer
-            stop_loss = float(candidate.gap_high)
-
-    elif strategy == "MOMENTUM":
-        if candidate.intraday_high is None or candidate.last_higher_low is None:
-            raise ValueError("Invalid MOMENTUM structure from STEP-3")
-
-        if direction == "LONG":
-            entry_price = float(candidate.intraday_high) + request.entry_buffer
-        else:
-            entry_price = float(candidate.intraday_high) - request.entry_buffer
-
-        stop_loss = float(candidate.last_higher_low)
-
-    else:
-        raise ValueError("Invalid strategy from STEP-3")
+    entry_price, stop_loss = _structural_levels(
+        candidate,
+        request.entry_buffer,
+    )
 
     # -------------------------------------------------
     # RISK CALCULATION
     # -------------------------------------------------
 
     risk_per_share = abs(entry_price - stop_loss)
-    risk_amount = request.capital * (request.risk_percent / 100.0)
-
-    trade_status = "READY"
-    block_reason = None
-
-    if risk_per_share <= 0:
-        trade_status = "BLOCKED"
-        block_reason = "INVALID_RISK_DISTANCE"
-
-    quantity = floor(risk_amount / risk_per_share) if risk_per_share > 0 else 0
 
-    if quantity < 1:
-        trade_status = "BLOCKED"
-        block_reason = "INSUFFICIENT_CAPITAL"
-
-    if direction == "LONG":
-        target_price = entry_price + (risk_per_share * request.r_multiple)
-    else:
-        target_price = entry_price - (risk_per_share * request.r_multiple)
+    (
+        quantity,
+        target_price,
+        trade_status,
+        block_reason,
+    ) = _size_position(
+        direction,
+        entry_price,
+        risk_per_share,
+        request.capital,
+        request.risk_percent,
+        request.r_multiple,
+    )
 
     # -------------------------------------------------
     # UPSERT CONSTRUCTION
@@ -354,4 +416,155 @@ def freeze_step4_trade(
         frozen_at=trade.frozen_at,
     )
 
-    return Step4FrozenTradeResponse(trade=snapshot)
\ No newline at end of file
+    return Step4FrozenTradeResponse(trade=snapshot)
+
+
+# =====================================================
+# STEP-4 SIZING SWEEP (IN-MEMORY, NO PERSISTENCE)
+# =====================================================
+
+def sweep_step4_sizing(
+    db: Session,
+    request: Step4SweepRequest,
+) -> Step4SweepResponse:
+    """
+    Evaluates the full capital × risk% × R × entry-buffer grid
+    for every STEP-3 candidate on the requested dates.
+
+    One query loads all candidates; entry / stop / risk per
+    share are computed once per (candidate, buffer); quantity
+    and target are then broadcast over capital × risk% × R as
+    numpy arrays and returned column-wise (one array per
+    field). Nothing is written.
+    """
+
+    symbols = [s.strip().upper() for s in request.symbols or []]
+
+    logger.info(
+        "[STEP4][SWEEP][START] dates=%d symbols=%s",
+        len(request.trade_dates),
+        symbols or "ALL",
+    )
+
+    grid_size = (
+        len(request.capitals)
+        * len(request.risk_percents)
+        * len(request.r_multiples)
+        * len(request.entry_buffers)
+    )
+
+    query = db.query(Step3StockSelection).filter(
+        Step3StockSelection.trade_date.in_(request.trade_dates),
+        Step3StockSelection.strategy_used != "NO_TRADE",
+        # same tradable set as the STEP-4 preview
+        Step3StockSelection.structure_valid == 1,
+    )
+
+    if symbols:
+        query = query.filter(Step3StockSelection.symbol.in_(symbols))
+
+    candidates = query.order_by(
+        Step3StockSelection.trade_date,
+        Step3StockSelection.symbol,
+    ).all()
+
+    if len(candidates) * grid_size > MAX_SWEEP_POINTS:
+        raise ValueError(
+            f"Sweep too large: {len(candidates) * grid_size} points "
+            f"(limit {MAX_SWEEP_POINTS})"
+        )
+
+    # ---------- entry / stop / risk per (candidate, buffer) ----------
+    rows: list[tuple[Step3StockSelection, float, float, float]] = []
+    skipped: list[Step4SweepSkipped] = []
+
+    for candidate in candidates:
+        for entry_buffer in request.entry_buffers:
+
+            try:
+                entry_price, stop_loss = _structural_levels(candidate, entry_buffer)
+            except ValueError as e:
+                skipped.append(
+                    Step4SweepSkipped(
+                        trade_date=candidate.trade_date,
+                        symbol=candidate.symbol,
+                        reason=str(e),
+                    )
+                )
+                break
+
+            rows.append((candidate, entry_buffer, entry_price, stop_loss))
+
+    # ---------- sizing grid, broadcast (row × capital × risk% × R) ----------
+    capitals = np.array(request.capitals, dtype=float)
+    risk_percents = np.array(request.risk_percents, dtype=float)
+    r_multiples = np.array(request.r_multiples, dtype=float)
+
+    entry = np.array([r[2] for r in rows], dtype=float)
+    stop = np.array([r[3] for r in rows], dtype=float)
+    sign = np.array([1.0 if r[0].direction == "LONG" else -1.0 for r in rows])
+    risk_per_share = np.abs(entry - stop)
+
+    n_rows, n_cap, n_risk, n_r = len(rows), len(capitals), len(risk_percents), len(r_multiples)
+    shape = (n_rows, n_cap, n_risk, n_r)
+
+    risk_amount = capitals[:, None] * (risk_percents[None, :] / 100.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quantity = np.where(
+            risk_per_share[:, None, None] > 0,
+            np.floor(risk_amount[None, :, :] / risk_per_share[:, None, None]),
+            0,
+        )
+    quantity = np.broadcast_to(quantity[:, :, :, None], shape).astype(np.int64)
+
+    # LONG adds, SHORT subtracts R × risk per share
+    target = entry[:, None] + sign[:, None] * (risk_per_share[:, None] * r_multiples[None, :])
+    target = np.broadcast_to(target[:, None, None, :], shape)
+
+    # quantity is 0 whenever the risk distance is invalid, so one rule covers both blocks
+    blocked = quantity < 1
+
+    def _per_row(values) -> list:
+        index = np.repeat(np.arange(n_rows), n_cap * n_risk * n_r)
+        return [values[i] for i in index]
+
+    def _grid(axis_values: np.ndarray, axis: int) -> list:
+        expand = [None] * 4
+        expand[axis] = slice(None)
+        return np.broadcast_to(axis_values[tuple(expand)], shape).ravel().tolist()
+
+    points = Step4SweepPoints(
+        trade_date=_per_row([r[0].trade_date for r in rows]),
+        symbol=_per_row([r[0].symbol for r in rows]),
+        direction=_per_row([r[0].direction for r in rows]),
+        strategy_used=_per_row([r[0].strategy_used for r in rows]),
+        capital=_grid(capitals, 1),
+        risk_percent=_grid(risk_percents, 2),
+        entry_buffer=_grid(np.array([r[1] for r in rows], dtype=float), 0),
+        r_multiple=_grid(r_multiples, 3),
+        entry_price=_grid(entry, 0),
+        stop_loss=_grid(stop, 0),
+        risk_per_share=_grid(risk_per_share, 0),
+        quantity=quantity.ravel().tolist(),
+        target_price=target.ravel().tolist(),
+        trade_status=np.where(blocked, "BLOCKED", "READY").ravel().tolist(),
+        block_reason=[
+            "INSUFFICIENT_CAPITAL" if b else None
+            for b in blocked.ravel().tolist()
+        ],
+    )
+    count = n_rows * n_cap * n_risk * n_r
+
+    logger.info(
+        "[STEP4][SWEEP][SUCCESS] candidates=%d points=%d skipped=%d",
+        len(candidates),
+        count,
+        len(skipped),
+    )
+
+    return Step4SweepResponse(
+        grid_size=grid_size,
+        count=count,
+        points=points,
+        skipped=skipped,
+    )
@@ -0,0 +1,183 @@
+# backend/app/services/trading_calendar_service.py
+
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+# Minimum seconds between checks for newly imported sessions
+REFRESH_INTERVAL_SECONDS = 60
+
+
+class TradingCalendar:
+    """
+    In-process trading calendar
+    ---------------------------
+    Sorted list of sessions present in intraday_bhavcopy,
+    loaded once and extended incrementally as new dates land.
+
+    Lookups are a bisect over the list, so Step services
+    no longer scan DISTINCT trade_date per request.
+
+    Call invalidate() after a bhavcopy re-import that may
+    have added or removed older dates.
+    """
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+
+        self._sessions: List[date] = []
+        self._loaded = False
+        self._last_refresh = 0.0
+        self._refresh_interval = refresh_interval_seconds
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------
+    # LOADING
+    # -------------------------------------------------
+
+    def invalidate(self) -> None:
+
+        with self._lock:
+            self._sessions = []
+            self._loaded = False
+            self._last_refresh = 0.0
+
+        logger.info("[CALENDAR][STATE][INVALIDATED]")
+
+    def refresh(
+        self,
+        db: Session,
+        force: bool = False,
+    ) -> None:
+        """
+        Full load on first use, then appends any
+        sessions newer than the last known one.
+        """
+
+        now = time.monotonic()
+
+        if (
+            self._loaded
+            and not force
+            and now - self._last_refresh < self._refresh_interval
+        ):
+            return
+
+        with self._lock:
+
+            if not self._loaded:
+
+                rows = db.execute(
+                    text("""
+                        SELECT DISTINCT trade_date
+                        FROM intraday_bhavcopy
+                        ORDER BY trade_date ASC
+                    """)
+                ).fetchall()
+
+                self._sessions = [r[0] for r in rows]
+                self._loaded = True
+
+                logger.info(
+                    "[CALENDAR][STATE][LOADED] sessions=%s",
+                    len(self._sessions),
+                )
+
+            else:
+
+                last_known = self._sessions[-1] if self._sessions else date.min
+
+                rows = db.execute(
+                    text("""
+                        SELECT DISTINCT trade_date
+                        FROM intraday_bhavcopy
+                        WHERE trade_date > :last_known
+                        ORDER BY trade_date ASC
+                    """),
+                    {"last_known": last_known},
+                ).fetchall()
+
+                if rows:
+                    self._sessions = self._sessions + [r[0] for r in rows]
+
+                    logger.info(
+                        "[CALENDAR][STATE][EXTENDED] added=%s sessions=%s",
+                        len(rows),
+                        len(self._sessions),
+                    )
+
+            self._last_refresh = now
+
+    # -------------------------------------------------
+    # LOOKUPS
+    # -------------------------------------------------
+
+    def last_n_sessions(
+        self,
+        db: Session,
+        trade_date: date,
+        n: int,
+    ) -> List[date]:
+        """
+        Up to n sessions strictly before trade_date,
+        newest first.
+        """
+
+        self.refresh(db)
+
+        sessions = self._sessions
+        end = bisect_left(sessions, trade_date)
+        start = max(end - n, 0)
+
+        return sessions[start:end][::-1]
+
+    def sessions_between(
+        self,
+        db: Session,
+        start_date: date,
+        end_date: date,
+    ) -> List[date]:
+        """
+        Sessions in [start_date, end_date], oldest first.
+        """
+
+        self.refresh(db)
+
+        sessions = self._sessions
+
+        return sessions[
+            bisect_left(sessions, start_date):bisect_right(sessions, end_date)
+        ]
+
+    def previous(
+        self,
+        db: Session,
+        trade_date: date,
+        n: int = 1,
+    ) -> Optional[date]:
+        """
+        n-th session before trade_date
+        (n=1 → previous trading day).
+        """
+
+        self.refresh(db)
+
+        sessions = self._sessions
+        index = bisect_left(sessions, trade_date) - n
+
+        return sessions[index] if index >= 0 else None
+
+
+# Shared by all Step services
+trading_calendar = TradingCalendar()
@@ -3,6 +3,9 @@ echo ======================================
 echo Starting MARKET VISUALIZATION (ADMIN)
 echo ======================================
 
+REM Shared DB pool limits (inherited by every backend window)
+for /f "usebackq eol=# tokens=1,* delims==" %%A in ("%~dp0db_pool.env") do set "%%A=%%B"
+
 REM -------------------------------
 REM 1. JOURNAL BACKEND (8001)
 REM -------------------------------